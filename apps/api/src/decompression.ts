@@ -0,0 +1,64 @@
+import * as zlib from 'zlib';
+import { promisify } from 'util';
+import type { MiddlewareHandler } from 'hono';
+import { HTTPException } from 'hono/http-exception';
+
+type Decompress = (input: Buffer, options: { maxOutputLength: number }) => Promise<Buffer>;
+
+const decompressors: Record<string, Decompress> = {
+  'gzip': promisify(zlib.gunzip),
+  'x-gzip': promisify(zlib.gunzip),
+  'deflate': promisify(zlib.inflate),
+};
+
+// zstd is built into zlib from Node 22.15 / 23.8
+const { zstdDecompress } = zlib as { zstdDecompress?: typeof zlib.gunzip };
+if (zstdDecompress) {
+  decompressors['zstd'] = promisify(zstdDecompress);
+}
+
+/**
+ * Decompresses request bodies sent with a `Content-Encoding` header (gzip, deflate and, where
+ * Node supports it, zstd), so handlers and validators read plain JSON.
+ *
+ * Clients (e.g. the Python SDK with `RequestCompression`) compress large bodies such as runs
+ * carrying long transcripts. Unsupported encodings get a 415, and bodies that inflate beyond
+ * `maxBytes` a 413, so a small compressed upload can't exhaust memory.
+ */
+export function decompression(options: { maxBytes?: number } = {}): MiddlewareHandler {
+  const maxBytes = options.maxBytes ?? 100 * 1024 * 1024; // 100 MB
+
+  return async (c, next) => {
+    const encoding = c.req.header('content-encoding')?.trim().toLowerCase();
+    if (!encoding || encoding === 'identity') {
+      return next();
+    }
+
+    const decompress = decompressors[encoding];
+    if (!decompress) {
+      throw new HTTPException(415, { message: `Unsupported Content-Encoding: ${encoding}` });
+    }
+
+    let body: Buffer;
+    try {
+      body = await decompress(Buffer.from(await c.req.raw.arrayBuffer()), { maxOutputLength: maxBytes });
+    } catch (error) {
+      if (error instanceof RangeError) {
+        throw new HTTPException(413, { message: 'Request body too large' });
+      }
+      throw new HTTPException(400, { message: `Invalid ${encoding} request body` });
+    }
+
+    const headers = new Headers(c.req.raw.headers);
+    headers.delete('content-encoding');
+    headers.set('content-length', String(body.byteLength));
+    c.req.raw = new Request(c.req.raw.url, {
+      method: c.req.raw.method,
+      headers,
+      body,
+      signal: c.req.raw.signal,
+    });
+
+    return next();
+  };
+}
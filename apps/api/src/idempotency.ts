@@ -0,0 +1,87 @@
+import { createHash } from 'crypto';
+import type { MiddlewareHandler } from 'hono';
+
+type StoredResponse = {
+  status: number;
+  headers: [string, string][];
+  body: ArrayBuffer;
+};
+
+type Entry = {
+  expiresAt: number;
+  response: Promise<StoredResponse>;
+};
+
+/**
+ * Replays responses of POST requests sent with an `Idempotency-Key` header.
+ *
+ * Clients (e.g. the Python SDK) send the same key when they retry a request whose
+ * outcome they don't know, so a retried "create" can't create duplicates. Keys are
+ * scoped to the caller's credentials and the request path. Concurrent duplicates
+ * wait for the first request to finish. 5xx responses are not stored, so they can be retried.
+ *
+ * Responses are kept in memory, per process.
+ */
+export function idempotency(options: { ttlMs?: number, maxEntries?: number } = {}): MiddlewareHandler {
+  const ttlMs = options.ttlMs ?? 1000 * 60 * 60; // 1 hour
+  const maxEntries = options.maxEntries ?? 10_000;
+  const entries = new Map<string, Entry>();
+
+  return async (c, next) => {
+    const idempotencyKey = c.req.header('idempotency-key');
+    if (!idempotencyKey || c.req.method !== 'POST') {
+      return next();
+    }
+
+    const key = createHash('sha256')
+      .update([
+        c.req.header('authorization') ?? '',
+        c.req.header('x-user-token') ?? '',
+        c.req.header('cookie') ?? '',
+        c.req.path,
+        idempotencyKey
+      ].join('\n'))
+      .digest('hex');
+
+    const now = Date.now();
+    const existing = entries.get(key);
+    if (existing && existing.expiresAt > now) {
+      const stored = await existing.response;
+      const headers = new Headers(stored.headers);
+      headers.set('Idempotent-Replayed', 'true');
+      return new Response(stored.body, { status: stored.status, headers });
+    }
+
+    let resolve!: (response: StoredResponse) => void;
+    let reject!: (error: unknown) => void;
+    const response = new Promise<StoredResponse>((res, rej) => { resolve = res; reject = rej; });
+    response.catch(() => {}); // waiting duplicates handle rejections themselves
+
+    entries.delete(key);
+    entries.set(key, { expiresAt: now + ttlMs, response });
+
+    // Map keeps insertion order, so the first entries are the oldest
+    for (const [oldKey, entry] of entries) {
+      if (entries.size <= maxEntries && entry.expiresAt > now) break;
+      entries.delete(oldKey);
+    }
+
+    try {
+      await next();
+    } catch (error) {
+      entries.delete(key);
+      reject(error);
+      throw error;
+    }
+
+    const res = c.res;
+    if (res.status >= 500) {
+      entries.delete(key);
+    }
+    resolve({
+      status: res.status,
+      headers: [...res.headers.entries()],
+      body: await res.clone().arrayBuffer(),
+    });
+  };
+}
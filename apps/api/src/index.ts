@@ -3,7 +3,10 @@ import { HTTPException } from 'hono/http-exception';
 
 import type { User as BetterAuthUser } from "better-auth";
 import { APIError as BetterAuthAPIError } from "better-auth/api";
+import { compress } from 'hono/compress';
 import { cors } from 'hono/cors';
+import { etag } from 'hono/etag';
+import type { MiddlewareHandler } from 'hono';
 import { streamSSE } from 'hono/streaming';
 
 import { swaggerUI } from '@hono/swagger-ui';
@@ -47,6 +50,8 @@ import { getAllSessionItems, getLastRun } from 'agentview/sessionUtils';
 import packageJson from '../package.json';
 import { equalJSON } from './equalJSON';
 import { getAllowedOrigin } from './getAllowedOrigin';
+import { decompression } from './decompression';
+import { idempotency } from './idempotency';
 import { getEnvironment, requireEnvironment, type Env } from './environments';
 import { isInboxItemUnread } from './inboxItems';
 import { initDb } from './initDb';
@@ -112,6 +117,31 @@ app.use('*', cors({
   credentials: true,
 }))
 
+/** --------- COMPRESSION --------- */
+
+// Runs and sessions carry long transcripts: accept compressed request bodies and compress large JSON
+// responses for clients sending Accept-Encoding. Registered before idempotency and ETags, so both see
+// uncompressed bodies. Event streams are never compressed.
+app.use('/api/*', decompression());
+app.use('/api/*', compress({ threshold: 1024 }));
+
+/** --------- IDEMPOTENCY --------- */
+
+const idempotentCreate = idempotency();
+app.use('/api/users', idempotentCreate);
+app.use('/api/sessions', idempotentCreate);
+app.use('/api/runs', idempotentCreate);
+
+/** --------- CONDITIONAL GET --------- */
+
+// ETags let SDK caches revalidate users, sessions and the environment with a 304 instead of a full body
+const conditionalGet = etag();
+const etagOnGet: MiddlewareHandler = (c, next) => c.req.method === 'GET' ? conditionalGet(c, next) : next();
+app.use('/api/users/:id', etagOnGet);
+app.use('/api/users/by-external-id/:external_id', etagOnGet);
+app.use('/api/sessions/:session_id', etagOnGet);
+app.use('/api/environment', etagOnGet);
+
 /* --------- AUTH --------- */
 
 app.on(["POST", "GET"], "/api/auth/*", (c) => {
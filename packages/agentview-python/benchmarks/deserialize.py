@@ -0,0 +1,44 @@
+"""
+Compares full validation with trusted construction of large sessions.
+
+    python benchmarks/deserialize.py [--runs 10] [--items 100]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agentview._construct import construct_model  # noqa: E402
+from agentview.models import Session  # noqa: E402
+from tests.payloads import make_run, make_session  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--items", type=int, default=100, help="items per run")
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    runs = [make_run(f"r{n}", session_id="s1", items=args.items) for n in range(args.runs)]
+    data = make_session("s1", runs=runs)
+    assert construct_model(Session, data) == Session.model_validate(data)
+
+    results: dict[str, float] = {}
+    for name, parse in (
+        ("model_validate", lambda: Session.model_validate(data)),
+        ("construct_model", lambda: construct_model(Session, data)),
+    ):
+        best = min(timeit.repeat(parse, number=args.number, repeat=5))
+        results[name] = best / args.number
+        print(f"{name:>16}: {results[name] * 1e3:8.3f} ms per session ({args.runs * args.items} items)")
+    print(f"{'speedup':>16}: {results['model_validate'] / results['construct_model']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+"""
+SDK benchmark suite, run against an in-process httpx.MockTransport.
+
+Measures per-call latency, sync vs async throughput, simulated agent runs
+against `LocalAPI`, validation and serialization cost across session sizes,
+import time and memory per cached session. Results are written as JSON so
+releases can be compared:
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --output after.json --compare before.json
+
+Use `--quick` for a fast smoke run and `--only` to select groups.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import importlib.util
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+
+from agentview import AgentView, CompactStore, Instrumentation, PublicAgentView, ResponseCache  # noqa: E402
+from agentview._construct import construct_model  # noqa: E402
+from agentview._json import encode_body, get_codec  # noqa: E402
+from agentview._lazy import lazy_decoder  # noqa: E402
+from agentview._utils import with_model  # noqa: E402
+from agentview.models import RunCreate, RunUpdate, Session, SessionBase  # noqa: E402
+from agentview.testing import LocalAPI  # noqa: E402
+from tests.payloads import make_item, make_run, make_session, make_user  # noqa: E402
+
+SCHEMA_VERSION = 1
+SESSION_SIZES = (10, 100, 1000, 5000)
+QUICK_SESSION_SIZES = (10, 100)
+ITEMS_PER_RUN = 50
+GROUPS = ("latency", "throughput", "agent", "deserialize", "serialize", "import", "memory")
+# Simulated network round trip for the agent workload
+AGENT_LATENCY = 0.005
+
+_EPOCH = datetime(2025, 12, 11, 8, 0, tzinfo=timezone.utc)
+# lazy_content decodes with msgspec
+HAS_MSGSPEC = importlib.util.find_spec("msgspec") is not None
+
+
+def _timestamp(n: int) -> str:
+    # Distinct values, rendered like Postgres timestamptz
+    return (_EPOCH + timedelta(milliseconds=137 * n)).isoformat(sep=" ").replace("+00:00", "+00")
+
+
+def realistic_session(items: int, id: str = "s1") -> dict[str, Any]:
+    """A session with `items` items spread over runs, with distinct timestamps and varied content."""
+    runs = []
+    for r in range(max(1, -(-items // ITEMS_PER_RUN))):
+        count = min(ITEMS_PER_RUN, items - r * ITEMS_PER_RUN) if items else 0
+        run = make_run(f"r{r}", session_id=id, status="completed", items=0)
+        run["createdAt"] = _timestamp(r * 1000)
+        run["finishedAt"] = _timestamp(r * 1000 + 999)
+        run["metadata"] = {"model": "gpt-4o", "temperature": 0.2, "tokens": 1200 + r}
+        run["sessionItems"] = [
+            {
+                **make_item(f"r{r}-i{n}", f"r{r}", id),
+                "createdAt": _timestamp(r * 1000 + n),
+                "updatedAt": _timestamp(r * 1000 + n),
+                "content": {
+                    "role": "assistant" if n % 2 else "user",
+                    "content": "lorem ipsum dolor sit amet " * (1 + n % 8),
+                    "toolCalls": [{"name": "search", "arguments": {"q": f"query {n}"}}] if n % 5 == 0 else [],
+                },
+            }
+            for n in range(count)
+        ]
+        runs.append(run)
+    return make_session(id, runs=runs)
+
+
+class Results:
+    def __init__(self) -> None:
+        self.entries: list[dict[str, Any]] = []
+
+    def add(self, name: str, value: float, unit: str, **params: Any) -> None:
+        self.entries.append({"name": name, "value": value, "unit": unit, "params": params})
+        label = name + "".join(f" {k}={v}" for k, v in params.items())
+        print(f"  {label:<58} {value:>14.3f} {unit}")
+
+
+def _best(fn: Callable[[], Any], number: int, repeat: int) -> float:
+    """Best mean seconds per call over `repeat` rounds of `number` calls."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def _transport(payloads: dict[str, Any]) -> Callable[[httpx.Request], httpx.Response]:
+    encoded = {path: json.dumps(data).encode() for path, data in payloads.items()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method != "GET":
+            path = f"{request.method} {path}"
+        return httpx.Response(200, content=encoded[path], headers={"Content-Type": "application/json"})
+
+    return handler
+
+
+def _payloads() -> dict[str, Any]:
+    run = realistic_session(10)["runs"][0]
+    return {
+        "/api/users/u1": make_user(),
+        "/api/sessions/s1": realistic_session(100),
+        "/api/public/sessions/s1": realistic_session(100),
+        "POST /api/runs": run,
+        "PATCH /api/runs/r0": run,
+    }
+
+
+def bench_latency(results: Results, quick: bool) -> None:
+    number = 50 if quick else 500
+    handler = _transport(_payloads())
+    client = AgentView(api_base_url="http://bench", api_key="key", transport=httpx.MockTransport(handler), retry=None)
+    public = PublicAgentView(api_base_url="http://bench", user_token="token", transport=httpx.MockTransport(handler))
+    instrumented = AgentView(
+        api_base_url="http://bench",
+        api_key="key",
+        transport=httpx.MockTransport(handler),
+        retry=None,
+        instrumentation=Instrumentation(),
+    )
+    items = [{"role": "user", "content": "hello"}] * 10
+
+    calls: dict[str, Callable[[], Any]] = {
+        "get_user": lambda: client.get_user(id="u1"),
+        "get_user.instrumented": lambda: instrumented.get_user(id="u1"),
+        "get_session": lambda: client.get_session("s1"),
+        "public.get_session": lambda: public.get_session("s1"),
+        "create_run": lambda: client.create_run(session_id="s1", items=items, version="1"),
+        "update_run": lambda: client.update_run("r0", status="completed"),
+    }
+    for name, call in calls.items():
+        call()
+        samples = [_best(call, 1, 1) for _ in range(number)]
+        results.add(f"latency.{name}.p50", statistics.median(samples) * 1e6, "us")
+        results.add(f"latency.{name}.p95", statistics.quantiles(samples, n=20)[-1] * 1e6, "us")
+
+
+def bench_throughput(results: Results, quick: bool) -> None:
+    total = 100 if quick else 2000
+    payloads = {"/api/users/u1": make_user()}
+    handler = _transport(payloads)
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    client = AgentView(api_base_url="http://bench", api_key="key", transport=httpx.MockTransport(handler))
+    started = time.perf_counter()
+    for _ in range(total):
+        client.get_user(id="u1")
+    results.add("throughput.sync", total / (time.perf_counter() - started), "req/s")
+
+    for concurrency in (1, 10, 50):
+
+        async def run(concurrency: int = concurrency) -> float:
+            aclient = AgentView(
+                api_base_url="http://bench", api_key="key", transport=httpx.MockTransport(async_handler)
+            )
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one() -> None:
+                async with semaphore:
+                    await aclient.aget_user(id="u1")
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one() for _ in range(total)))
+            elapsed = time.perf_counter() - started
+            await aclient.aclose()
+            return elapsed
+
+        results.add("throughput.async", total / asyncio.run(run()), "req/s", concurrency=concurrency)
+
+
+def bench_agent(results: Results, quick: bool) -> None:
+    """Runs per second of a simulated agent (a session, a run and 5 streamed steps) against LocalAPI."""
+    total = 20 if quick else 200
+    steps = 5
+
+    async def agent(client: AgentView) -> None:
+        session = await client.acreate_session(agent="bench")
+        run = await client.acreate_run(session_id=session.id, items=[{"role": "user", "content": "hi"}], version="1")
+        for step in range(steps):
+            await client.aupdate_run(run.id, items=[{"role": "tool", "content": f"step {step}"}])
+        await client.aupdate_run(run.id, items=[{"role": "assistant", "content": "done"}], status="completed")
+
+    for concurrency in (1, 10, 50):
+
+        async def run(concurrency: int = concurrency) -> float:
+            client = LocalAPI(latency=AGENT_LATENCY, seed=0).client(retry=None)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def one() -> None:
+                async with semaphore:
+                    await agent(client)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(one() for _ in range(total)))
+            elapsed = time.perf_counter() - started
+            await client.aclose()
+            return elapsed
+
+        results.add("agent.runs", total / asyncio.run(run()), "runs/s", concurrency=concurrency)
+
+
+def bench_deserialize(results: Results, quick: bool) -> None:
+    for size in QUICK_SESSION_SIZES if quick else SESSION_SIZES:
+        data = realistic_session(size)
+        raw = json.dumps(data).encode()
+        number = max(1, 2000 // (size + 10)) if quick else max(3, 20000 // (size + 10))
+        repeat = 3 if quick else 5
+        codec = get_codec()
+        benchmarks: list[tuple[str, Callable[[], Any]]] = [
+            ("json_loads", lambda: codec.loads(raw)),
+            ("model_validate", lambda: Session.model_validate(data)),
+            ("construct_model", lambda: construct_model(Session, data)),
+            ("loads_and_construct", lambda: construct_model(Session, codec.loads(raw))),
+        ]
+        if HAS_MSGSPEC:
+            decode = lazy_decoder(Session)
+            benchmarks.append(("lazy_loads_and_construct", lambda: construct_model(Session, decode(raw))))
+        for name, fn in benchmarks:
+            results.add(f"deserialize.{name}", _best(fn, number, repeat) * 1e3, "ms", items=size)
+
+
+def bench_serialize(results: Results, quick: bool) -> None:
+    codec = get_codec()
+    for size in QUICK_SESSION_SIZES if quick else SESSION_SIZES:
+        session = Session.model_validate(realistic_session(size))
+        items = [item.content for run in session.runs for item in run.session_items]
+        run = RunCreate(session_id="s1", items=items, version="1")
+        number = max(1, 2000 // (size + 10)) if quick else max(3, 20000 // (size + 10))
+        repeat = 3 if quick else 5
+        for name, fn in (
+            ("session.model_dump_json", lambda: session.model_dump_json(by_alias=True)),
+            ("run_create.encode_body", lambda: encode_body(codec, run)),
+            (
+                "run_create.dump_then_encode",
+                lambda: codec.dumps(run.model_dump(by_alias=True, exclude_none=True)),
+            ),
+        ):
+            results.add(f"serialize.{name}", _best(fn, number, repeat) * 1e3, "ms", items=size)
+
+    # with_model validates kwargs straight into the wire body; compared with
+    # building the options model, dumping it to a dict and encoding that
+    send = with_model(RunUpdate)(lambda id, options=None: encode_body(codec, options))
+    kwargs: dict[str, Any] = {
+        "status": "completed",
+        "items": [{"role": "user", "content": "hi"}],
+        "metadata": {"k": "v"},
+    }
+    number = 200 if quick else 5000
+    repeat = 3 if quick else 5
+    for name, fn in (
+        ("with_model.kwargs_to_body", lambda: send("r1", **kwargs)),
+        (
+            "with_model.build_dump_encode",
+            lambda: codec.dumps(RunUpdate(**kwargs).model_dump(by_alias=True, exclude_none=True)),
+        ),
+    ):
+        results.add(f"serialize.{name}", _best(fn, number, repeat) * 1e6, "us")
+
+
+def _import_time(code: str) -> float:
+    """Cumulative import time of agentview in microseconds, from `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    )
+    total = 0
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Interpreter startup is logged before agentview; lazy loads after it.
+        # Only top-level entries count, nested ones are included in their parent.
+        started = started or name.strip() == "agentview"
+        if started and not name.startswith("  "):
+            total += int(cumulative)
+    return total
+
+
+def bench_import(results: Results, quick: bool) -> None:
+    rounds = 3 if quick else 7
+    for name, code in (
+        ("import", "import agentview"),
+        ("import_and_client", "import agentview; agentview.AgentView; agentview.Session"),
+    ):
+        samples = [_import_time(code) for _ in range(rounds)]
+        results.add(f"import.{name}", statistics.median(samples) / 1e3, "ms")
+
+
+def _allocated(build: Callable[[], Any]) -> tuple[Any, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = build()
+        gc.collect()
+        return value, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def bench_memory(results: Results, quick: bool) -> None:
+    count = 10 if quick else 50
+    for size in QUICK_SESSION_SIZES if quick else SESSION_SIZES[:3]:
+        raw = json.dumps(realistic_session(size))
+        _, used = _allocated(lambda: [Session.model_validate(json.loads(raw)) for _ in range(count)])
+        results.add("memory.session_model", used / count / 1024, "KiB", items=size)
+        results.add("memory.session_model_per_item", used / count / size, "B", items=size)
+
+        # Each model is converted and dropped as it is loaded, so only the compact forms remain
+        _, used = _allocated(
+            lambda: CompactStore().sessions(Session.model_validate(json.loads(raw)) for _ in range(count))
+        )
+        results.add("memory.compact_session", used / count / 1024, "KiB", items=size)
+        results.add("memory.compact_session_per_item", used / count / size, "B", items=size)
+
+        if HAS_MSGSPEC:
+            decode = lazy_decoder(Session)
+            # Each model keeps its own response buffer alive, as with real responses
+            _, used = _allocated(lambda: [construct_model(Session, decode(raw.encode())) for _ in range(count)])
+            results.add("memory.lazy_session_model", used / count / 1024, "KiB", items=size)
+
+        def fill_cache() -> ResponseCache:
+            cache = ResponseCache()
+            for n in range(count):
+                cache.store(("key", None, f"/api/sessions/s{n}"), json.loads(raw), 60)
+            return cache
+
+        _, used = _allocated(fill_cache)
+        results.add("memory.cached_session", used / count / 1024, "KiB", items=size)
+
+    # Listings: tens of thousands of SessionBase objects for the same few users
+    count = 1000 if quick else 20000
+    raw = json.dumps([{**realistic_session(0, f"s{n}"), "runs": []} for n in range(count)])
+    _, used = _allocated(lambda: [SessionBase.model_validate(data) for data in json.loads(raw)])
+    results.add("memory.session_base_model", used / count, "B")
+    _, used = _allocated(lambda: CompactStore().sessions(SessionBase.model_validate(data) for data in json.loads(raw)))
+    results.add("memory.compact_session_base", used / count, "B")
+
+
+BENCHMARKS: dict[str, Callable[[Results, bool], None]] = {
+    "latency": bench_latency,
+    "throughput": bench_throughput,
+    "agent": bench_agent,
+    "deserialize": bench_deserialize,
+    "serialize": bench_serialize,
+    "import": bench_import,
+    "memory": bench_memory,
+}
+
+
+def _version() -> str:
+    try:
+        return metadata.version("agentview")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _key(entry: dict[str, Any]) -> tuple[str, str]:
+    return entry["name"], json.dumps(entry["params"], sort_keys=True)
+
+
+def compare(current: list[dict[str, Any]], baseline_path: Path) -> None:
+    baseline = {_key(entry): entry for entry in json.loads(baseline_path.read_text())["results"]}
+    print(f"\nCompared with {baseline_path} (ratio = current / baseline):")
+    for entry in current:
+        before = baseline.get(_key(entry))
+        if before is None or not before["value"]:
+            continue
+        label = entry["name"] + "".join(f" {k}={v}" for k, v in entry["params"].items())
+        print(f"  {label:<58} {entry['value'] / before['value']:>8.2f}x")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, help="write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="baseline results JSON to compare against")
+    parser.add_argument("--only", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("--quick", action="store_true", help="fewer iterations and smaller sessions")
+    args = parser.parse_args(argv)
+
+    results = Results()
+    for group in args.only:
+        print(f"{group}:")
+        BENCHMARKS[group](results, args.quick)
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "agentview": _version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "json_codec": get_codec().name,
+        "quick": args.quick,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "results": results.entries,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.compare is not None:
+        compare(results.entries, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,11 +27,14 @@ const schemasToExport: Record<string, z.ZodTypeAny> = {
   Score: schemas.ScoreSchema,
   ScoreCreate: schemas.ScoreCreateSchema,
   CommentMessage: schemas.CommentMessageSchema,
+  CommentMessageCreate: schemas.CommentMessageCreateSchema,
 
   Version: schemas.VersionSchema,
 
   Config: schemas.ConfigSchema,
   ConfigCreate: schemas.ConfigCreateSchema,
+  Environment: schemas.EnvironmentSchema,
+  EnvironmentCreate: schemas.EnvironmentCreateSchema,
 
   Member: schemas.MemberSchema,
   MemberUpdate: schemas.MemberUpdateSchema,
@@ -50,6 +53,94 @@ const schemasToExport: Record<string, z.ZodTypeAny> = {
   RunBody: schemas.RunBodySchema,
 }
 
+// models.py header; the generated file keeps it across regenerations
+const HEADER = `# Generated from Zod schemas in packages/agentview/src/apiTypes.ts
+# To regenerate: pnpm run generate-models (then manual cleanup may be needed)
+# Field types that are not generated (DateTime, LazyAny, LazyMetadata) live in _models_ext.py
+`
+
+// Field types from _models_ext.py, which JSON Schema can't express. Timestamps
+// become DateTime, and the large JSON values that clients with
+// lazy_content=True keep raw until accessed become LazyAny or LazyMetadata.
+const MODELS_EXT_IMPORT = 'from ._models_ext import DateTime, LazyAny, LazyMetadata'
+const EXT_TYPES = /\b(DateTime|LazyAny|LazyMetadata)\b/
+const TIMESTAMP_TYPES = /^(?:date|datetime|AwareDatetime)( \| None)?$/
+const LAZY_FIELDS: Record<string, Record<string, string>> = {
+  SessionItem: { content: 'LazyAny' },
+  Run: { metadata: 'LazyMetadata' },
+  RunWithCollaboration: { metadata: 'LazyMetadata' },
+  SessionBase: { metadata: 'LazyMetadata', state: 'LazyAny' },
+}
+
+const CLASS_LINE = /^class (\w+)\(/
+const FIELD_LINE = /^    (\w+): (.+?)( = .*)?$/
+
+// Rewrites datamodel-codegen output to use the _models_ext field types
+function applyFieldTypes(source: string): string {
+  const lines: string[] = []
+  let model = ''
+  for (const line of source.replace(/^(#.*\n)+/, '').split('\n')) {
+    model = CLASS_LINE.exec(line)?.[1] ?? model
+    if (line.startsWith('from datetime import ')) {
+      continue
+    }
+    const field = FIELD_LINE.exec(line)
+    if (field) {
+      const [, name, type, rest = ''] = field
+      const lazy = LAZY_FIELDS[model]?.[name]
+      const timestamp = TIMESTAMP_TYPES.exec(type)
+      if (lazy) {
+        lines.push(`    ${name}: ${lazy}${rest}`)
+        continue
+      }
+      if (timestamp) {
+        lines.push(`    ${name}: DateTime${timestamp[1] ?? ''}${rest}`)
+        continue
+      }
+    }
+    lines.push(line)
+    if (line.startsWith('from pydantic import ')) {
+      lines.push('', MODELS_EXT_IMPORT)
+    }
+  }
+  return HEADER + lines.join('\n')
+}
+
+// `Model.field` -> annotation for every field in a models.py source
+function fieldTypes(source: string): Map<string, string> {
+  const types = new Map<string, string>()
+  let model = ''
+  for (const line of source.split('\n')) {
+    model = CLASS_LINE.exec(line)?.[1] ?? model
+    const field = FIELD_LINE.exec(line)
+    if (field && model) {
+      types.set(`${model}.${field[1]}`, field[2])
+    }
+  }
+  return types
+}
+
+// Differences in _models_ext field types between models.py and a regenerated copy.
+// Models and fields the schemas don't produce are hand-written and skipped.
+function fieldTypeChanges(current: string, regenerated: string): string[] {
+  const changes: string[] = []
+  if (!regenerated.includes(MODELS_EXT_IMPORT)) {
+    changes.push(`missing import: ${MODELS_EXT_IMPORT}`)
+  }
+  const currentTypes = fieldTypes(current)
+  const regeneratedTypes = fieldTypes(regenerated)
+  for (const [key, type] of regeneratedTypes) {
+    const before = currentTypes.get(key)
+    if (before !== undefined && before !== type && (EXT_TYPES.test(before) || EXT_TYPES.test(type))) {
+      changes.push(`${key}: ${before} -> ${type}`)
+    }
+  }
+  return changes
+}
+
+// With --check, regenerate into generated/ and fail if models.py's field types would change
+const check = process.argv.includes('--check')
+
 // Generate combined JSON Schema
 const jsonSchema: {
   $schema: string
@@ -61,7 +152,16 @@ const jsonSchema: {
 
 for (const [name, schema] of Object.entries(schemasToExport)) {
   try {
-    jsonSchema.$defs[name] = z.toJSONSchema(schema, { unrepresentable: 'any' })
+    jsonSchema.$defs[name] = z.toJSONSchema(schema, {
+      unrepresentable: 'any',
+      // z.iso.date() adds an ISO pattern, which stops nullable dates collapsing to `date | None`;
+      // the DateTime they become parses the API's timestamps itself
+      override: (ctx) => {
+        if (ctx.jsonSchema.format === 'date') {
+          delete ctx.jsonSchema.pattern
+        }
+      },
+    })
   } catch (e) {
     console.warn(`Warning: Could not convert ${name} to JSON Schema:`, e)
   }
@@ -75,7 +175,8 @@ fs.writeFileSync(schemaPath, JSON.stringify(jsonSchema, null, 2))
 console.log(`JSON Schema written to ${schemaPath}`)
 
 // Generate Pydantic models using datamodel-code-generator
-const outputPath = new URL('../src/agentview/models.py', import.meta.url).pathname
+const modelsPath = new URL('../src/agentview/models.py', import.meta.url).pathname
+const outputPath = check ? `${schemaDir}/models.py` : modelsPath
 
 try {
   execSync(
@@ -91,12 +192,30 @@ try {
       --use-field-description \
       --target-python-version 3.10 \
       --use-double-quotes \
-      --collapse-root-models`,
+      --collapse-root-models \
+      --snake-case-field \
+      --allow-population-by-field-name \
+      --use-subclass-enum \
+      --disable-timestamp`,
     { stdio: 'inherit' }
   )
-  console.log(`Pydantic models generated at ${outputPath}`)
 } catch (e) {
   console.error('Failed to generate Pydantic models. Make sure datamodel-code-generator is installed:')
   console.error('  pip install datamodel-code-generator')
   process.exit(1)
 }
+
+fs.writeFileSync(outputPath, applyFieldTypes(fs.readFileSync(outputPath, 'utf8')))
+console.log(`Pydantic models generated at ${outputPath}`)
+
+if (check) {
+  const changes = fieldTypeChanges(fs.readFileSync(modelsPath, 'utf8'), fs.readFileSync(outputPath, 'utf8'))
+  if (changes.length > 0) {
+    console.error('Regenerating would change these models.py field types:')
+    for (const change of changes) {
+      console.error(`  ${change}`)
+    }
+    process.exit(1)
+  }
+  console.log('models.py field types match the schemas')
+}
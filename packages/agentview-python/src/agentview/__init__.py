@@ -1,40 +1,70 @@
 """AgentView Python SDK."""
 
-from .client import AgentView, PublicAgentView
-from .errors import AgentViewError
-from .models import (
-    CommentMessage,
-    Config,
-    ConfigCreate,
-    Space,
-    Invitation,
-    InvitationCreate,
-    Member,
-    MemberUpdate,
-    Pagination,
-    PublicSessionsGetQueryParams,
-    Role,
-    Run,
-    RunBody,
-    RunCreate,
-    RunUpdate,
-    RunWithCollaboration,
-    Score,
-    ScoreCreate,
-    Session,
-    SessionBase,
-    SessionCreate,
-    SessionItem,
-    SessionItemWithCollaboration,
-    SessionsGetQueryParams,
-    SessionsPaginatedResponse,
-    SessionUpdate,
-    SessionWithCollaboration,
-    Status,
-    User,
-    UserCreate,
-    Version,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._cache import CacheStats, ResponseCache
+    from ._coalesce import CoalesceStats
+    from ._compact import (
+        CompactRun,
+        CompactSession,
+        CompactSessionItem,
+        CompactStore,
+        CompactUser,
+        CompactVersion,
+    )
+    from ._compression import RequestCompression
+    from ._instrumentation import Instrumentation, RequestInfo
+    from ._json import JSONCodec
+    from ._limits import RequestLimiter
+    from ._pagination import AsyncSessionIterator, SessionIterator
+    from ._retry import RetryEvent, RetryPolicy, RetryStats
+    from ._run_writer import AsyncRunWriter, RunWriter
+    from ._session_state import SessionState
+    from ._streaming import SessionStreamEvent
+    from ._timestamps import TimestampMode
+    from .client import AgentView, PublicAgentView
+    from .errors import AgentViewError
+    from .webhooks import WebhookEvent, WebhookReceiver
+    from .models import (
+        CommentMessage,
+        CommentMessageCreate,
+        Config,
+        ConfigCreate,
+        Environment,
+        EnvironmentCreate,
+        Space,
+        Invitation,
+        InvitationCreate,
+        Member,
+        MemberUpdate,
+        Pagination,
+        PublicSessionsGetQueryParams,
+        Role,
+        Run,
+        RunBody,
+        RunCreate,
+        RunUpdate,
+        RunWithCollaboration,
+        Score,
+        ScoreCreate,
+        Session,
+        SessionBase,
+        SessionCreate,
+        SessionItem,
+        SessionItemWithCollaboration,
+        SessionsGetQueryParams,
+        SessionsPaginatedResponse,
+        SessionUpdate,
+        SessionWithCollaboration,
+        Status,
+        User,
+        UserCreate,
+        Version,
+    )
 
 __all__ = [
     # Clients
@@ -42,14 +72,47 @@ __all__ = [
     "PublicAgentView",
     # Errors
     "AgentViewError",
+    # Caching
+    "CacheStats",
+    "CoalesceStats",
+    "ResponseCache",
+    # Instrumentation
+    "Instrumentation",
+    "RequestInfo",
+    # Compression
+    "RequestCompression",
+    # Pagination
+    "AsyncSessionIterator",
+    "SessionIterator",
+    # Rate limiting
+    "RequestLimiter",
+    # Serialization
+    "JSONCodec",
+    "TimestampMode",
+    # Retries
+    "RetryEvent",
+    "RetryPolicy",
+    "RetryStats",
+    # Run writers
+    "AsyncRunWriter",
+    "RunWriter",
+    # Streaming
+    "SessionState",
+    "SessionStreamEvent",
+    # Webhooks
+    "WebhookEvent",
+    "WebhookReceiver",
     # Enums
     "Space",
     "Role",
     "Status",
     # Models
     "CommentMessage",
+    "CommentMessageCreate",
     "Config",
     "ConfigCreate",
+    "Environment",
+    "EnvironmentCreate",
     "Invitation",
     "InvitationCreate",
     "Member",
@@ -75,4 +138,92 @@ __all__ = [
     "User",
     "UserCreate",
     "Version",
+    # Compact models
+    "CompactRun",
+    "CompactSession",
+    "CompactSessionItem",
+    "CompactStore",
+    "CompactUser",
+    "CompactVersion",
 ]
+
+# Public names are imported on first access, so `import agentview` stays
+# cheap: httpx, Pydantic and the models load only when actually used.
+_LAZY: dict[str, str] = {
+    "CacheStats": "._cache",
+    "CoalesceStats": "._coalesce",
+    "RequestCompression": "._compression",
+    "ResponseCache": "._cache",
+    "Instrumentation": "._instrumentation",
+    "RequestInfo": "._instrumentation",
+    "JSONCodec": "._json",
+    "RequestLimiter": "._limits",
+    "AsyncSessionIterator": "._pagination",
+    "SessionIterator": "._pagination",
+    "RetryEvent": "._retry",
+    "RetryPolicy": "._retry",
+    "RetryStats": "._retry",
+    "AsyncRunWriter": "._run_writer",
+    "RunWriter": "._run_writer",
+    "SessionState": "._session_state",
+    "SessionStreamEvent": "._streaming",
+    "TimestampMode": "._timestamps",
+    "AgentView": ".client",
+    "PublicAgentView": ".client",
+    "AgentViewError": ".errors",
+    "WebhookEvent": ".webhooks",
+    "WebhookReceiver": ".webhooks",
+    "CommentMessage": ".models",
+    "CommentMessageCreate": ".models",
+    "CompactRun": "._compact",
+    "CompactSession": "._compact",
+    "CompactSessionItem": "._compact",
+    "CompactStore": "._compact",
+    "CompactUser": "._compact",
+    "CompactVersion": "._compact",
+    "Config": ".models",
+    "ConfigCreate": ".models",
+    "Environment": ".models",
+    "EnvironmentCreate": ".models",
+    "Space": ".models",
+    "Invitation": ".models",
+    "InvitationCreate": ".models",
+    "Member": ".models",
+    "MemberUpdate": ".models",
+    "Pagination": ".models",
+    "PublicSessionsGetQueryParams": ".models",
+    "Role": ".models",
+    "Run": ".models",
+    "RunBody": ".models",
+    "RunCreate": ".models",
+    "RunUpdate": ".models",
+    "RunWithCollaboration": ".models",
+    "Score": ".models",
+    "ScoreCreate": ".models",
+    "Session": ".models",
+    "SessionBase": ".models",
+    "SessionCreate": ".models",
+    "SessionItem": ".models",
+    "SessionItemWithCollaboration": ".models",
+    "SessionsGetQueryParams": ".models",
+    "SessionsPaginatedResponse": ".models",
+    "SessionUpdate": ".models",
+    "SessionWithCollaboration": ".models",
+    "Status": ".models",
+    "User": ".models",
+    "UserCreate": ".models",
+    "Version": ".models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, cast
+
+CacheKey = Hashable
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_USER_TTL = 300.0
+DEFAULT_CONFIG_TTL = 60.0
+DEFAULT_SESSION_TTL = 60.0
+
+
+@dataclass
+class CacheStats:
+    """Counters shared by every client using the same cache."""
+
+    hits: int = 0
+    misses: int = 0
+    # Stale entries the API confirmed unchanged with a 304
+    revalidations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class CacheEntry:
+    data: Any
+    expires_at: float
+    etag: str | None = None
+    tags: tuple[str, ...] = ()
+
+    def value(self) -> Any:
+        """A copy of `data`, so callers can't change the entry or each other's results."""
+        return copy_json(self.data)
+
+
+def copy_json(data: Any) -> Any:
+    """Copies the dicts and lists of decoded JSON; leaves are immutable and shared."""
+    if isinstance(data, dict):
+        return {key: copy_json(value) for key, value in cast("dict[Any, Any]", data).items()}
+    if isinstance(data, list):
+        return [copy_json(value) for value in cast("list[Any]", data)]
+    return data
+
+
+class ResponseCache:
+    """
+    Read-through LRU cache for rarely changing API reads.
+
+    Entries hold their own copy of the decoded response and every hit gets a
+    fresh copy, so changing a returned object never leaks into later reads.
+
+    Caches users, the config and sessions whose last run is finished, each
+    with its own TTL (seconds; 0 disables caching that entity). Entries are
+    keyed by the credentials they were read with, so clients from `as_()`
+    share the cache without seeing each other's data.
+
+    Expired entries carrying an ETag are revalidated with `If-None-Match`, so
+    unchanged data costs a 304 instead of a full response. Writes made through
+    the client (`update_user`, `update_session`, `_update_config`, new runs)
+    update or invalidate the affected entries; use the `invalidate_*` methods
+    for changes made elsewhere.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        *,
+        user_ttl: float = DEFAULT_USER_TTL,
+        config_ttl: float = DEFAULT_CONFIG_TTL,
+        session_ttl: float = DEFAULT_SESSION_TTL,
+    ):
+        self.max_size = max_size
+        self.user_ttl = user_ttl
+        self.config_ttl = config_ttl
+        self.session_ttl = session_ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._tags: dict[str, set[CacheKey]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: CacheKey) -> tuple[CacheEntry | None, bool]:
+        """Returns the entry for `key` (possibly stale, for revalidation) and whether it is fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            fresh = entry is not None and time.monotonic() < entry.expires_at
+            if entry is not None:
+                self._entries.move_to_end(key)
+            if fresh:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+            return entry, fresh
+
+    @property
+    def generation(self) -> int:
+        """Changes on every invalidation. Read it before fetching and pass it to `store`."""
+        return self._generation
+
+    def store(
+        self,
+        key: CacheKey,
+        data: Any,
+        ttl: float,
+        etag: str | None = None,
+        tags: tuple[str, ...] = (),
+        generation: int | None = None,
+    ) -> None:
+        """
+        Caches `data` for `ttl` seconds. With `generation`, data fetched before a
+        concurrent invalidation is dropped instead of overwriting newer state.
+        """
+        if ttl <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._remove(key)
+            self._entries[key] = CacheEntry(copy_json(data), time.monotonic() + ttl, etag, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def revalidated(self, key: CacheKey, ttl: float) -> None:
+        """Marks a stale entry as confirmed unchanged for another `ttl` seconds."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = time.monotonic() + ttl
+                self.stats.revalidations += 1
+
+    def invalidate_tag(self, tag: str) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in list(self._tags.get(tag, ())):
+                self._remove(key)
+
+    def invalidate_user(self, id: str) -> None:
+        self.invalidate_tag(f"user:{id}")
+
+    def invalidate_session(self, id: str) -> None:
+        self.invalidate_tag(f"session:{id}")
+
+    def invalidate_config(self) -> None:
+        self.invalidate_tag("config")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tags.clear()
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
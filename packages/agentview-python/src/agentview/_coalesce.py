@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Hashable
+
+from ._cache import copy_json
+
+
+@dataclass
+class CoalesceStats:
+    """Counters shared by every client using the same pool."""
+
+    # GETs that went out to the API
+    requests: int = 0
+    # GETs that joined an identical request already in flight instead
+    coalesced: int = 0
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class RequestCoalescer:
+    """
+    Single-flight for identical concurrent GETs: the first caller sends the
+    request and later callers with the same key, arriving before it
+    completes, wait for it and get their own copy of its decoded result (or
+    the same exception).
+
+    Threads share flights with threads, and coroutines with coroutines on the
+    same event loop. `invalidate()`, called after every write, detaches the
+    flights in progress, so a read issued after a write completes never
+    receives a response the API produced before it.
+    """
+
+    def __init__(self) -> None:
+        self.stats = CoalesceStats()
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task[Any]] = {}
+
+    def run(self, key: Hashable, send: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self.stats.requests += 1
+                leader = True
+            else:
+                self.stats.coalesced += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy_json(flight.result)
+
+        try:
+            flight.result = send()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    async def arun(self, key: Hashable, send: Callable[[], Coroutine[Any, Any, Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            leader = task is None
+            if task is None:
+                # A task of its own, so cancelling the caller that started it
+                # doesn't fail the others
+                task = self._tasks[task_key] = loop.create_task(send())
+                task.add_done_callback(lambda done: self._finished(task_key, done))
+                self.stats.requests += 1
+            else:
+                self.stats.coalesced += 1
+        result = await asyncio.shield(task)
+        return result if leader else copy_json(result)
+
+    def _finished(self, task_key: tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task[Any]) -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            # Retrieved here, in case every caller was cancelled
+            task.exception()
+
+    def invalidate(self) -> None:
+        """Lets later GETs start new requests instead of joining those in flight."""
+        with self._lock:
+            self._flights.clear()
+            self._tasks.clear()
@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from . import models
+from ._lazy import decode_raw
+
+
+class _Compact:
+    """
+    Base of the compact, read-only model representations: instances have
+    `__slots__` instead of a `__dict__` and cannot be modified.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name.lstrip("_")) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self is other or self._values() == other._values()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # __init__ takes the slots in order
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={getattr(self, 'id', None)!r})"
+
+
+def _init(instance: _Compact, *values: Any) -> None:
+    for name, value in zip(instance.__slots__, values):
+        object.__setattr__(instance, name, value)
+
+
+def _decoded(instance: _Compact, slot: str) -> Any:
+    """Reads a field that may still hold raw JSON from `lazy_content`, decoding it once."""
+    value = getattr(instance, slot)
+    decoded = decode_raw(value)
+    if decoded is not value:
+        object.__setattr__(instance, slot, decoded)
+    return decoded
+
+
+def _raw(model: Any, name: str) -> Any:
+    # Bypasses the lazy field descriptor, so raw JSON stays raw
+    return model.__dict__[name]
+
+
+class CompactUser(_Compact):
+    __slots__ = ("id", "external_id", "created_at", "updated_at", "created_by", "space", "token")
+
+    id: str
+    external_id: str | None
+    created_at: Any
+    updated_at: Any
+    created_by: str | None
+    space: models.Space
+    token: str
+
+    def __init__(
+        self,
+        id: str,
+        external_id: str | None,
+        created_at: Any,
+        updated_at: Any,
+        created_by: str | None,
+        space: models.Space,
+        token: str,
+    ):
+        _init(self, id, external_id, created_at, updated_at, created_by, space, token)
+
+    def to_model(self) -> models.User:
+        return models.User.model_construct(**dict(zip(self.__slots__, self._values())))
+
+
+class CompactVersion(_Compact):
+    __slots__ = ("id", "version", "created_at")
+
+    id: str
+    version: str
+    created_at: Any
+
+    def __init__(self, id: str, version: str, created_at: Any):
+        _init(self, id, version, created_at)
+
+    def to_model(self) -> models.Version:
+        return models.Version.model_construct(id=self.id, version=self.version, created_at=self.created_at)
+
+
+class CompactSessionItem(_Compact):
+    __slots__ = ("id", "created_at", "updated_at", "_content", "run_id", "session_id")
+
+    id: str
+    created_at: Any
+    updated_at: Any
+    run_id: str
+    session_id: str
+
+    def __init__(self, id: str, created_at: Any, updated_at: Any, content: Any, run_id: str, session_id: str):
+        _init(self, id, created_at, updated_at, content, run_id, session_id)
+
+    @property
+    def content(self) -> Any:
+        return _decoded(self, "_content")
+
+    def to_model(self) -> models.SessionItem:
+        return models.SessionItem.model_construct(
+            id=self.id,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            content=self._content,
+            run_id=self.run_id,
+            session_id=self.session_id,
+        )
+
+
+class CompactRun(_Compact):
+    __slots__ = (
+        "id",
+        "created_at",
+        "finished_at",
+        "status",
+        "fail_reason",
+        "version",
+        "_metadata",
+        "session_items",
+        "session_id",
+        "version_id",
+    )
+
+    id: str
+    created_at: Any
+    finished_at: Any
+    status: str
+    fail_reason: Any
+    version: CompactVersion
+    session_items: tuple[CompactSessionItem, ...]
+    session_id: str
+    version_id: str | None
+
+    def __init__(
+        self,
+        id: str,
+        created_at: Any,
+        finished_at: Any,
+        status: str,
+        fail_reason: Any,
+        version: CompactVersion,
+        metadata: Any,
+        session_items: tuple[CompactSessionItem, ...],
+        session_id: str,
+        version_id: str | None,
+    ):
+        _init(
+            self,
+            id,
+            created_at,
+            finished_at,
+            status,
+            fail_reason,
+            version,
+            metadata,
+            session_items,
+            session_id,
+            version_id,
+        )
+
+    @property
+    def metadata(self) -> dict[str, Any] | None:
+        return _decoded(self, "_metadata")
+
+    def to_model(self) -> models.Run:
+        return models.Run.model_construct(
+            id=self.id,
+            created_at=self.created_at,
+            finished_at=self.finished_at,
+            status=self.status,
+            fail_reason=self.fail_reason,
+            version=self.version.to_model(),
+            metadata=self._metadata,
+            session_items=[item.to_model() for item in self.session_items],
+            session_id=self.session_id,
+            version_id=self.version_id,
+        )
+
+
+class CompactSession(_Compact):
+    """
+    Compact, read-only counterpart of `Session` (or of `SessionBase`, with
+    `runs` None). Build them with a `CompactStore`, so users, versions and
+    repeated strings are shared, and convert back with `to_model()`.
+    """
+
+    __slots__ = (
+        "id",
+        "agent",
+        "handle",
+        "created_at",
+        "updated_at",
+        "_metadata",
+        "user",
+        "user_id",
+        "space",
+        "_state",
+        "runs",
+    )
+
+    id: str
+    agent: str
+    handle: str
+    created_at: Any
+    updated_at: Any
+    user: CompactUser
+    user_id: str
+    space: models.Space
+    runs: tuple[CompactRun, ...] | None
+
+    def __init__(
+        self,
+        id: str,
+        agent: str,
+        handle: str,
+        created_at: Any,
+        updated_at: Any,
+        metadata: Any,
+        user: CompactUser,
+        user_id: str,
+        space: models.Space,
+        state: Any,
+        runs: tuple[CompactRun, ...] | None,
+    ):
+        _init(self, id, agent, handle, created_at, updated_at, metadata, user, user_id, space, state, runs)
+
+    @property
+    def metadata(self) -> dict[str, Any] | None:
+        return _decoded(self, "_metadata")
+
+    @property
+    def state(self) -> Any:
+        return _decoded(self, "_state")
+
+    @classmethod
+    def from_model(cls, session: models.SessionBase, store: CompactStore | None = None) -> CompactSession:
+        return (store or CompactStore()).session(session)
+
+    def to_model(self) -> models.SessionBase:
+        """A `Session`, or a `SessionBase` if this was built from one."""
+        fields = {
+            "id": self.id,
+            "agent": self.agent,
+            "handle": self.handle,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "metadata": self._metadata,
+            "user": self.user.to_model(),
+            "user_id": self.user_id,
+            "space": self.space,
+            "state": self._state,
+        }
+        if self.runs is None:
+            return models.SessionBase.model_construct(**fields)
+        return models.Session.model_construct(**fields, runs=[run.to_model() for run in self.runs])
+
+
+class CompactStore:
+    """
+    Converts models to their compact forms for holding many sessions in memory.
+
+    Users and versions are deduplicated (by id and last update), and strings
+    repeated across objects (agents, statuses, session, run and user ids) are
+    interned, so every session refers to the same instances. Objects built by
+    one store share its tables; drop the store once loading is done to free
+    them. Comments and scores of the `...WithCollaboration` models are not kept.
+    """
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+        self._users: dict[tuple[str, Any], CompactUser] = {}
+        self._versions: dict[str, CompactVersion] = {}
+
+    def intern(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+    def _intern_optional(self, value: str | None) -> str | None:
+        return None if value is None else self._strings.setdefault(value, value)
+
+    @property
+    def users(self) -> int:
+        return len(self._users)
+
+    @property
+    def versions(self) -> int:
+        return len(self._versions)
+
+    def user(self, user: models.User) -> CompactUser:
+        key = (user.id, user.updated_at)
+        compact = self._users.get(key)
+        if compact is None:
+            compact = self._users[key] = CompactUser(
+                self.intern(user.id),
+                user.external_id,
+                user.created_at,
+                user.updated_at,
+                self._intern_optional(user.created_by),
+                user.space,
+                user.token,
+            )
+        return compact
+
+    def version(self, version: models.Version) -> CompactVersion:
+        compact = self._versions.get(version.id)
+        if compact is None:
+            compact = self._versions[version.id] = CompactVersion(
+                self.intern(version.id), self.intern(version.version), version.created_at
+            )
+        return compact
+
+    def item(self, item: models.SessionItem) -> CompactSessionItem:
+        return CompactSessionItem(
+            item.id,
+            item.created_at,
+            item.updated_at,
+            _raw(item, "content"),
+            self.intern(item.run_id),
+            self.intern(item.session_id),
+        )
+
+    def run(self, run: models.Run) -> CompactRun:
+        return CompactRun(
+            self.intern(run.id),
+            run.created_at,
+            run.finished_at,
+            self.intern(run.status),
+            run.fail_reason,
+            self.version(run.version),
+            _raw(run, "metadata"),
+            tuple([self.item(item) for item in run.session_items]),
+            self.intern(run.session_id),
+            self._intern_optional(run.version_id),
+        )
+
+    def session(self, session: models.SessionBase) -> CompactSession:
+        runs = getattr(session, "runs", None)
+        return CompactSession(
+            self.intern(session.id),
+            self.intern(session.agent),
+            session.handle,
+            session.created_at,
+            session.updated_at,
+            _raw(session, "metadata"),
+            self.user(session.user),
+            self.intern(session.user_id),
+            session.space,
+            _raw(session, "state"),
+            None if runs is None else tuple([self.run(run) for run in runs]),
+        )
+
+    def sessions(self, sessions: Iterable[models.SessionBase]) -> list[CompactSession]:
+        return [self.session(session) for session in sessions]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import gzip
+import importlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal
+
+CompressionEncoding = Literal["gzip", "zstd"]
+
+# Smaller bodies fit in a few packets anyway, so compressing them costs more than it saves
+DEFAULT_COMPRESSION_THRESHOLD = 8 * 1024
+# Levels favouring speed: JSON transcripts compress well even at the fastest settings
+DEFAULT_GZIP_LEVEL = 1
+DEFAULT_ZSTD_LEVEL = 3
+
+
+@dataclass(frozen=True)
+class RequestCompression:
+    """
+    Compresses request bodies of at least `threshold` bytes with `encoding`
+    ("gzip", or "zstd", which requires `pip install 'agentview[zstd]'`) and
+    sends them with a matching `Content-Encoding`. The API must accept
+    compressed bodies, as the AgentView API does.
+    """
+
+    encoding: CompressionEncoding = "gzip"
+    threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    level: int | None = None
+    _compress: Callable[[bytes], bytes] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Fails up front when the encoding is unknown or its library missing
+        object.__setattr__(self, "_compress", _compressor(self.encoding, self.level))
+
+    def compress(self, body: bytes) -> tuple[bytes, dict[str, str] | None]:
+        """Returns the body to send and the headers to add, if it was compressed."""
+        if len(body) < self.threshold:
+            return body, None
+        return self._compress(body), {"Content-Encoding": self.encoding}
+
+
+def _compressor(encoding: str, level: int | None) -> Callable[[bytes], bytes]:
+    if encoding == "gzip":
+        gzip_level = DEFAULT_GZIP_LEVEL if level is None else level
+        # mtime=0 keeps the output, and so retried requests, byte-identical
+        return lambda body: gzip.compress(body, compresslevel=gzip_level, mtime=0)
+    if encoding == "zstd":
+        try:
+            # Optional, and without type stubs
+            zstandard: Any = importlib.import_module("zstandard")
+        except ImportError as error:
+            raise ImportError("zstd compression requires zstandard: pip install 'agentview[zstd]'") from error
+        zstd_level = DEFAULT_ZSTD_LEVEL if level is None else level
+        # Compressors can't be shared between threads, and are cheap to create
+        return lambda body: zstandard.ZstdCompressor(level=zstd_level).compress(body)
+    raise ValueError(f"Unsupported compression encoding: {encoding!r}")
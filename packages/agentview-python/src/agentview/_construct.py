@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import types
+import typing
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Protocol, TypeVar, Union
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+from ._timestamps import TimestampMode, timestamp_converter
+
+M = TypeVar("M", bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+
+_MISSING: Any = object()
+
+
+class ModelParser(Protocol):
+    """Builds a model from decoded response JSON, like `validate_model` or `construct_model`."""
+
+    def __call__(self, model: type[M], data: Any, /) -> M: ...
+
+
+def validate_model(model: type[M], data: Any, timestamps: TimestampMode = "datetime") -> M:
+    """The default: full Pydantic validation."""
+    if timestamps == "datetime":
+        return model.model_validate(data)
+    return model.model_validate(data, context={"timestamps": timestamps})
+
+
+def construct_model(model: type[M], data: Any, timestamps: TimestampMode = "datetime") -> M:
+    """
+    Builds `model` from trusted API JSON without validating it.
+
+    Uses a construction plan compiled once per model: aliases are mapped,
+    timestamps parsed, enums and nested models built, and missing fields get
+    their defaults, but values are not type-checked. If the data does not have
+    the expected shape (e.g. a required field is missing), falls back to
+    `model_validate`, so errors are reported as usual.
+    """
+    try:
+        return _plan(model, timestamps)(data)
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return validate_model(model, data, timestamps)
+
+
+_plans: dict[tuple[type[BaseModel], TimestampMode], Callable[[Any], Any]] = {}
+
+
+def _plan(model: type[M], timestamps: TimestampMode) -> Callable[[Any], M]:
+    plan = _plans.get((model, timestamps))
+    if plan is None:
+        plan = _compile(model, timestamps)
+    return plan
+
+
+def _compile(model: type[M], timestamps: TimestampMode) -> Callable[[Any], M]:
+    """
+    Generates a builder specialised for `model`, like dataclasses does for
+    `__init__`: one straight-line function with aliases and converters
+    inlined, so building an object costs little more than a dict literal.
+    """
+    namespace: dict[str, Any] = {
+        "_model": model,
+        "_new": model.__new__,
+        "_setattr": object.__setattr__,
+    }
+    required: list[str] = []
+    optional: list[str] = []
+
+    # Registered before compiling converters so self-referencing models terminate
+    _plans[model, timestamps] = lambda data: namespace["build"](data)
+
+    for n, (name, field) in enumerate(model.model_fields.items()):
+        alias = field.alias or name
+        convert = _converter(field.annotation, timestamps)
+        if convert is None:
+            value = f"data[{alias!r}]"
+        else:
+            namespace[f"_convert{n}"] = convert
+            value = f"(None if (value := data[{alias!r}]) is None else _convert{n}(value))"
+        default, factory = _default(field)
+        if default is _MISSING:
+            required.append(f"        {name!r}: {value},")
+            continue
+        namespace[f"_default{n}"] = default
+        optional += [
+            f"    if {alias!r} in data:",
+            f"        values[{name!r}] = {value}",
+            f"        fields_set.add({name!r})",
+            "    else:",
+            f"        values[{name!r}] = _default{n}{'()' if factory else ''}",
+        ]
+
+    required_names = [name for name, field in model.model_fields.items() if _default(field)[0] is _MISSING]
+    lines = [
+        "def build(data):",
+        "    values = {",
+        *required,
+        "    }",
+        f"    fields_set = {set(required_names)!r}" if required_names else "    fields_set = set()",
+        *optional,
+        "    instance = _new(_model)",
+        "    _setattr(instance, '__dict__', values)",
+        "    _setattr(instance, '__pydantic_fields_set__', fields_set)",
+        "    _setattr(instance, '__pydantic_extra__', None)",
+        "    _setattr(instance, '__pydantic_private__', None)",
+        "    return instance",
+    ]
+    exec("\n".join(lines), namespace)
+    build = namespace["build"]
+    _plans[model, timestamps] = build
+    return build
+
+
+def _default(field: FieldInfo) -> tuple[Any, bool]:
+    if field.default is not PydanticUndefined:
+        return field.default, False
+    if field.default_factory is not None:
+        return field.default_factory, True
+    return _MISSING, False
+
+
+def _converter(annotation: Any, timestamps: TimestampMode) -> Converter | None:
+    """Returns how to convert a JSON value to `annotation`, or None to use it as is."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _converter(typing.get_args(annotation)[0], timestamps)
+    if origin is Union or origin is types.UnionType:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _converter(args[0], timestamps) if len(args) == 1 else None
+    if origin is list:
+        (item,) = typing.get_args(annotation)
+        convert_item = _converter(item, timestamps)
+        if convert_item is None:
+            return None
+        return lambda values: [convert_item(value) for value in values]
+    if annotation is datetime:
+        return timestamp_converter(timestamps)
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _plan(annotation, timestamps)
+        if issubclass(annotation, Enum):
+            return annotation
+    return None
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from .errors import AgentViewError
+
+if TYPE_CHECKING:
+    from .client import AgentView
+
+logger = logging.getLogger("agentview")
+
+DEFAULT_KEEP_ALIVE_INTERVAL = 20.0
+MAX_KEEP_ALIVE_WORKERS = 4
+
+
+class RunHeartbeat:
+    """
+    Keeps many in-progress runs alive from a single background timer thread.
+
+    Each registered run gets a keep-alive every `interval` seconds. A run is
+    dropped when it is removed, when the API reports it finished (`expiresAt`
+    is null) or rejects it (4xx). Transient errors are retried on the next tick.
+    The thread starts on the first registered run.
+    """
+
+    def __init__(self, client: AgentView, interval: float = DEFAULT_KEEP_ALIVE_INTERVAL):
+        self._client = client
+        self.interval = interval
+        self._cond = threading.Condition()
+        self._due: dict[str, float] = {}
+        self._queue: list[tuple[float, str]] = []
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    def __contains__(self, run_id: str) -> bool:
+        return run_id in self._due
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def add(self, run_id: str) -> None:
+        with self._cond:
+            if self._closed or run_id in self._due:
+                return
+            self._schedule(run_id, time.monotonic() + self.interval)
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(
+                    MAX_KEEP_ALIVE_WORKERS, thread_name_prefix="agentview-keep-alive"
+                )
+                self._thread = threading.Thread(
+                    target=self._run_loop, name="agentview-heartbeat", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def discard(self, run_id: str) -> None:
+        with self._cond:
+            self._due.pop(run_id, None)
+
+    def close(self) -> None:
+        """Stops the timer thread and forgets all runs. Adding a run later starts it again."""
+        with self._cond:
+            self._closed = True
+            self._due.clear()
+            self._queue.clear()
+            self._cond.notify()
+            thread, executor = self._thread, self._executor
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._cond:
+            self._thread = None
+            self._executor = None
+            self._closed = False
+
+    def _schedule(self, run_id: str, due: float) -> None:
+        self._due[run_id] = due
+        heapq.heappush(self._queue, (due, run_id))
+
+    def _next_batch(self) -> list[str] | None:
+        """Waits for the next due runs. Returns None once closed."""
+        with self._cond:
+            while not self._closed:
+                now = time.monotonic()
+                batch: list[str] = []
+                while self._queue and self._queue[0][0] <= now:
+                    due, run_id = heapq.heappop(self._queue)
+                    # Skip entries of removed or rescheduled runs
+                    if self._due.get(run_id) == due:
+                        self._schedule(run_id, now + self.interval)
+                        batch.append(run_id)
+                if batch:
+                    return batch
+                timeout = self._queue[0][0] - now if self._queue else None
+                self._cond.wait(timeout)
+            return None
+
+    def _run_loop(self) -> None:
+        executor = self._executor
+        assert executor is not None
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            for future in [executor.submit(self._keep_alive, run_id) for run_id in batch]:
+                future.result()
+
+    def _keep_alive(self, run_id: str) -> None:
+        try:
+            result = self._client.keep_alive_run(run_id)
+        except AgentViewError as error:
+            if 400 <= error.status_code < 500 and error.status_code != 429:
+                logger.warning("Stopping keep-alive for run %s: %s", run_id, error)
+                self.discard(run_id)
+            else:
+                logger.warning("Keep-alive for run %s failed: %s", run_id, error)
+            return
+        except Exception as error:
+            logger.warning("Keep-alive for run %s failed: %s", run_id, error)
+            return
+        if result.get("expiresAt") is None:
+            self.discard(run_id)
@@ -1,11 +1,155 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Callable, Generator
 
 import httpx
 
+from ._cache import CacheEntry, ResponseCache
+from ._coalesce import CoalesceStats, RequestCoalescer
+from ._compression import RequestCompression
+from ._instrumentation import Instrumentation, RequestInfo
+from ._json import CodecOption, JSONCodec, encode_body, get_codec
+from ._limits import RequestLimiter
+from ._retry import DEFAULT_RETRY, IDEMPOTENT_METHODS, NO_RETRY, RetryEvent, RetryPolicy, RetryStats
 from .errors import AgentViewError
 
+DEFAULT_TIMEOUT = httpx.Timeout(5.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+class ConnectionPool:
+    """
+    Long-lived sync and async httpx clients shared by one or more HTTPClients.
+
+    Clients are created lazily on first use. Async clients are bound to the
+    event loop they were created on, so each loop (e.g. each `asyncio.run`)
+    gets its own. Close a loop's client with `aclose_loop()` before the loop
+    ends; `close()` and `aclose()` close every client still open.
+
+    The pool also carries the retry policy, its stats, the JSON codec, the
+    `RequestCoalescer` (with `coalesce=True`) and the optional
+    `RequestLimiter`, `ResponseCache`, `Instrumentation` and
+    `RequestCompression`, so clients sharing a pool share all of them.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float | httpx.Timeout | None = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+        retry: RetryPolicy | None = DEFAULT_RETRY,
+        limiter: RequestLimiter | None = None,
+        cache: ResponseCache | None = None,
+        json_codec: CodecOption = "auto",
+        instrumentation: Instrumentation | None = None,
+        coalesce: bool = False,
+        compression: RequestCompression | None = None,
+    ):
+        self.timeout = timeout
+        self.limits = limits
+        self.http2 = http2
+        self.retry = retry if retry is not None else NO_RETRY
+        self.retry_stats = RetryStats()
+        self.limiter = limiter
+        self.cache = cache
+        self.codec: JSONCodec = get_codec(json_codec)
+        self.instrumentation = instrumentation
+        self.coalescer = RequestCoalescer() if coalesce else None
+        self.compression = compression
+        self._transport = transport
+        self._async_transport = async_transport
+        self._lock = threading.Lock()
+        self._client: httpx.Client | None = None
+        self._async_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    @property
+    def client(self) -> httpx.Client:
+        client = self._client
+        if client is None:
+            with self._lock:
+                client = self._client
+                if client is None:
+                    client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        http2=self.http2,
+                        transport=self._transport,
+                    )
+                    self._client = client
+        return client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            with self._lock:
+                client = self._async_clients.get(loop)
+                if client is None:
+                    # Clients of loops closed without `aclose_loop()` can no longer be closed
+                    for closed in [other for other in self._async_clients if other.is_closed()]:
+                        del self._async_clients[closed]
+                    client = httpx.AsyncClient(
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        http2=self.http2,
+                        transport=self._async_transport,
+                    )
+                    self._async_clients[loop] = client
+        return client
+
+    def close(self) -> None:
+        """
+        Close the sync client and the async clients of other event loops:
+        closing is scheduled on loops running in other threads and run to
+        completion on idle ones. The running loop's client needs `aclose()`.
+        """
+        current = _running_loop()
+        with self._lock:
+            client, self._client = self._client, None
+            # The running loop's client can only be closed by awaiting `aclose()`
+            async_clients = {loop: c for loop, c in self._async_clients.items() if loop is not current}
+            self._async_clients = {loop: c for loop, c in self._async_clients.items() if loop is current}
+        if client is not None:
+            client.close()
+        for loop, async_client in async_clients.items():
+            if loop.is_closed():
+                continue
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(async_client.aclose(), loop)
+            elif current is None:
+                loop.run_until_complete(async_client.aclose())
+
+    async def aclose_loop(self) -> None:
+        """Close the async client of the running event loop, leaving other clients open."""
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Close all clients."""
+        await self.aclose_loop()
+        self.close()
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
 
 class HTTPClient:
     """Internal HTTP client wrapper supporting both sync and async."""
@@ -15,10 +159,25 @@ class HTTPClient:
         base_url: str,
         api_key: str | None = None,
         user_token: str | None = None,
+        *,
+        pool: ConnectionPool | None = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.user_token = user_token
+        self._pool = pool if pool is not None else ConnectionPool()
+        self._owns_pool = True
+        self._headers = self._get_headers()
+
+    @property
+    def owns_pool(self) -> bool:
+        return self._owns_pool
+
+    def with_user_token(self, user_token: str | None) -> HTTPClient:
+        """Returns an HTTPClient with a different user token sharing this client's pool."""
+        scoped = HTTPClient(self.base_url, self.api_key, user_token, pool=self._pool)
+        scoped._owns_pool = False
+        return scoped
 
     def _get_headers(self) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
@@ -28,10 +187,19 @@ class HTTPClient:
             headers["X-User-Token"] = self.user_token
         return headers
 
-    def _handle_response(self, response: httpx.Response) -> Any:
+    def _handle_response(
+        self,
+        response: httpx.Response,
+        info: RequestInfo | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """Decodes a successful response with `decode`, or the pool's codec by default."""
+        if info is not None:
+            return self._handle_instrumented_response(response, info, decode)
         if not response.is_success:
+            error_body: dict[str, Any]
             try:
-                error_body = response.json()
+                error_body = self._pool.codec.loads(response.content)
                 message = error_body.pop("message", "Unknown error")
             except Exception:
                 message = response.text or "Unknown error"
@@ -40,7 +208,141 @@ class HTTPClient:
 
         if response.status_code == 204:
             return None
-        return response.json()
+        return (decode or self._pool.codec.loads)(response.content)
+
+    def _handle_instrumented_response(
+        self, response: httpx.Response, info: RequestInfo, decode: Callable[[bytes], Any] | None
+    ) -> Any:
+        info.status_code = response.status_code
+        info.response_bytes = len(response.content)
+        started = time.perf_counter()
+        try:
+            return self._handle_response(response, decode=decode)
+        finally:
+            info.decode = time.perf_counter() - started
+
+    def _build_request(
+        self,
+        client: httpx.Client | httpx.AsyncClient,
+        method: str,
+        path: str,
+        json: Any | None,
+        params: dict[str, Any] | None,
+        idempotency_key: str | None,
+        extra_headers: dict[str, str] | None = None,
+        info: RequestInfo | None = None,
+    ) -> httpx.Request:
+        headers = self._headers
+        if idempotency_key is not None:
+            headers = {**headers, "Idempotency-Key": idempotency_key}
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+        content = None
+        if json is not None:
+            if info is None:
+                content, headers = self._encode_body(json, headers)
+            else:
+                started = time.perf_counter()
+                content, headers = self._encode_body(json, headers)
+                info.serialize = time.perf_counter() - started
+                info.request_bytes = len(content)
+        return client.build_request(
+            method, f"{self.base_url}{path}", headers=headers, content=content, params=params
+        )
+
+    def _encode_body(self, json: Any, headers: dict[str, str]) -> tuple[bytes, dict[str, str]]:
+        content = encode_body(self._pool.codec, json)
+        compression = self._pool.compression
+        if compression is None:
+            return content, headers
+        content, encoding_headers = compression.compress(content)
+        return content, headers if encoding_headers is None else {**headers, **encoding_headers}
+
+    def _retry_delay(
+        self,
+        request: httpx.Request,
+        path: str,
+        attempt: int,
+        started: float,
+        idempotent: bool,
+        response: httpx.Response | None = None,
+        error: httpx.TransportError | None = None,
+    ) -> float | None:
+        """Decides whether to retry, recording stats and notifying `on_retry`."""
+        policy = self._pool.retry
+        if error is not None:
+            delay = policy.error_delay(attempt, error, idempotent)
+        else:
+            assert response is not None
+            if response.is_success:
+                return None
+            delay = policy.response_delay(attempt, response, idempotent)
+
+        stats = self._pool.retry_stats
+        if delay is None:
+            if attempt > 0:
+                stats.record_exhausted()
+            return None
+        stats.record_retry(delay)
+        if policy.on_retry is not None:
+            policy.on_retry(
+                RetryEvent(
+                    method=request.method,
+                    path=path,
+                    attempt=attempt + 1,
+                    delay=delay,
+                    elapsed=time.monotonic() - started,
+                    status_code=response.status_code if response is not None else None,
+                    error=error,
+                )
+            )
+        return delay
+
+    def _send(self, client: httpx.Client, request: httpx.Request) -> httpx.Response:
+        limiter = self._pool.limiter
+        if limiter is None:
+            return client.send(request)
+        with limiter.slot():
+            started = time.monotonic()
+            try:
+                response = client.send(request)
+            except httpx.TransportError:
+                limiter.record(None, time.monotonic() - started)
+                raise
+        limiter.record(response.status_code, time.monotonic() - started)
+        return response
+
+    async def _asend(self, client: httpx.AsyncClient, request: httpx.Request) -> httpx.Response:
+        limiter = self._pool.limiter
+        if limiter is None:
+            return await client.send(request)
+        async with limiter.aslot():
+            started = time.monotonic()
+            try:
+                response = await client.send(request)
+            except httpx.TransportError:
+                limiter.record(None, time.monotonic() - started)
+                raise
+        limiter.record(response.status_code, time.monotonic() - started)
+        return response
+
+    def _timed_send(self, client: httpx.Client, request: httpx.Request, info: RequestInfo) -> httpx.Response:
+        info.attempts += 1
+        started = time.perf_counter()
+        try:
+            return self._send(client, request)
+        finally:
+            info.network += time.perf_counter() - started
+
+    async def _timed_asend(
+        self, client: httpx.AsyncClient, request: httpx.Request, info: RequestInfo
+    ) -> httpx.Response:
+        info.attempts += 1
+        started = time.perf_counter()
+        try:
+            return await self._asend(client, request)
+        finally:
+            info.network += time.perf_counter() - started
 
     def request(
         self,
@@ -48,17 +350,59 @@ class HTTPClient:
         path: str,
         json: Any | None = None,
         params: dict[str, Any] | None = None,
+        *,
+        idempotency_key: str | None = None,
+        idempotent: bool | None = None,
+        decode: Callable[[bytes], Any] | None = None,
     ) -> Any:
-        """Synchronous HTTP request."""
-        with httpx.Client() as client:
-            response = client.request(
-                method,
-                f"{self.base_url}{path}",
-                headers=self._get_headers(),
-                json=json,
-                params=params,
-            )
-            return self._handle_response(response)
+        """
+        Synchronous HTTP request, retried according to the pool's `RetryPolicy`
+        and throttled by its `RequestLimiter`, if any.
+
+        `json` may be a Pydantic model, which is encoded by alias without None
+        fields, or any value the pool's JSON codec can encode.
+
+        Requests with an `idempotency_key` are treated as idempotent; pass
+        `idempotent` to override the method-based default. `decode` replaces
+        the codec for decoding the response.
+
+        With coalescing on, a GET identical to one already in flight waits for
+        it and returns a copy of its decoded data.
+        """
+        coalescer = self._pool.coalescer
+        if coalescer is None:
+            return self._request(method, path, json, params, idempotency_key, idempotent, decode)
+        if method != "GET":
+            try:
+                return self._request(method, path, json, params, idempotency_key, idempotent, decode)
+            finally:
+                coalescer.invalidate()
+        key = self._coalesce_key(path, params, decode)
+        if key is None:
+            return self._request(method, path, json, params, idempotency_key, idempotent, decode)
+        data = coalescer.run(
+            key, lambda: self._request(method, path, json, params, idempotency_key, idempotent, decode)
+        )
+        self._joined(path)
+        return data
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: Any | None,
+        params: dict[str, Any] | None,
+        idempotency_key: str | None,
+        idempotent: bool | None,
+        decode: Callable[[bytes], Any] | None,
+    ) -> Any:
+        instrumentation = self._pool.instrumentation
+        if instrumentation is None:
+            response = self._send_with_retries(method, path, json, params, idempotency_key, idempotent)
+            return self._handle_response(response, decode=decode)
+        with instrumentation.request(method, path) as info:
+            response = self._send_with_retries(method, path, json, params, idempotency_key, idempotent, info=info)
+            return self._handle_response(response, info, decode)
 
     async def arequest(
         self,
@@ -66,14 +410,352 @@ class HTTPClient:
         path: str,
         json: Any | None = None,
         params: dict[str, Any] | None = None,
+        *,
+        idempotency_key: str | None = None,
+        idempotent: bool | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """Asynchronous HTTP request, retried according to the pool's `RetryPolicy`."""
+        coalescer = self._pool.coalescer
+        if coalescer is None:
+            return await self._arequest(method, path, json, params, idempotency_key, idempotent, decode)
+        if method != "GET":
+            try:
+                return await self._arequest(method, path, json, params, idempotency_key, idempotent, decode)
+            finally:
+                coalescer.invalidate()
+        key = self._coalesce_key(path, params, decode)
+        if key is None:
+            return await self._arequest(method, path, json, params, idempotency_key, idempotent, decode)
+        data = await coalescer.arun(
+            key, lambda: self._arequest(method, path, json, params, idempotency_key, idempotent, decode)
+        )
+        self._joined(path)
+        return data
+
+    async def _arequest(
+        self,
+        method: str,
+        path: str,
+        json: Any | None,
+        params: dict[str, Any] | None,
+        idempotency_key: str | None,
+        idempotent: bool | None,
+        decode: Callable[[bytes], Any] | None,
     ) -> Any:
-        """Asynchronous HTTP request."""
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method,
-                f"{self.base_url}{path}",
-                headers=self._get_headers(),
-                json=json,
-                params=params,
+        instrumentation = self._pool.instrumentation
+        if instrumentation is None:
+            response = await self._asend_with_retries(method, path, json, params, idempotency_key, idempotent)
+            return self._handle_response(response, decode=decode)
+        with instrumentation.request(method, path) as info:
+            response = await self._asend_with_retries(
+                method, path, json, params, idempotency_key, idempotent, info=info
             )
-            return self._handle_response(response)
+            return self._handle_response(response, info, decode)
+
+    def _joined(self, path: str) -> None:
+        # The request may have run in another thread or task, so parsing here
+        # wouldn't otherwise be attributed to its route
+        if self._pool.instrumentation is not None:
+            self._pool.instrumentation.set_route(path)
+
+    def _coalesce_key(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        decode: Callable[[bytes], Any] | None,
+        cached: bool = False,
+    ) -> tuple[Any, ...] | None:
+        """What identical GETs share: None if the params can't be compared cheaply."""
+        key = (self.api_key, self.user_token, path, tuple(sorted(params.items())) if params else (), decode, cached)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        json: Any | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+        idempotent: bool | None = None,
+        headers: dict[str, str] | None = None,
+        info: RequestInfo | None = None,
+    ) -> httpx.Response:
+        client = self._pool.client
+        request = self._build_request(client, method, path, json, params, idempotency_key, headers, info)
+        if idempotent is None:
+            idempotent = idempotency_key is not None or method in IDEMPOTENT_METHODS
+        self._pool.retry_stats.record_request()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                if info is None:
+                    response = self._send(client, request)
+                else:
+                    response = self._timed_send(client, request, info)
+            except httpx.TransportError as error:
+                delay = self._retry_delay(request, path, attempt, started, idempotent, error=error)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(request, path, attempt, started, idempotent, response=response)
+                if delay is None:
+                    return response
+                response.close()
+            attempt += 1
+            time.sleep(delay)
+
+    async def _asend_with_retries(
+        self,
+        method: str,
+        path: str,
+        json: Any | None = None,
+        params: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
+        idempotent: bool | None = None,
+        headers: dict[str, str] | None = None,
+        info: RequestInfo | None = None,
+    ) -> httpx.Response:
+        client = self._pool.async_client
+        request = self._build_request(client, method, path, json, params, idempotency_key, headers, info)
+        if idempotent is None:
+            idempotent = idempotency_key is not None or method in IDEMPOTENT_METHODS
+        self._pool.retry_stats.record_request()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                if info is None:
+                    response = await self._asend(client, request)
+                else:
+                    response = await self._timed_asend(client, request, info)
+            except httpx.TransportError as error:
+                delay = self._retry_delay(request, path, attempt, started, idempotent, error=error)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(request, path, attempt, started, idempotent, response=response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    # --- Caching ---
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._pool.cache
+
+    def _cache_key(self, path: str) -> tuple[str | None, str | None, str]:
+        return (self.api_key, self.user_token, path)
+
+    def cached_request(
+        self,
+        path: str,
+        ttl: float,
+        tags: Callable[[Any], tuple[str, ...] | None],
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """
+        GET through the pool's `ResponseCache`. `tags` returns the invalidation
+        tags for a response, or None if it must not be cached.
+        """
+        cache = self._pool.cache
+        if cache is None or ttl <= 0:
+            return self.request("GET", path, decode=decode)
+        key = self._cache_key(path)
+        entry, fresh = cache.lookup(key)
+        if entry is not None and fresh:
+            return entry.value()
+        coalescer = self._pool.coalescer
+        if coalescer is None:
+            return self._cached_request(cache, key, entry, path, ttl, tags, decode)
+        data = coalescer.run(
+            self._coalesce_key(path, None, decode, cached=True),
+            lambda: self._cached_request(cache, key, entry, path, ttl, tags, decode),
+        )
+        self._joined(path)
+        return data
+
+    def _cached_request(
+        self,
+        cache: ResponseCache,
+        key: tuple[str | None, str | None, str],
+        entry: CacheEntry | None,
+        path: str,
+        ttl: float,
+        tags: Callable[[Any], tuple[str, ...] | None],
+        decode: Callable[[bytes], Any] | None,
+    ) -> Any:
+        generation = cache.generation
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        instrumentation = self._pool.instrumentation
+        if instrumentation is None:
+            response = self._send_with_retries("GET", path, headers=headers)
+            return self._cache_response(cache, key, entry, response, ttl, tags, generation, decode=decode)
+        with instrumentation.request("GET", path) as info:
+            response = self._send_with_retries("GET", path, headers=headers, info=info)
+            return self._cache_response(cache, key, entry, response, ttl, tags, generation, info, decode)
+
+    async def acached_request(
+        self,
+        path: str,
+        ttl: float,
+        tags: Callable[[Any], tuple[str, ...] | None],
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """Asynchronous `cached_request`."""
+        cache = self._pool.cache
+        if cache is None or ttl <= 0:
+            return await self.arequest("GET", path, decode=decode)
+        key = self._cache_key(path)
+        entry, fresh = cache.lookup(key)
+        if entry is not None and fresh:
+            return entry.value()
+        coalescer = self._pool.coalescer
+        if coalescer is None:
+            return await self._acached_request(cache, key, entry, path, ttl, tags, decode)
+        data = await coalescer.arun(
+            self._coalesce_key(path, None, decode, cached=True),
+            lambda: self._acached_request(cache, key, entry, path, ttl, tags, decode),
+        )
+        self._joined(path)
+        return data
+
+    async def _acached_request(
+        self,
+        cache: ResponseCache,
+        key: tuple[str | None, str | None, str],
+        entry: CacheEntry | None,
+        path: str,
+        ttl: float,
+        tags: Callable[[Any], tuple[str, ...] | None],
+        decode: Callable[[bytes], Any] | None,
+    ) -> Any:
+        generation = cache.generation
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        instrumentation = self._pool.instrumentation
+        if instrumentation is None:
+            response = await self._asend_with_retries("GET", path, headers=headers)
+            return self._cache_response(cache, key, entry, response, ttl, tags, generation, decode=decode)
+        with instrumentation.request("GET", path) as info:
+            response = await self._asend_with_retries("GET", path, headers=headers, info=info)
+            return self._cache_response(cache, key, entry, response, ttl, tags, generation, info, decode)
+
+    def _cache_response(
+        self,
+        cache: ResponseCache,
+        key: tuple[str | None, str | None, str],
+        entry: CacheEntry | None,
+        response: httpx.Response,
+        ttl: float,
+        tags: Callable[[Any], tuple[str, ...] | None],
+        generation: int,
+        info: RequestInfo | None = None,
+        decode: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        if response.status_code == 304 and entry is not None:
+            if info is not None:
+                info.status_code = 304
+            cache.revalidated(key, ttl)
+            return entry.value()
+        data = self._handle_response(response, info, decode)
+        entry_tags = tags(data)
+        if entry_tags is not None:
+            cache.store(key, data, ttl, response.headers.get("ETag"), entry_tags, generation)
+        return data
+
+    def cache_put(self, path: str, data: Any, ttl: float, tags: tuple[str, ...]) -> None:
+        """Stores data the API returned from a write, as if read from `path`."""
+        if self._pool.cache is not None:
+            self._pool.cache.store(self._cache_key(path), data, ttl, tags=tags)
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        return self._pool.retry_stats
+
+    @property
+    def limiter(self) -> RequestLimiter | None:
+        return self._pool.limiter
+
+    @property
+    def coalesce_stats(self) -> CoalesceStats | None:
+        coalescer = self._pool.coalescer
+        return None if coalescer is None else coalescer.stats
+
+    @property
+    def codec(self) -> JSONCodec:
+        return self._pool.codec
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        return self._pool.instrumentation
+
+    def _stream_timeout(self) -> httpx.Timeout:
+        # Streams may stay silent for long periods, so never time out on reads.
+        timeout = httpx.Timeout(self._pool.timeout)
+        return httpx.Timeout(None, connect=timeout.connect, write=timeout.write, pool=timeout.pool)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> Generator[httpx.Response, None, None]:
+        """
+        Synchronous streaming request. Error responses raise before yielding.
+
+        Streams are long-lived, so they are not counted by the `RequestLimiter`.
+        """
+        with self._pool.client.stream(
+            method,
+            f"{self.base_url}{path}",
+            headers=self._headers,
+            params=params,
+            timeout=self._stream_timeout(),
+        ) as response:
+            if not response.is_success:
+                response.read()
+                self._handle_response(response)
+            yield response
+
+    @asynccontextmanager
+    async def astream(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncGenerator[httpx.Response, None]:
+        """Asynchronous streaming request. Error responses raise before yielding."""
+        async with self._pool.async_client.stream(
+            method,
+            f"{self.base_url}{path}",
+            headers=self._headers,
+            params=params,
+            timeout=self._stream_timeout(),
+        ) as response:
+            if not response.is_success:
+                await response.aread()
+                self._handle_response(response)
+            yield response
+
+    def close(self) -> None:
+        """Close the underlying pool if this client owns it."""
+        if self._owns_pool:
+            self._pool.close()
+
+    async def aclose(self) -> None:
+        """Close the underlying pool if this client owns it."""
+        if self._owns_pool:
+            await self._pool.aclose()
+
+    async def aclose_loop(self) -> None:
+        """Close the pool's connections on the running event loop, even when shared."""
+        await self._pool.aclose_loop()
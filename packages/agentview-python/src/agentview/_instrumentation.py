@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Generator, TypeVar
+
+M = TypeVar("M")
+
+# Upper bounds in seconds; the last bucket catches everything slower
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PHASES = ("serialize", "network", "decode", "validate")
+
+# Placeholder names for ID segments following each collection in API paths
+_ID_PLACEHOLDERS = {
+    "users": "{user_id}",
+    "sessions": "{session_id}",
+    "runs": "{run_id}",
+    "items": "{item_id}",
+    "by-external-id": "{external_id}",
+    "members": "{member_id}",
+    "invitations": "{invitation_id}",
+    "scores": "{score_id}",
+    "comments": "{comment_id}",
+}
+# Segments that are routes of their own rather than IDs
+_LITERAL_SEGMENTS = frozenset({"me", "by-external-id"})
+
+
+@lru_cache(maxsize=2048)
+def route_template(path: str) -> str:
+    """Maps a request path to its route, e.g. `/api/runs/r1/keep-alive` to `/api/runs/{run_id}/keep-alive`."""
+    segments = path.split("?", 1)[0].split("/")
+    for i in range(1, len(segments)):
+        placeholder = _ID_PLACEHOLDERS.get(segments[i - 1])
+        if placeholder is not None and segments[i] and segments[i] not in _LITERAL_SEGMENTS:
+            segments[i] = placeholder
+    return "/".join(segments)
+
+
+@dataclass
+class RequestInfo:
+    """
+    One API request, passed to `Instrumentation` hooks.
+
+    `pre_request` hooks see it before anything is sent; `post_request` hooks
+    after the response is decoded (or the request failed). Phase timings are
+    in seconds; `network` covers every attempt, `attempts` counts them.
+    """
+
+    method: str
+    path: str
+    route: str
+    started: float = field(default_factory=time.perf_counter)
+    request_bytes: int = 0
+    response_bytes: int = 0
+    status_code: int | None = None
+    attempts: int = 0
+    serialize: float = 0.0
+    network: float = 0.0
+    decode: float = 0.0
+    duration: float = 0.0
+    error: BaseException | None = None
+
+
+class Histogram:
+    """Latency histogram with fixed buckets (seconds)."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the `q` quantile (inf if past the last bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip([*map(str, self.buckets), "inf"], self.counts)),
+        }
+
+
+class RouteMetrics:
+    """Counters and histograms for one route template."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.status_codes: Counter[int] = Counter()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency = Histogram()
+        self.phases = {phase: Histogram() for phase in PHASES}
+
+    def record(self, info: RequestInfo) -> None:
+        self.requests += 1
+        self.retries += max(info.attempts - 1, 0)
+        if info.error is not None:
+            self.errors += 1
+        if info.status_code is not None:
+            self.status_codes[info.status_code] += 1
+        self.request_bytes += info.request_bytes
+        self.response_bytes += info.response_bytes
+        self.latency.observe(info.duration)
+        self.phases["serialize"].observe(info.serialize)
+        self.phases["network"].observe(info.network)
+        self.phases["decode"].observe(info.decode)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items())},
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "latency": self.latency.to_dict(),
+            "phases": {phase: histogram.to_dict() for phase, histogram in self.phases.items()},
+        }
+
+
+# Route of the latest request in this thread or task, for timing the
+# validation of its response
+_current_route: ContextVar[tuple[Instrumentation, str] | None] = ContextVar("agentview_route", default=None)
+
+
+class Instrumentation:
+    """
+    Request hooks, per-route metrics and optional OpenTelemetry spans.
+
+    Pass one to `AgentView(instrumentation=...)`; clients created with `as_()`
+    share it. Without it, requests take no instrumentation code path at all.
+
+    Each request is timed in phases: `serialize` (encoding the body),
+    `network` (all attempts, excluding retry backoff), `decode` (parsing the
+    JSON response) and `validate` (building models from it). Metrics are kept
+    per route template such as `/api/runs/{run_id}` and are available from
+    `snapshot()`.
+
+    With `opentelemetry=True` (requires `opentelemetry-api`), every request
+    is wrapped in a client span carrying the route, status and phase timings,
+    and model validation gets a child span.
+    """
+
+    def __init__(
+        self,
+        *,
+        pre_request: Callable[[RequestInfo], None] | None = None,
+        post_request: Callable[[RequestInfo], None] | None = None,
+        metrics: bool = True,
+        opentelemetry: bool = False,
+        tracer: Any = None,
+    ):
+        self.pre_request_hooks: list[Callable[[RequestInfo], None]] = [pre_request] if pre_request else []
+        self.post_request_hooks: list[Callable[[RequestInfo], None]] = [post_request] if post_request else []
+        self.metrics_enabled = metrics
+        self._routes: dict[str, RouteMetrics] = {}
+        self._lock = threading.Lock()
+        if tracer is None and opentelemetry:
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer("agentview")
+        self._tracer = tracer
+        if tracer is not None:
+            from opentelemetry.trace import SpanKind, Status, StatusCode
+
+            self._span_kind = SpanKind.CLIENT
+            self._error_status: Callable[[BaseException], Any] = lambda error: Status(StatusCode.ERROR, str(error))
+
+    def on_pre_request(self, hook: Callable[[RequestInfo], None]) -> Callable[[RequestInfo], None]:
+        """Registers a hook called before each request. Usable as a decorator."""
+        self.pre_request_hooks.append(hook)
+        return hook
+
+    def on_post_request(self, hook: Callable[[RequestInfo], None]) -> Callable[[RequestInfo], None]:
+        """Registers a hook called after each request, successful or not. Usable as a decorator."""
+        self.post_request_hooks.append(hook)
+        return hook
+
+    # --- Metrics ---
+
+    def route_metrics(self, route: str) -> RouteMetrics | None:
+        return self._routes.get(route)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """JSON-serializable metrics per route template."""
+        with self._lock:
+            return {route: metrics.to_dict() for route, metrics in sorted(self._routes.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def _metrics(self, route: str) -> RouteMetrics:
+        metrics = self._routes.get(route)
+        if metrics is None:
+            metrics = self._routes.setdefault(route, RouteMetrics())
+        return metrics
+
+    # --- Recording ---
+
+    @contextmanager
+    def request(self, method: str, path: str) -> Generator[RequestInfo, None, None]:
+        """Wraps one request: runs hooks, records metrics and emits a span."""
+        info = RequestInfo(method, path, route_template(path))
+        for hook in self.pre_request_hooks:
+            hook(info)
+        if self._tracer is None:
+            try:
+                yield info
+            except BaseException as error:
+                info.error = error
+                raise
+            finally:
+                self._finish(info)
+            return
+
+        with self._tracer.start_as_current_span(
+            f"{method} {info.route}",
+            kind=self._span_kind,
+            attributes={"http.request.method": method, "http.route": info.route, "url.path": path},
+        ) as span:
+            try:
+                yield info
+            except BaseException as error:
+                info.error = error
+                span.set_status(self._error_status(error))
+                raise
+            finally:
+                self._finish(info)
+                if info.status_code is not None:
+                    span.set_attribute("http.response.status_code", info.status_code)
+                span.set_attribute("agentview.attempts", info.attempts)
+                for phase in ("serialize", "network", "decode"):
+                    span.set_attribute(f"agentview.{phase}_ms", getattr(info, phase) * 1e3)
+
+    def _finish(self, info: RequestInfo) -> None:
+        info.duration = time.perf_counter() - info.started
+        _current_route.set((self, info.route))
+        if self.metrics_enabled:
+            with self._lock:
+                self._metrics(info.route).record(info)
+        for hook in self.post_request_hooks:
+            hook(info)
+
+    def set_route(self, path: str) -> None:
+        """Attributes model parsing in the current context to the route of `path`, for shared responses."""
+        _current_route.set((self, route_template(path)))
+
+    def wrap_parser(self, parse: Callable[[type[M], Any], M]) -> Callable[[type[M], Any], M]:
+        """Times model construction, attributing it to the route of the response being parsed."""
+
+        def timed_parse(model: type[M], data: Any) -> M:
+            started = time.perf_counter()
+            if self._tracer is None:
+                result = parse(model, data)
+            else:
+                with self._tracer.start_as_current_span(f"validate {model.__name__}"):
+                    result = parse(model, data)
+            self._record_validation(time.perf_counter() - started)
+            return result
+
+        return timed_parse
+
+    def _record_validation(self, elapsed: float) -> None:
+        current = _current_route.get()
+        if current is None or current[0] is not self or not self.metrics_enabled:
+            return
+        with self._lock:
+            self._metrics(current[1]).phases["validate"].observe(elapsed)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Literal, Protocol, Union
+
+from pydantic import BaseModel
+
+
+class JSONCodec(Protocol):
+    """Encodes request bodies and decodes response bodies."""
+
+    name: str
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+def _encode_default(obj: Any) -> Any:
+    """Fallback for values JSON libraries can't encode natively, e.g. models nested in dicts."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True, exclude_none=True)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class StdlibCodec:
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_encode_default).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj, default=_encode_default, option=self._option)
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+CodecName = Literal["auto", "orjson", "msgspec", "json"]
+CodecOption = Union[CodecName, JSONCodec]
+
+_CODECS: dict[str, Callable[[], JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibCodec,
+}
+
+
+def get_codec(codec: CodecOption = "auto") -> JSONCodec:
+    """
+    Resolves a codec name. "auto" picks the fastest installed library:
+    orjson, then msgspec, then the standard library.
+    """
+    if not isinstance(codec, str):
+        return codec
+    if codec != "auto":
+        return _CODECS[codec]()
+    for name in ("orjson", "msgspec"):
+        try:
+            return _CODECS[name]()
+        except ImportError:
+            continue
+    return StdlibCodec()
+
+
+def encode_body(codec: JSONCodec, body: Any) -> bytes:
+    """
+    Encodes a request body. Models are serialized straight to bytes by
+    pydantic-core, without building an intermediate dict.
+    """
+    if isinstance(body, BaseModel):
+        return body.__pydantic_serializer__.to_json(body, by_alias=True, exclude_none=True)
+    return codec.dumps(body)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import types
+import typing
+from typing import Any, Callable, Union
+
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+# msgspec.Raw, once lazy decoding has been used; nothing is raw before that
+_raw_type: type | None = None
+_decode_raw: Callable[[Any], Any] | None = None
+
+_decoders: dict[type[BaseModel], Callable[[bytes], Any]] = {}
+
+
+def decode_raw(value: Any) -> Any:
+    """Decodes a raw JSON value kept by lazy decoding; other values are returned as is."""
+    if value.__class__ is _raw_type:
+        assert _decode_raw is not None
+        return _decode_raw(value)
+    return value
+
+
+class LazyJSON:
+    """
+    Marks a field that lazy decoding keeps as raw JSON, e.g.
+    `content: Annotated[Any, LazyJSON()]`.
+
+    Validation passes raw values through and serialization decodes them, so
+    models holding raw JSON dump exactly like fully decoded ones.
+    """
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        schema = handler(source)
+        return core_schema.no_info_wrap_validator_function(
+            _validate,
+            schema,
+            serialization=core_schema.wrap_serializer_function_ser_schema(_serialize, schema=schema),
+        )
+
+
+def _validate(value: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Any:
+    return value if value.__class__ is _raw_type else handler(value)
+
+
+def _serialize(value: Any, handler: core_schema.SerializerFunctionWrapHandler) -> Any:
+    return handler(decode_raw(value))
+
+
+class _LazyField:
+    """
+    Data descriptor for a `LazyJSON` field. Instances keep field values in
+    `__dict__` as Pydantic does; a raw value is decoded on first access and
+    replaced by the result.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            # Like any Pydantic field, not a class attribute
+            raise AttributeError(self.name)
+        values = instance.__dict__
+        try:
+            value = values[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if value.__class__ is _raw_type:
+            value = values[self.name] = decode_raw(value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+
+def lazy_fields(model: type[BaseModel]) -> list[str]:
+    return [name for name, field in model.model_fields.items() if any(isinstance(m, LazyJSON) for m in field.metadata)]
+
+
+def install_lazy_fields(*models: type[BaseModel]) -> None:
+    """Makes the `LazyJSON` fields of `models` (and their subclasses) decode on first access."""
+    for model in models:
+        for name in lazy_fields(model):
+            setattr(model, name, _LazyField(name))
+
+
+def lazy_decoder(model: type[BaseModel]) -> Callable[[bytes], Any]:
+    """
+    Returns a function decoding a JSON response for `model` into plain dicts
+    and lists, except that `LazyJSON` fields are kept as `msgspec.Raw`
+    slices of the response buffer. Requires msgspec.
+    """
+    decode = _decoders.get(model)
+    if decode is None:
+        decode = _decoders[model] = _compile(model)
+    return decode
+
+
+def _compile(model: type[BaseModel]) -> Callable[[bytes], Any]:
+    global _raw_type, _decode_raw
+    try:
+        import msgspec
+    except ImportError as error:
+        raise ImportError("lazy_content requires msgspec: pip install 'agentview[msgspec]'") from error
+
+    _raw_type = msgspec.Raw
+    _decode_raw = msgspec.json.Decoder().decode
+    return msgspec.json.Decoder(_schema(model, {})).decode
+
+
+def _schema(model: type[BaseModel], schemas: dict[type[BaseModel], Any]) -> Any:
+    """
+    A TypedDict mirroring `model` by alias: nested models become nested
+    TypedDicts, `LazyJSON` fields `msgspec.Raw` and everything else `Any`, so
+    decoding checks nothing the model doesn't check itself.
+    """
+    import msgspec
+
+    schema = schemas.get(model)
+    if schema is not None:
+        return schema
+    lazy = set(lazy_fields(model))
+    if lazy:
+        # Raw values only reach models through decoders compiled here
+        install_lazy_fields(model)
+    fields = {
+        field.alias or name: msgspec.Raw if name in lazy else _field_schema(field.annotation, schemas)
+        for name, field in model.model_fields.items()
+    }
+    schema = schemas[model] = typing.TypedDict(f"{model.__name__}JSON", fields, total=False)  # type: ignore[operator]
+    return schema
+
+
+def _field_schema(annotation: Any, schemas: dict[type[BaseModel], Any]) -> Any:
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _field_schema(typing.get_args(annotation)[0], schemas)
+    if origin is Union or origin is types.UnionType:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1 and (inner := _field_schema(args[0], schemas)) is not Any:
+            return typing.Optional[inner]
+        return Any
+    if origin is list:
+        (item,) = typing.get_args(annotation)
+        inner = _field_schema(item, schemas)
+        return Any if inner is Any else list[inner]  # type: ignore[valid-type]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _schema(annotation, schemas)
+    return Any
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket. Callers reserve a token up front and sleep off
+    any deficit outside the lock, so sync and async callers share one bucket.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class _Waiter:
+    __slots__ = ("event", "loop", "future", "granted")
+
+    def __init__(
+        self,
+        event: threading.Event | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+        future: asyncio.Future[None] | None = None,
+    ):
+        self.event = event
+        self.loop = loop
+        self.future = future
+        self.granted = False
+
+    def wake(self) -> None:
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+        elif self.loop is not None and self.future is not None:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _ConcurrencyLimit:
+    """
+    A FIFO semaphore shared by threads and coroutines on any event loop.
+    Freed slots are handed directly to the longest waiter.
+    """
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.active = 0
+        self._lock = threading.Lock()
+        self._waiters: deque[_Waiter] = deque()
+
+    def _try_acquire(self) -> bool:
+        if self.active < max(1, int(self.limit)) and not self._waiters:
+            self.active += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._try_acquire():
+                return
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+        assert waiter.event is not None
+        waiter.event.wait()
+
+    async def aacquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_acquire():
+                return
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+        assert waiter.future is not None
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters.remove(waiter)
+            if granted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            self.active -= 1
+            self._wake()
+
+    def set_limit(self, limit: float) -> None:
+        with self._lock:
+            self.limit = limit
+            self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.active < max(1, int(self.limit)):
+            self.active += 1
+            self._waiters.popleft().wake()
+
+
+class RequestLimiter:
+    """
+    Client-side rate limit and concurrency cap for API requests.
+
+    - `rate`/`burst`: token bucket of `rate` requests per second, allowing
+      bursts of up to `burst` requests (defaults to `rate`).
+    - `max_concurrency`: maximum number of requests in flight.
+
+    One limiter is shared by every thread and coroutine using the client, and
+    by scoped clients from `as_()`. Each retry attempt counts as a request.
+
+    With `adaptive=True` the limits back off multiplicatively (by
+    `backoff_ratio`) when the API answers 429/503 or a request takes longer
+    than `latency_threshold` seconds, and recover additively on healthy
+    responses, never exceeding the configured values.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        max_concurrency: int | None = None,
+        *,
+        adaptive: bool = False,
+        latency_threshold: float | None = None,
+        backoff_ratio: float = 0.5,
+        min_rate: float = 1.0,
+        min_concurrency: int = 1,
+        cooldown: float = 1.0,
+    ):
+        self.max_rate = rate
+        self.max_concurrency = max_concurrency
+        self.adaptive = adaptive
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+        self.min_rate = min(min_rate, rate) if rate is not None else min_rate
+        self.min_concurrency = min_concurrency
+        self.cooldown = cooldown
+        self._bucket = _TokenBucket(rate, burst if burst is not None else max(rate, 1.0)) if rate else None
+        self._concurrency = _ConcurrencyLimit(max_concurrency) if max_concurrency else None
+        self._lock = threading.Lock()
+        self._last_backoff = 0.0
+
+    @property
+    def rate(self) -> float | None:
+        """Current rate; lower than the configured one while backing off."""
+        return self._bucket.rate if self._bucket is not None else None
+
+    @property
+    def concurrency(self) -> float | None:
+        """Current concurrency limit; lower than the configured one while backing off."""
+        return self._concurrency.limit if self._concurrency is not None else None
+
+    @property
+    def in_flight(self) -> int:
+        return self._concurrency.active if self._concurrency is not None else 0
+
+    @contextmanager
+    def slot(self) -> Generator[None, None, None]:
+        if self._concurrency is not None:
+            self._concurrency.acquire()
+        try:
+            if self._bucket is not None:
+                delay = self._bucket.reserve()
+                if delay > 0:
+                    time.sleep(delay)
+            yield
+        finally:
+            if self._concurrency is not None:
+                self._concurrency.release()
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncGenerator[None, None]:
+        if self._concurrency is not None:
+            await self._concurrency.aacquire()
+        try:
+            if self._bucket is not None:
+                delay = self._bucket.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield
+        finally:
+            if self._concurrency is not None:
+                self._concurrency.release()
+
+    def record(self, status_code: int | None, latency: float) -> None:
+        """Feeds a request outcome to the adaptive controller (`None` for transport errors)."""
+        if not self.adaptive:
+            return
+        overloaded = status_code in (429, 503) or (
+            self.latency_threshold is not None and latency > self.latency_threshold
+        )
+        with self._lock:
+            if overloaded:
+                now = time.monotonic()
+                # Many in-flight requests fail together; back off once per cooldown
+                if now - self._last_backoff < self.cooldown:
+                    return
+                self._last_backoff = now
+                if self._bucket is not None:
+                    self._bucket.rate = max(self.min_rate, self._bucket.rate * self.backoff_ratio)
+                if self._concurrency is not None:
+                    limit = max(self.min_concurrency, self._concurrency.limit * self.backoff_ratio)
+                    self._concurrency.set_limit(limit)
+            elif status_code is not None and status_code < 500:
+                if self._bucket is not None and self.max_rate is not None:
+                    self._bucket.rate = min(self.max_rate, self._bucket.rate + self.max_rate / 100)
+                if self._concurrency is not None and self.max_concurrency is not None:
+                    limit = self._concurrency.limit
+                    self._concurrency.set_limit(min(float(self.max_concurrency), limit + 1 / limit))
@@ -0,0 +1,41 @@
+"""Handwritten field types used by the generated models in `models.py`."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Any
+
+from pydantic import SerializerFunctionWrapHandler, ValidationInfo, WrapSerializer, WrapValidator
+
+from ._lazy import LazyJSON
+from ._timestamps import parse_timestamp, timestamp_converter
+
+
+def _parse_datetime(value: Any) -> datetime:
+    """Parse datetime from API which may use space instead of T."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return parse_timestamp(value)
+    raise ValueError(f"Cannot parse datetime from {value}")
+
+
+def _validate_datetime(value: Any, handler: Any, info: ValidationInfo) -> Any:
+    # The "timestamps" validation context keeps raw strings or epoch seconds
+    # instead (see TimestampMode)
+    mode = info.context.get("timestamps", "datetime") if info.context else "datetime"
+    if mode != "datetime" and isinstance(value, str):
+        convert = timestamp_converter(mode)
+        return value if convert is None else convert(value)
+    return _parse_datetime(value)
+
+
+def _serialize_datetime(value: Any, handler: SerializerFunctionWrapHandler) -> Any:
+    return handler(value) if isinstance(value, datetime) else value
+
+
+DateTime = Annotated[datetime, WrapValidator(_validate_datetime), WrapSerializer(_serialize_datetime)]
+
+# Large JSON values that clients with `lazy_content=True` decode on first access
+LazyAny = Annotated[Any, LazyJSON()]
+LazyMetadata = Annotated[dict[str, Any] | None, LazyJSON()]
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Iterator
+
+from .models import SessionBase, SessionsPaginatedResponse
+
+DEFAULT_PREFETCH = 4
+
+PageFetcher = Callable[[int], SessionsPaginatedResponse]
+AsyncPageFetcher = Callable[[int], Awaitable[SessionsPaginatedResponse]]
+
+
+class _PageCursor:
+    """
+    Tracks the resume position and drops sessions repeated across pages.
+
+    Pages are offsets into a list ordered by `updatedAt`, so a session updated
+    mid-iteration can shift into the next page and show up twice. Only the
+    previous page's ids are kept, which catches that without unbounded memory.
+    """
+
+    def __init__(self, page: int):
+        self.page = page
+        self._previous_ids: frozenset[str] = frozenset()
+
+    def accept(self, response: SessionsPaginatedResponse) -> list[SessionBase]:
+        sessions = [s for s in response.sessions if s.id not in self._previous_ids]
+        self._previous_ids = frozenset(s.id for s in response.sessions)
+        return sessions
+
+
+class SessionIterator:
+    """
+    Lazily yields sessions page by page.
+
+    `page` is the page the next session comes from; pass it as `page=` to
+    `iter_sessions` to resume an interrupted iteration (sessions of that page
+    already yielded are yielded again).
+    """
+
+    def __init__(self, fetch: PageFetcher, start_page: int = 1):
+        self._fetch = fetch
+        self._cursor = _PageCursor(start_page)
+        self._sessions: Iterator[SessionBase] = iter(())
+        self._fetched = False
+        self._done = False
+
+    @property
+    def page(self) -> int:
+        return self._cursor.page
+
+    def __iter__(self) -> SessionIterator:
+        return self
+
+    def __next__(self) -> SessionBase:
+        while True:
+            session = next(self._sessions, None)
+            if session is not None:
+                return session
+            if self._done:
+                raise StopIteration
+            if self._fetched:
+                self._cursor.page += 1
+            response = self._fetch(self._cursor.page)
+            self._fetched = True
+            self._sessions = iter(self._cursor.accept(response))
+            self._done = not response.pagination.has_next_page or not response.sessions
+
+
+class AsyncSessionIterator:
+    """
+    Lazily yields sessions, fetching up to `prefetch` pages ahead concurrently.
+
+    The first page is fetched alone to learn `totalPages`; after that up to
+    `prefetch` pages are in flight or buffered, so memory stays bounded by
+    `prefetch * limit` sessions. `page` works as in `SessionIterator`. Call
+    `aclose()` (or break out of an `async for` inside `aclosing`) to cancel
+    pending fetches early.
+    """
+
+    def __init__(self, fetch: AsyncPageFetcher, start_page: int = 1, prefetch: int = DEFAULT_PREFETCH):
+        self._fetch = fetch
+        self._cursor = _PageCursor(start_page)
+        self._prefetch = max(1, prefetch)
+        self._pending: deque[asyncio.Task[SessionsPaginatedResponse]] = deque()
+        self._next_page = start_page
+        self._total_pages: int | None = None
+        self._sessions: Iterator[SessionBase] = iter(())
+        self._done = False
+
+    @property
+    def page(self) -> int:
+        return self._cursor.page
+
+    def __aiter__(self) -> AsyncSessionIterator:
+        return self
+
+    def _schedule(self) -> None:
+        if self._total_pages is None:
+            last_page, limit = self._next_page, 1
+        else:
+            last_page, limit = self._total_pages, self._prefetch
+        while len(self._pending) < limit and self._next_page <= last_page:
+            self._pending.append(asyncio.ensure_future(self._fetch(self._next_page)))
+            self._next_page += 1
+
+    async def __anext__(self) -> SessionBase:
+        while True:
+            session = next(self._sessions, None)
+            if session is not None:
+                return session
+            if self._done:
+                raise StopAsyncIteration
+            self._schedule()
+            if not self._pending:
+                self._done = True
+                raise StopAsyncIteration
+            try:
+                response = await self._pending.popleft()
+            except BaseException:
+                await self.aclose()
+                raise
+            pagination = response.pagination
+            self._cursor.page = pagination.page
+            self._sessions = iter(self._cursor.accept(response))
+            if not pagination.has_next_page or not response.sessions:
+                self._done = True
+                await self.aclose()
+            else:
+                # Sessions created mid-iteration can add pages beyond the first count
+                self._total_pages = max(pagination.total_pages, pagination.page + 1)
+
+    async def aclose(self) -> None:
+        """Cancels prefetched pages that have not been consumed."""
+        pending, self._pending = list(self._pending), deque()
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+import httpx
+
+# Methods that can be repeated without changing the result
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Errors raised before the request reached the server - safe to retry for any method
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryEvent:
+    """Passed to `RetryPolicy.on_retry` before each retry."""
+
+    method: str
+    path: str
+    attempt: int
+    delay: float
+    elapsed: float
+    status_code: int | None = None
+    error: Exception | None = None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how to retry failed requests.
+
+    Retries use exponential backoff (`backoff_base * 2**attempt`, capped at
+    `backoff_max`) with full jitter, or the server's `Retry-After` when given.
+
+    Safety rules:
+    - Connection failures where nothing was sent, and 429 responses, are
+      retried for every method.
+    - Other transport errors and `retry_statuses` are retried only for
+      idempotent methods (GET, HEAD, OPTIONS, PUT, DELETE) and for requests
+      carrying an `Idempotency-Key` (e.g. `create_run`, `create_session`).
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    max_retry_after: float = 60.0
+    on_retry: Callable[[RetryEvent], None] | None = None
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def retry_after(self, response: httpx.Response) -> float | None:
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), self.max_retry_after)
+
+    def response_delay(self, attempt: int, response: httpx.Response, idempotent: bool) -> float | None:
+        """Returns how long to wait before retrying `response`, or None to give up."""
+        if attempt >= self.max_retries or response.status_code not in self.retry_statuses:
+            return None
+        if not idempotent and response.status_code != 429:
+            return None
+        retry_after = self.retry_after(response)
+        return retry_after if retry_after is not None else self.backoff(attempt)
+
+    def error_delay(self, attempt: int, error: httpx.TransportError, idempotent: bool) -> float | None:
+        """Returns how long to wait before retrying after `error`, or None to give up."""
+        if attempt >= self.max_retries:
+            return None
+        if not idempotent and not isinstance(error, _UNSENT_ERRORS):
+            return None
+        return self.backoff(attempt)
+
+
+@dataclass
+class RetryStats:
+    """Counters shared by every client using the same connection pool."""
+
+    requests: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    retry_wait: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.retry_wait += delay
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+
+DEFAULT_RETRY = RetryPolicy()
+NO_RETRY = RetryPolicy(max_retries=0)
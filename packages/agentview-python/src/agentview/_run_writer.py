@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .errors import AgentViewError
+from .models import Run, Status
+
+if TYPE_CHECKING:
+    from .client import AgentView
+
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_MAX_BATCH_ITEMS = 50
+
+_UNSET: Any = object()
+
+
+def _retryable(error: BaseException) -> bool:
+    """Whether sending the same changes later may succeed: transport errors, 429s and 5xx responses."""
+    if isinstance(error, AgentViewError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+class _Batch:
+    """Pending changes to a run, coalesced into a single `update_run` body."""
+
+    def __init__(self) -> None:
+        self.items: list[dict[str, Any]] = []
+        self.metadata: dict[str, Any] = {}
+        self.state: Any = _UNSET
+
+    def __bool__(self) -> bool:
+        return bool(self.items or self.metadata) or self.state is not _UNSET
+
+    def to_kwargs(self) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {}
+        if self.items:
+            kwargs["items"] = self.items
+        if self.metadata:
+            kwargs["metadata"] = self.metadata
+        if self.state is not _UNSET:
+            kwargs["state"] = self.state
+        return kwargs
+
+
+class _BaseRunWriter:
+    def __init__(
+        self,
+        client: AgentView,
+        run: Run,
+        flush_interval: float,
+        max_batch_items: int,
+        keep_alive: bool,
+    ):
+        self._client = client
+        self._keep_alive = keep_alive
+        if keep_alive:
+            client.start_keep_alive(run)
+        self.run = run
+        self.flush_interval = flush_interval
+        self.max_batch_items = max_batch_items
+        self._batch = _Batch()
+        self._finished = False
+        self._error: BaseException | None = None
+        # Set after a flush failed with an error that resending won't fix;
+        # background flushes then wait for the next write
+        self._paused = False
+
+    @property
+    def id(self) -> str:
+        return self.run.id
+
+    def _check(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        if self._finished:
+            raise RuntimeError(f"Run {self.run.id} writer is already finished")
+
+    def _take(self) -> _Batch:
+        batch, self._batch = self._batch, _Batch()
+        return batch
+
+    def _restore(self, batch: _Batch) -> None:
+        """Puts a batch that failed to send back in front of changes buffered since."""
+        pending = self._batch
+        batch.items.extend(pending.items)
+        batch.metadata.update(pending.metadata)
+        if pending.state is not _UNSET:
+            batch.state = pending.state
+        self._batch = batch
+
+    def _failed(self, batch: _Batch, error: BaseException) -> None:
+        self._restore(batch)
+        self._paused = not _retryable(error)
+
+    def _buffer(self, items: list[dict[str, Any]], metadata: dict[str, Any] | None, state: Any) -> bool:
+        """Buffers changes; returns True when the batch reached `max_batch_items`."""
+        self._check()
+        self._paused = False
+        self._batch.items.extend(items)
+        if metadata:
+            self._batch.metadata.update(metadata)
+        if state is not _UNSET:
+            self._batch.state = state
+        return len(self._batch.items) >= self.max_batch_items
+
+    def _stop_keep_alive(self) -> None:
+        if self._keep_alive:
+            self._client.stop_keep_alive(self.run)
+
+    @staticmethod
+    def _finish_kwargs(batch: _Batch, status: Status, fail_reason: Any) -> dict[str, Any]:
+        kwargs = batch.to_kwargs()
+        kwargs["status"] = status
+        if fail_reason is not None:
+            kwargs["fail_reason"] = fail_reason
+        return kwargs
+
+
+class RunWriter(_BaseRunWriter):
+    """
+    Buffers items, state and metadata changes to a run and sends them as one
+    coalesced `update_run`.
+
+    A background thread flushes the buffer `flush_interval` seconds after the
+    first buffered change, or as soon as `max_batch_items` items are pending.
+    `flush()`, `close()` and `finish()` flush synchronously. Errors from
+    background flushes are raised from the next call on the writer.
+
+    A failed flush keeps its changes for the next one. Background flushes
+    retry them every `flush_interval` while the error may be transient
+    (transport errors, 429 and 5xx responses); after any other error, such as
+    a 404 or 422, they wait for the next write.
+
+    Used as a context manager, the writer is closed on exit, or finished as
+    `failed` if the block raised.
+    """
+
+    def __init__(
+        self,
+        client: AgentView,
+        run: Run,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch_items: int = DEFAULT_MAX_BATCH_ITEMS,
+        keep_alive: bool = False,
+    ):
+        super().__init__(client, run, flush_interval, max_batch_items, keep_alive)
+        self._cond = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._flush_now = False
+        self._thread: threading.Thread | None = None
+
+    def append(self, *items: dict[str, Any]) -> None:
+        self.write(items=list(items))
+
+    def set_state(self, state: Any) -> None:
+        self.write(state=state)
+
+    def update_metadata(self, metadata: dict[str, Any]) -> None:
+        self.write(metadata=metadata)
+
+    def write(
+        self,
+        *,
+        items: list[dict[str, Any]] | None = None,
+        metadata: dict[str, Any] | None = None,
+        state: Any = _UNSET,
+    ) -> None:
+        with self._cond:
+            full = self._buffer(items or [], metadata, state)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run_loop, name=f"agentview-run-{self.run.id}", daemon=True
+                )
+                self._thread.start()
+            if full:
+                self._flush_now = True
+            self._cond.notify()
+
+    def flush(self) -> Run:
+        """Sends all buffered changes now."""
+        with self._cond:
+            self._check()
+        self._send()
+        with self._cond:
+            self._check()
+        return self.run
+
+    def finish(self, status: Status = Status.COMPLETED, fail_reason: Any = None) -> Run:
+        """Flushes buffered changes together with the final status and stops the writer."""
+        with self._send_lock:
+            with self._cond:
+                self._check()
+                self._finished = True
+                batch = self._take()
+                self._cond.notify()
+            try:
+                self.run = self._client.update_run(
+                    self.run.id, **self._finish_kwargs(batch, status, fail_reason)
+                )
+            except BaseException as error:
+                # The run is still open: keep the changes for another finish() or close()
+                with self._cond:
+                    self._failed(batch, error)
+                    self._finished = False
+                raise
+            self._stop_keep_alive()
+        self._join()
+        return self.run
+
+    def close(self) -> None:
+        """Flushes buffered changes and stops the background thread, leaving the run's status as is."""
+        if self._finished:
+            return
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._finished = True
+                self._cond.notify()
+            self._stop_keep_alive()
+            self._join()
+
+    def _send(self) -> None:
+        with self._send_lock:
+            with self._cond:
+                batch = self._take()
+                self._flush_now = False
+            if batch:
+                try:
+                    self.run = self._client.update_run(self.run.id, **batch.to_kwargs())
+                except BaseException as error:
+                    with self._cond:
+                        self._failed(batch, error)
+                    raise
+
+    def _run_loop(self) -> None:
+        while True:
+            with self._cond:
+                while (not self._batch or self._paused) and not self._finished:
+                    self._cond.wait()
+                deadline = time.monotonic() + self.flush_interval
+                while not self._finished and not self._flush_now:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._finished:
+                    return
+            try:
+                self._send()
+            except Exception as error:
+                with self._cond:
+                    self._error = error
+            else:
+                # A retry got the changes through
+                with self._cond:
+                    self._error = None
+
+    def _join(self) -> None:
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __enter__(self) -> RunWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._finished:
+            return
+        if exc is not None:
+            self.finish(Status.FAILED, fail_reason={"message": str(exc)})
+        else:
+            self.close()
+
+
+class AsyncRunWriter(_BaseRunWriter):
+    """
+    Asyncio variant of `RunWriter`, with the same flushing and error
+    handling. Background flushes run in a task on the current event loop.
+    """
+
+    def __init__(
+        self,
+        client: AgentView,
+        run: Run,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch_items: int = DEFAULT_MAX_BATCH_ITEMS,
+        keep_alive: bool = False,
+    ):
+        super().__init__(client, run, flush_interval, max_batch_items, keep_alive)
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    def append(self, *items: dict[str, Any]) -> None:
+        self.write(items=list(items))
+
+    def set_state(self, state: Any) -> None:
+        self.write(state=state)
+
+    def update_metadata(self, metadata: dict[str, Any]) -> None:
+        self.write(metadata=metadata)
+
+    def write(
+        self,
+        *,
+        items: list[dict[str, Any]] | None = None,
+        metadata: dict[str, Any] | None = None,
+        state: Any = _UNSET,
+    ) -> None:
+        if self._buffer(items or [], metadata, state):
+            self._full.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run_loop())
+        self._wakeup.set()
+
+    async def flush(self) -> Run:
+        """Sends all buffered changes now."""
+        self._check()
+        await self._send()
+        self._check()
+        return self.run
+
+    async def finish(self, status: Status = Status.COMPLETED, fail_reason: Any = None) -> Run:
+        """Flushes buffered changes together with the final status and stops the writer."""
+        async with self._send_lock:
+            self._check()
+            self._stop()
+            batch = self._take()
+            try:
+                self.run = await self._client.aupdate_run(
+                    self.run.id, **self._finish_kwargs(batch, status, fail_reason)
+                )
+            except BaseException as error:
+                # The run is still open: keep the changes for another finish() or close()
+                self._failed(batch, error)
+                self._finished = False
+                raise
+            self._stop_keep_alive()
+        await self._join()
+        return self.run
+
+    async def close(self) -> None:
+        """Flushes buffered changes and stops the background task, leaving the run's status as is."""
+        if self._finished:
+            return
+        try:
+            await self.flush()
+        finally:
+            self._stop()
+            self._stop_keep_alive()
+            await self._join()
+
+    def _stop(self) -> None:
+        self._finished = True
+        self._wakeup.set()
+        self._full.set()
+
+    async def _send(self) -> None:
+        async with self._send_lock:
+            batch = self._take()
+            self._full.clear()
+            if batch:
+                try:
+                    self.run = await self._client.aupdate_run(self.run.id, **batch.to_kwargs())
+                except BaseException as error:
+                    self._failed(batch, error)
+                    if not self._paused:
+                        # Retried by the background task after another flush_interval
+                        self._wakeup.set()
+                    raise
+
+    async def _run_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self._finished:
+                return
+            if not self._full.is_set():
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            if self._finished:
+                return
+            try:
+                await self._send()
+            except Exception as error:
+                self._error = error
+            else:
+                # A retry got the changes through
+                self._error = None
+
+    async def _join(self) -> None:
+        task = self._task
+        if task is not None and task is not asyncio.current_task():
+            await task
+
+    async def __aenter__(self) -> AsyncRunWriter:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._finished:
+            return
+        if exc is not None:
+            await self.finish(Status.FAILED, fail_reason={"message": str(exc)})
+        else:
+            await self.close()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+
+DEFAULT_MAX_SCOPED_CLIENTS = 256
+
+_ClientT = TypeVar("_ClientT")
+
+
+class ScopedClients(Generic[_ClientT]):
+    """
+    LRU of the user-scoped clients `as_()` has built, by user token, so a
+    client serving many end users reuses one scoped client per frequent user
+    instead of building a new one on every call. `max_size` 0 disables it.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SCOPED_CLIENTS):
+        self.max_size = max_size
+        self._clients: OrderedDict[str, _ClientT] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self, token: str, build: Callable[[str], _ClientT]) -> _ClientT:
+        if self.max_size <= 0:
+            return build(token)
+        with self._lock:
+            client = self._clients.get(token)
+            if client is not None:
+                self._clients.move_to_end(token)
+                return client
+        # Scoped clients are cheap and interchangeable, so a concurrent build
+        # for the same token only wastes the loser's
+        client = build(token)
+        with self._lock:
+            client = self._clients.setdefault(token, client)
+            self._clients.move_to_end(token)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar
+
+from pydantic import BaseModel
+
+from ._construct import validate_model
+from ._timestamps import TimestampMode
+from .models import Run, Session, SessionItem
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+Parse = Callable[[type[_ModelT], Any], _ModelT]
+
+# Maps API (camelCase) keys to Run field names, e.g. "finishedAt" -> "finished_at".
+_RUN_FIELDS = {field.alias or name: name for name, field in Run.model_fields.items()}
+_run_validator = Run.__pydantic_validator__
+
+
+class _RunState:
+    """A run whose items can be appended and fields patched without revalidating the run."""
+
+    __slots__ = ("run", "items", "_view")
+
+    def __init__(self, run: Run):
+        self.run = run
+        self.items = list(run.session_items)
+        self._view: Run | None = run
+
+    def patch(self, fields: dict[str, Any], context: dict[str, Any] | None) -> None:
+        run = self.run.model_copy()
+        for key, value in fields.items():
+            name = _RUN_FIELDS.get(key)
+            if name is not None and name != "session_items":
+                _run_validator.validate_assignment(run, name, value, context=context)
+        self.run = run
+        self._view = None
+
+    def append(self, items: list[SessionItem]) -> None:
+        self.items.extend(items)
+        self._view = None
+
+    def view(self) -> Run:
+        if self._view is None:
+            self._view = self.run.model_copy(update={"session_items": list(self.items)})
+        return self._view
+
+
+class SessionState:
+    """
+    Incrementally maintained session.
+
+    Runs and items are indexed by id. `run.updated` deltas are applied in
+    O(delta): new items are validated one by one and run fields are patched
+    individually, instead of revalidating the whole `Session`. `Session` and
+    `Run` objects are only built when read, and are cached until the next
+    change to the runs they contain.
+
+    `parse` builds models from API JSON and `timestamps` sets how patched
+    timestamp fields are represented; pass a client's settings so streamed
+    sessions match fetched ones.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        parse: Parse[Any] = validate_model,
+        timestamps: TimestampMode = "datetime",
+    ):
+        self._parse = parse
+        self._context = None if timestamps == "datetime" else {"timestamps": timestamps}
+        self._base = session
+        self._runs: dict[str, _RunState] = {}
+        self._items: dict[str, SessionItem] = {}
+        self._session: Session | None = session
+        self.reset(session)
+
+    @classmethod
+    def from_json(
+        cls, data: Any, *, parse: Parse[Any] = validate_model, timestamps: TimestampMode = "datetime"
+    ) -> SessionState:
+        return cls(parse(Session, data), parse=parse, timestamps=timestamps)
+
+    @property
+    def id(self) -> str:
+        return self._base.id
+
+    @property
+    def session(self) -> Session:
+        """The current state as a `Session`, built lazily."""
+        if self._session is None:
+            runs = [run.view() for run in self._runs.values()]
+            self._session = self._base.model_copy(update={"runs": runs})
+        return self._session
+
+    @property
+    def runs(self) -> list[Run]:
+        return [run.view() for run in self._runs.values()]
+
+    @property
+    def last_run(self) -> Run | None:
+        if not self._runs:
+            return None
+        return next(reversed(self._runs.values())).view()
+
+    def get_run(self, id: str) -> Run | None:
+        run = self._runs.get(id)
+        return run.view() if run is not None else None
+
+    def get_item(self, id: str) -> SessionItem | None:
+        return self._items.get(id)
+
+    def apply(self, event: str, data: Any) -> None:
+        """Applies a session stream event (`session.snapshot` or `run.updated`)."""
+        if event == "session.snapshot":
+            self.reset(self._parse(Session, data))
+        elif event == "run.updated":
+            self.apply_run_updated(data)
+
+    def reset(self, session: Session) -> None:
+        """Replaces the whole state with a freshly fetched session."""
+        self._base = session
+        self._runs = {}
+        self._items = {}
+        for run in session.runs:
+            self._add(run)
+        self._session = session
+
+    def apply_run_updated(self, data: dict[str, Any]) -> Run:
+        """
+        Applies a `run.updated` delta: `sessionItems` are appended, other keys
+        patch the run. A delta for an unknown run must carry a full run.
+        """
+        run = self._runs.get(data["id"])
+        if run is None:
+            return self.upsert_run(self._parse(Run, data))
+
+        new_items = [
+            self._parse(SessionItem, item)
+            for item in data.get("sessionItems") or ()
+            if item["id"] not in self._items
+        ]
+        fields = {key: value for key, value in data.items() if key not in ("id", "sessionItems")}
+        if fields:
+            run.patch(fields, self._context)
+        if new_items:
+            run.append(new_items)
+            self._items.update((item.id, item) for item in new_items)
+        self._session = None
+        return run.view()
+
+    def upsert_run(self, run: Run) -> Run:
+        """Adds a run, or replaces an existing one with the same id (e.g. from `update_run`)."""
+        previous = self._runs.get(run.id)
+        if previous is not None:
+            for item in previous.items:
+                self._items.pop(item.id, None)
+        self._add(run)
+        self._session = None
+        return run
+
+    def _add(self, run: Run) -> None:
+        self._runs[run.id] = _RunState(run)
+        self._items.update((item.id, item) for item in run.session_items)
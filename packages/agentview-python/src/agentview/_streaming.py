@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Iterator
+
+import httpx
+
+from ._construct import validate_model
+from ._http import HTTPClient
+from ._json import JSONCodec
+from ._session_state import Parse, SessionState
+from ._timestamps import TimestampMode
+from .models import Session
+
+DEFAULT_RECONNECT_DELAY = 1.0
+DEFAULT_MAX_RECONNECTS = 5
+
+
+@dataclass
+class ServerSentEvent:
+    """A single event parsed from a `text/event-stream` response."""
+
+    event: str = "message"
+    data: str = ""
+    id: str | None = None
+    retry: int | None = None
+
+    def json(self) -> Any:
+        return json.loads(self.data) if self.data else None
+
+
+@dataclass
+class SSEDecoder:
+    """
+    Incremental Server-Sent Events decoder.
+
+    Feed it one line at a time (without the trailing newline); it returns an
+    event whenever a blank line terminates one.
+    """
+
+    _event: str | None = None
+    _data: list[str] = field(default_factory=lambda: [])
+    _id: str | None = None
+    _retry: int | None = None
+
+    def decode(self, line: str) -> ServerSentEvent | None:
+        if not line:
+            if self._event is None and not self._data and self._retry is None:
+                return None
+            event = ServerSentEvent(
+                event=self._event or "message",
+                data="\n".join(self._data),
+                id=self._id,
+                retry=self._retry,
+            )
+            self._event = None
+            self._data = []
+            self._retry = None
+            return event
+
+        if line.startswith(":"):
+            return None
+
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        elif name == "id":
+            if "\0" not in value:
+                self._id = value
+        elif name == "retry":
+            if value.isdigit():
+                self._retry = int(value)
+        return None
+
+
+@dataclass
+class SessionStreamEvent:
+    """
+    An event from a session stream.
+
+    `session` is built lazily from the stream's `SessionState`, so it reflects
+    every event received up to the moment it is first read.
+    """
+
+    type: str
+    data: Any
+    state: SessionState
+
+    @property
+    def session(self) -> Session:
+        return self.state.session
+
+
+class _SessionStream:
+    """Shared state for the sync and async session stream loops."""
+
+    def __init__(
+        self,
+        id: str,
+        wait: bool,
+        reconnect: bool,
+        max_reconnects: int,
+        reconnect_delay: float,
+        codec: JSONCodec,
+        parse: Parse[Any],
+        timestamps: TimestampMode,
+    ):
+        self.codec = codec
+        self.parse = parse
+        self.timestamps: TimestampMode = timestamps
+        self.path = f"/api/sessions/{id}/stream"
+        self.session_path = f"/api/sessions/{id}"
+        self.wait = wait
+        self.reconnect = reconnect
+        self.max_reconnects = max_reconnects
+        self.reconnect_delay = reconnect_delay
+        self.state: SessionState | None = None
+        self.failures = 0
+
+    @property
+    def params(self) -> dict[str, Any] | None:
+        return {"wait": "true"} if self.wait else None
+
+    def handle(self, sse: ServerSentEvent) -> SessionStreamEvent | None:
+        self.failures = 0
+        if sse.retry is not None:
+            self.reconnect_delay = sse.retry / 1000
+        data = self.codec.loads(sse.data.encode()) if sse.data else None
+
+        if sse.event == "session.snapshot" and self.state is None:
+            self.state = self._new_state(data)
+        elif self.state is not None:
+            self.state.apply(sse.event, data)
+
+        if self.state is None:
+            return None
+        return SessionStreamEvent(type=sse.event, data=data, state=self.state)
+
+    def snapshot(self, data: Any) -> SessionStreamEvent:
+        """Turns a plain GET of the session into a synthetic snapshot event."""
+        if self.state is None:
+            self.state = self._new_state(data)
+        else:
+            self.state.apply("session.snapshot", data)
+        return SessionStreamEvent(type="session.snapshot", data=data, state=self.state)
+
+    def _new_state(self, data: Any) -> SessionState:
+        return SessionState.from_json(data, parse=self.parse, timestamps=self.timestamps)
+
+    def should_reconnect(self) -> bool:
+        self.failures += 1
+        return self.reconnect and self.failures <= self.max_reconnects
+
+
+def iter_session_stream(
+    http: HTTPClient,
+    id: str,
+    *,
+    wait: bool = False,
+    reconnect: bool = True,
+    max_reconnects: int = DEFAULT_MAX_RECONNECTS,
+    reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+    parse: Parse[Any] = validate_model,
+    timestamps: TimestampMode = "datetime",
+    decode: Callable[[bytes], Any] | None = None,
+) -> Iterator[SessionStreamEvent]:
+    """
+    Streams a session's events. `parse`, `timestamps` and `decode` are the
+    client's model construction settings and `Session` response decoder.
+    """
+    state = _SessionStream(id, wait, reconnect, max_reconnects, reconnect_delay, http.codec, parse, timestamps)
+    reconnecting = False
+
+    while True:
+        try:
+            with http.stream("GET", state.path, params=state.params) as response:
+                if response.status_code == 204:
+                    # Run finished while we were disconnected - emit its final state.
+                    if reconnecting:
+                        yield state.snapshot(http.request("GET", state.session_path, decode=decode))
+                    return
+
+                decoder = SSEDecoder()
+                for line in response.iter_lines():
+                    sse = decoder.decode(line)
+                    if sse is not None:
+                        event = state.handle(sse)
+                        if event is not None:
+                            yield event
+            return
+        except httpx.TransportError:
+            if not state.should_reconnect():
+                raise
+        reconnecting = True
+        time.sleep(state.reconnect_delay)
+
+
+async def aiter_session_stream(
+    http: HTTPClient,
+    id: str,
+    *,
+    wait: bool = False,
+    reconnect: bool = True,
+    max_reconnects: int = DEFAULT_MAX_RECONNECTS,
+    reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+    parse: Parse[Any] = validate_model,
+    timestamps: TimestampMode = "datetime",
+    decode: Callable[[bytes], Any] | None = None,
+) -> AsyncIterator[SessionStreamEvent]:
+    state = _SessionStream(id, wait, reconnect, max_reconnects, reconnect_delay, http.codec, parse, timestamps)
+    reconnecting = False
+
+    while True:
+        try:
+            async with http.astream("GET", state.path, params=state.params) as response:
+                if response.status_code == 204:
+                    if reconnecting:
+                        yield state.snapshot(await http.arequest("GET", state.session_path, decode=decode))
+                    return
+
+                decoder = SSEDecoder()
+                async for line in response.aiter_lines():
+                    sse = decoder.decode(line)
+                    if sse is not None:
+                        event = state.handle(sse)
+                        if event is not None:
+                            yield event
+            return
+        except httpx.TransportError:
+            if not state.should_reconnect():
+                raise
+        reconnecting = True
+        await asyncio.sleep(state.reconnect_delay)
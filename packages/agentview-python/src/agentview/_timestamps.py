@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Callable, Literal
+
+TimestampMode = Literal["datetime", "str", "epoch"]
+"""
+How timestamp fields are represented on models: parsed `datetime`s (the
+default), the raw strings the API sent, or POSIX epoch seconds as floats.
+"""
+
+TIMESTAMP_CACHE_SIZE = 4096
+
+# Postgres renders timestamptz as '2025-12-11 08:25:10.144334+00', with
+# anything from no fraction to microseconds and offsets of the form +HH,
+# +HH:MM or +HH:MM:SS. ISO 8601 variants ('T', 'Z', +HHMM) are accepted too.
+_TIMESTAMP = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:[.,](\d{1,6})\d*)?"
+    r"(?:(Z)|([+-])(\d{2})(?::?(\d{2}))?(?::?(\d{2}))?)?"
+)
+
+_zones: dict[tuple[str, str, str | None, str | None], timezone] = {}
+
+
+def _zone(sign: str, hours: str, minutes: str | None, seconds: str | None) -> timezone:
+    key = (sign, hours, minutes, seconds)
+    zone = _zones.get(key)
+    if zone is None:
+        offset = timedelta(hours=int(hours), minutes=int(minutes or 0), seconds=int(seconds or 0))
+        zone = timezone.utc if not offset else timezone(-offset if sign == "-" else offset)
+        _zones[key] = zone
+    return zone
+
+
+def _parse_slow(value: str) -> datetime:
+    match = _TIMESTAMP.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Cannot parse datetime from {value}")
+    year, month, day, hour, minute, second, fraction, z, sign, oh, om, os = match.groups()
+    if z:
+        tzinfo: timezone | None = timezone.utc
+    elif sign:
+        tzinfo = _zone(sign, oh, om, os)
+    else:
+        tzinfo = None
+    return datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        int(fraction.ljust(6, "0")) if fraction else 0,
+        tzinfo=tzinfo,
+    )
+
+
+if sys.version_info >= (3, 11):
+
+    def _parse(value: str) -> datetime:
+        # 3.11's C parser handles every Postgres form above; the regex only
+        # sees what it rejects (e.g. more than 6 fractional digits)
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return _parse_slow(value)
+
+else:
+    _parse = _parse_slow
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parses an API timestamp. Results are memoized, since large sessions repeat
+    the same timestamps many times; datetimes are immutable, so sharing is safe.
+    """
+    return _parse(value)
+
+
+def timestamp_to_epoch(value: str) -> float:
+    """Parses an API timestamp to POSIX seconds. Timestamps without an offset are taken as UTC."""
+    parsed = parse_timestamp(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def timestamp_converter(mode: TimestampMode) -> Callable[[str], Any] | None:
+    """The conversion applied to timestamp strings in `mode`, or None to keep them as is."""
+    if mode == "datetime":
+        return parse_timestamp
+    if mode == "epoch":
+        return timestamp_to_epoch
+    if mode == "str":
+        return None
+    raise ValueError(f"Unknown timestamp mode: {mode!r}")
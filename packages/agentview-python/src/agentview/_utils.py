@@ -24,6 +24,9 @@ def with_model(model_class: type[BaseModel], param_name: str = "options") -> Cal
 
         # Can be called as:
         client.create_user(external_id="test")
+
+        # or with a ready-made model:
+        client.create_user(options=UserCreate(external_id="test"))
     """
 
     def decorator(func: F) -> F:
@@ -56,24 +59,34 @@ def with_model(model_class: type[BaseModel], param_name: str = "options") -> Cal
 
         new_sig = sig.replace(parameters=new_params)
 
+        # Precomputed once per decorated method rather than on every call
+        field_names = frozenset(model_class.model_fields)
+        # Same as `model_class(**values)`, without going through `__init__`
+        validate = model_class.__pydantic_validator__.validate_python
+        # A model passed positionally lands at this index of `args`
+        position = list(sig.parameters).index(param_name)
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Separate model fields from other kwargs
+            # A model instance passed directly is used as is
+            if param_name in kwargs or len(args) > position:
+                return func(*args, **kwargs)
+            if not kwargs:
+                return func(*args, **{param_name: None})
+
+            # Separate model fields from other kwargs, dropping None fields
             model_kwargs: dict[str, Any] = {}
             other_kwargs: dict[str, Any] = {}
-            model_field_names = set(model_class.model_fields.keys())
-
             for k, v in kwargs.items():
-                if k in model_field_names:
-                    if v is not None:  # Only include non-None values
+                if k in field_names:
+                    if v is not None:
                         model_kwargs[k] = v
                 else:
                     other_kwargs[k] = v
 
-            # Create model instance if we have any fields, otherwise None
-            model_instance = model_class(**model_kwargs) if model_kwargs else None
-
-            # Call original function with model instance
+            # Validated straight into a model; request bodies are then encoded
+            # from it without an intermediate dict
+            model_instance = validate(model_kwargs) if model_kwargs else None
             return func(*args, **{param_name: model_instance, **other_kwargs})
 
         wrapper.__signature__ = new_sig  # type: ignore
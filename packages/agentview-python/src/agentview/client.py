@@ -1,28 +1,258 @@
 from __future__ import annotations
 
-from typing import Any, Literal, overload
-
-from ._http import HTTPClient
+import copy
+import uuid
+from types import TracebackType
+from typing import Any, AsyncIterator, Callable, Iterator, Literal, TypeVar, overload
+
+import httpx
+from pydantic import BaseModel
+
+from ._cache import ResponseCache
+from ._coalesce import CoalesceStats
+from ._compression import RequestCompression
+from ._construct import ModelParser, construct_model, validate_model
+from ._heartbeat import DEFAULT_KEEP_ALIVE_INTERVAL, RunHeartbeat
+from ._http import DEFAULT_LIMITS, DEFAULT_TIMEOUT, ConnectionPool, HTTPClient
+from ._instrumentation import Instrumentation
+from ._json import CodecOption
+from ._lazy import lazy_decoder
+from ._limits import RequestLimiter
+from ._pagination import DEFAULT_PREFETCH, AsyncSessionIterator, SessionIterator
+from ._retry import DEFAULT_RETRY, RetryPolicy, RetryStats
+from ._run_writer import DEFAULT_FLUSH_INTERVAL, DEFAULT_MAX_BATCH_ITEMS, AsyncRunWriter, RunWriter
+from ._scopes import DEFAULT_MAX_SCOPED_CLIENTS, ScopedClients
+from ._streaming import (
+    DEFAULT_MAX_RECONNECTS,
+    DEFAULT_RECONNECT_DELAY,
+    SessionStreamEvent,
+    aiter_session_stream,
+    iter_session_stream,
+)
+from ._timestamps import TimestampMode, timestamp_converter
 from ._utils import with_model
 from .models import (
-    Config,
+    CommentMessage,
+    Environment,
     Space,
     Run,
     RunCreate,
     RunUpdate,
+    Score,
     Session,
     SessionCreate,
     SessionUpdate,
     SessionsGetQueryParams,
     SessionsPaginatedResponse,
     PublicSessionsGetQueryParams,
+    Status,
     User,
     UserCreate,
 )
 
+_FINISHED_STATUSES = frozenset(
+    status.value for status in (Status.COMPLETED, Status.CANCELLED, Status.FAILED)
+)
+
+
+_ClientT = TypeVar("_ClientT", bound="_ClosableClient")
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+_SpacedT = TypeVar("_SpacedT", UserCreate, SessionCreate)
+
+
+def _make_pool(
+    timeout: float | httpx.Timeout | None,
+    limits: httpx.Limits,
+    http2: bool,
+    transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None,
+    retry: RetryPolicy | None,
+    limiter: RequestLimiter | None,
+    cache: ResponseCache | None = None,
+    json_codec: CodecOption = "auto",
+    instrumentation: Instrumentation | None = None,
+    coalesce_requests: bool = False,
+    compression: RequestCompression | None = None,
+) -> ConnectionPool:
+    return ConnectionPool(
+        timeout=timeout,
+        limits=limits,
+        http2=http2,
+        transport=transport if isinstance(transport, httpx.BaseTransport) else None,
+        async_transport=transport if isinstance(transport, httpx.AsyncBaseTransport) else None,
+        retry=retry,
+        limiter=limiter,
+        cache=cache,
+        json_codec=json_codec,
+        instrumentation=instrumentation,
+        coalesce=coalesce_requests,
+        compression=compression,
+    )
+
+
+def _model_parser(
+    trusted_responses: bool, timestamps: TimestampMode, instrumentation: Instrumentation | None
+) -> ModelParser:
+    build = construct_model if trusted_responses else validate_model
+    parse: ModelParser = build
+    if timestamps != "datetime":
+        timestamp_converter(timestamps)  # Rejects unknown modes up front
+
+        def parse_timestamps(model: type[_ModelT], data: Any) -> _ModelT:
+            return build(model, data, timestamps)
+
+        parse = parse_timestamps
+    if instrumentation is not None:
+        parse = instrumentation.wrap_parser(parse)
+    return parse
+
+
+def _start_page(options: SessionsGetQueryParams | PublicSessionsGetQueryParams | None) -> int:
+    return max(int(options.page), 1) if options is not None and options.page is not None else 1
+
+
+def _user_tags(data: Any) -> tuple[str, ...]:
+    return (f"user:{data['id']}",)
+
+
+def _session_tags(data: Any) -> tuple[str, ...] | None:
+    # Sessions with a run in progress change constantly; only cache settled ones
+    runs: list[Any] = data.get("runs") or []
+    if runs and runs[-1].get("status") not in _FINISHED_STATUSES:
+        return None
+    return (f"session:{data['id']}",)
+
+
+def _config_tags(data: Any) -> tuple[str, ...]:
+    return ("config",)
+
+
+def _idempotency_key(idempotency_key: str | None) -> str:
+    return idempotency_key if idempotency_key is not None else uuid.uuid4().hex
+
+
+class _ClosableClient:
+    """Context manager support for clients owning an HTTPClient."""
+
+    _http: HTTPClient
+    _parse: ModelParser = staticmethod(validate_model)
+    _lazy_content = False
+    _timestamps: TimestampMode = "datetime"
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Request and retry counters, shared with clients from `as_()`."""
+        return self._http.retry_stats
+
+    @property
+    def limiter(self) -> RequestLimiter | None:
+        """The request limiter, shared with clients from `as_()`."""
+        return self._http.limiter
+
+    @property
+    def coalesce_stats(self) -> CoalesceStats | None:
+        """Counts of GETs sent and joined to identical ones in flight, shared with clients from `as_()`."""
+        return self._http.coalesce_stats
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """The response cache, shared with clients from `as_()`. Use it for stats and invalidation."""
+        return self._http.cache
+
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """Request hooks and metrics, shared with clients from `as_()`."""
+        return self._http.instrumentation
+
+    def _decoder(self, model: type[BaseModel]) -> Callable[[bytes], Any] | None:
+        """How to decode responses for `model`: lazily with `lazy_content`, else with the codec."""
+        return lazy_decoder(model) if self._lazy_content else None
+
+    def _set_lazy_content(self, lazy_content: bool) -> None:
+        if lazy_content:
+            lazy_decoder(Session)  # Fails up front without msgspec
+        self._lazy_content = lazy_content
+
+    def close(self) -> None:
+        """Close pooled connections. Scoped clients from `as_()` leave the shared pool open."""
+        self._http.close()
+
+    async def aclose(self) -> None:
+        """Close pooled sync and async connections."""
+        await self._http.aclose()
+
+    async def aclose_loop(self) -> None:
+        """
+        Close the pooled connections opened on the running event loop, also
+        for scoped clients, leaving the client usable. Call it before a loop
+        you started (e.g. with `asyncio.run`) ends.
+        """
+        await self._http.aclose_loop()
+
+    def __enter__(self: _ClientT) -> _ClientT:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self: _ClientT) -> _ClientT:
+        return self
 
-class AgentView:
-    """Admin client using API key authentication."""
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+class AgentView(_ClosableClient):
+    """
+    Admin client using API key authentication.
+
+    Connections are pooled and kept alive across calls. Use the client as a
+    (async) context manager or call `close()`/`aclose()` when done.
+
+    With `trusted_responses=True`, API responses are turned into models
+    without re-validating them (see `construct_model`), which is much cheaper
+    for large sessions. Only use it against an API server you trust to send
+    well-formed data.
+
+    Request and response bodies are encoded with the fastest installed JSON
+    library (orjson, then msgspec, then the standard library). Pass
+    `json_codec` to pick one by name or to supply your own `JSONCodec`.
+
+    Pass an `Instrumentation` to time requests by phase, collect per-route
+    metrics, run hooks around each request or emit OpenTelemetry spans.
+
+    Timestamps are parsed to `datetime`s by default. For bulk analytics, pass
+    `timestamps="str"` to keep the API's raw strings or `timestamps="epoch"`
+    for POSIX seconds as floats; model fields then hold those instead.
+
+    With `lazy_content=True` (requires msgspec), item `content`, run
+    `metadata` and session `metadata`/`state` are kept as raw JSON slices of
+    the response and decoded on first access. Listing and filtering large
+    sessions then skips decoding transcripts nobody reads.
+
+    With `coalesce_requests=True`, identical GETs issued concurrently (same
+    path, params and credentials, from threads or coroutines on one event
+    loop) share a single request, each getting its own copy of the decoded
+    response. Writes end the sharing, so reads that start after a write see
+    its effect.
+
+    `as_()` keeps the `max_scoped_clients` most recently used user-scoped
+    clients, so a gateway acting for many end users reuses them instead of
+    building one per request; 0 builds a new one on every call.
+
+    Pass a `RequestCompression` to gzip or zstd-compress large request bodies,
+    such as runs carrying long transcripts. Compressed responses are
+    requested and decoded by httpx (zstd needs `agentview[zstd]`).
+    """
 
     def __init__(
         self,
@@ -30,30 +260,83 @@ class AgentView:
         api_key: str,
         user_token: str | None = None,
         space: Space | Literal["playground", "production", "shared-playground"] = "playground",
+        *,
+        timeout: float | httpx.Timeout | None = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        retry: RetryPolicy | None = DEFAULT_RETRY,
+        limiter: RequestLimiter | None = None,
+        cache: ResponseCache | None = None,
+        keep_alive_interval: float = DEFAULT_KEEP_ALIVE_INTERVAL,
+        trusted_responses: bool = False,
+        json_codec: CodecOption = "auto",
+        timestamps: TimestampMode = "datetime",
+        instrumentation: Instrumentation | None = None,
+        lazy_content: bool = False,
+        coalesce_requests: bool = False,
+        max_scoped_clients: int = DEFAULT_MAX_SCOPED_CLIENTS,
+        compression: RequestCompression | None = None,
     ):
-        self._http = HTTPClient(api_base_url, api_key, user_token)
+        pool = _make_pool(
+            timeout,
+            limits,
+            http2,
+            transport,
+            retry,
+            limiter,
+            cache,
+            json_codec,
+            instrumentation=instrumentation,
+            coalesce_requests=coalesce_requests,
+            compression=compression,
+        )
+        self._parse = _model_parser(trusted_responses, timestamps, instrumentation)
+        self._timestamps = timestamps
+        self._set_lazy_content(lazy_content)
+        self._http = HTTPClient(api_base_url, api_key, user_token, pool=pool)
         self._api_base_url = api_base_url
         self._api_key = api_key
         self._user_token = user_token
         self._space = Space(space) if isinstance(space, str) else space
+        self._heartbeat = RunHeartbeat(self, keep_alive_interval)
+        self._scopes: ScopedClients[AgentView] = ScopedClients(max_scoped_clients)
+
+    def close(self) -> None:
+        if self._http.owns_pool:
+            self._heartbeat.close()
+        super().close()
+
+    async def aclose(self) -> None:
+        if self._http.owns_pool:
+            self._heartbeat.close()
+        await super().aclose()
+
+    def _with_space(self, options: _SpacedT) -> _SpacedT:
+        """Fills in the client's space unless the options set one."""
+        if options.space is not None:
+            return options
+        return options.model_copy(update={"space": self._space})
 
     # --- User Methods ---
 
     @with_model(UserCreate)
-    def create_user(self, options: UserCreate | None = None) -> User:
-        body: dict[str, Any] = {"space": self._space.value}
-        if options:
-            body.update(options.model_dump(by_alias=True, exclude_none=True))
-        data = self._http.request("POST", "/api/users", json=body)
-        return User.model_validate(data)
+    def create_user(self, options: UserCreate | None = None, *, idempotency_key: str | None = None) -> User:
+        body = self._with_space(options or UserCreate())
+        data = self._http.request(
+            "POST", "/api/users", json=body, idempotency_key=_idempotency_key(idempotency_key)
+        )
+        return self._parse(User, data)
 
     @with_model(UserCreate)
-    async def acreate_user(self, options: UserCreate | None = None) -> User:
-        body: dict[str, Any] = {"space": self._space.value}
-        if options:
-            body.update(options.model_dump(by_alias=True, exclude_none=True))
-        data = await self._http.arequest("POST", "/api/users", json=body)
-        return User.model_validate(data)
+    async def acreate_user(
+        self, options: UserCreate | None = None, *, idempotency_key: str | None = None
+    ) -> User:
+        body = self._with_space(options or UserCreate())
+        data = await self._http.arequest(
+            "POST", "/api/users", json=body, idempotency_key=_idempotency_key(idempotency_key)
+        )
+        return self._parse(User, data)
 
     @overload
     def get_user(self) -> User: ...
@@ -75,22 +358,23 @@ class AgentView:
         external_id: str | None = None,
         space: Space | None = None,
     ) -> User:
+        ttl = self._cache_ttl("user_ttl")
         if id:
-            data = self._http.request("GET", f"/api/users/{id}")
+            data = self._http.cached_request(f"/api/users/{id}", ttl, _user_tags)
         elif token:
             if self._user_token and self._user_token != token:
                 raise ValueError(
                     "Cannot get user with token when scoped with another user's token"
                 )
-            data = self.as_(token)._http.request("GET", "/api/users/me")
+            data = self.as_(token)._http.cached_request("/api/users/me", ttl, _user_tags)
         elif external_id:
             space_val = (space or self._space).value
-            data = self._http.request(
-                "GET", f"/api/users/by-external-id/{external_id}?space={space_val}"
+            data = self._http.cached_request(
+                f"/api/users/by-external-id/{external_id}?space={space_val}", ttl, _user_tags
             )
         else:
-            data = self._http.request("GET", "/api/users/me")
-        return User.model_validate(data)
+            data = self._http.cached_request("/api/users/me", ttl, _user_tags)
+        return self._parse(User, data)
 
     @overload
     async def aget_user(self) -> User: ...
@@ -112,58 +396,137 @@ class AgentView:
         external_id: str | None = None,
         space: Space | None = None,
     ) -> User:
+        ttl = self._cache_ttl("user_ttl")
         if id:
-            data = await self._http.arequest("GET", f"/api/users/{id}")
+            data = await self._http.acached_request(f"/api/users/{id}", ttl, _user_tags)
         elif token:
             if self._user_token and self._user_token != token:
                 raise ValueError(
                     "Cannot get user with token when scoped with another user's token"
                 )
-            data = await self.as_(token)._http.arequest("GET", "/api/users/me")
+            data = await self.as_(token)._http.acached_request("/api/users/me", ttl, _user_tags)
         elif external_id:
             space_val = (space or self._space).value
-            data = await self._http.arequest(
-                "GET", f"/api/users/by-external-id/{external_id}?space={space_val}"
+            data = await self._http.acached_request(
+                f"/api/users/by-external-id/{external_id}?space={space_val}", ttl, _user_tags
             )
         else:
-            data = await self._http.arequest("GET", "/api/users/me")
-        return User.model_validate(data)
+            data = await self._http.acached_request("/api/users/me", ttl, _user_tags)
+        return self._parse(User, data)
 
     @with_model(UserCreate)
     def update_user(self, id: str, options: UserCreate | None = None) -> User:
-        body = options.model_dump(by_alias=True, exclude_none=True) if options else {}
-        data = self._http.request("PATCH", f"/api/users/{id}", json=body)
-        return User.model_validate(data)
+        data = self._http.request("PATCH", f"/api/users/{id}", json=options or {})
+        self._cache_user(id, data)
+        return self._parse(User, data)
 
     @with_model(UserCreate)
     async def aupdate_user(self, id: str, options: UserCreate | None = None) -> User:
-        body = options.model_dump(by_alias=True, exclude_none=True) if options else {}
-        data = await self._http.arequest("PATCH", f"/api/users/{id}", json=body)
-        return User.model_validate(data)
+        data = await self._http.arequest("PATCH", f"/api/users/{id}", json=options or {})
+        self._cache_user(id, data)
+        return self._parse(User, data)
+
+    def _cache_user(self, id: str, data: Any) -> None:
+        cache = self._http.cache
+        if cache is not None:
+            cache.invalidate_user(id)
+            self._http.cache_put(f"/api/users/{id}", data, cache.user_ttl, _user_tags(data))
 
     # --- Session Methods ---
 
     @with_model(SessionCreate)
-    def create_session(self, options: SessionCreate) -> Session:
-        body: dict[str, Any] = {"space": self._space.value}
-        body.update(options.model_dump(by_alias=True, exclude_none=True))
-        data = self._http.request("POST", "/api/sessions", json=body)
-        return Session.model_validate(data)
+    def create_session(self, options: SessionCreate, *, idempotency_key: str | None = None) -> Session:
+        body = self._with_space(options)
+        data = self._http.request(
+            "POST",
+            "/api/sessions",
+            json=body,
+            idempotency_key=_idempotency_key(idempotency_key),
+            decode=self._decoder(Session),
+        )
+        return self._parse(Session, data)
 
     @with_model(SessionCreate)
-    async def acreate_session(self, options: SessionCreate) -> Session:
-        body: dict[str, Any] = {"space": self._space.value}
-        body.update(options.model_dump(by_alias=True, exclude_none=True))
-        data = await self._http.arequest("POST", "/api/sessions", json=body)
-        return Session.model_validate(data)
+    async def acreate_session(self, options: SessionCreate, *, idempotency_key: str | None = None) -> Session:
+        body = self._with_space(options)
+        data = await self._http.arequest(
+            "POST",
+            "/api/sessions",
+            json=body,
+            idempotency_key=_idempotency_key(idempotency_key),
+            decode=self._decoder(Session),
+        )
+        return self._parse(Session, data)
 
     def get_session(self, id: str) -> Session:
-        data = self._http.request("GET", f"/api/sessions/{id}")
-        return Session.model_validate(data)
+        data = self._http.cached_request(
+            f"/api/sessions/{id}",
+            self._cache_ttl("session_ttl"),
+            _session_tags,
+            decode=self._decoder(Session),
+        )
+        return self._parse(Session, data)
 
     async def aget_session(self, id: str) -> Session:
-        data = await self._http.arequest("GET", f"/api/sessions/{id}")
-        return Session.model_validate(data)
+        data = await self._http.acached_request(
+            f"/api/sessions/{id}",
+            self._cache_ttl("session_ttl"),
+            _session_tags,
+            decode=self._decoder(Session),
+        )
+        return self._parse(Session, data)
+
+    def stream_session(
+        self,
+        id: str,
+        *,
+        wait: bool = False,
+        reconnect: bool = True,
+        max_reconnects: int = DEFAULT_MAX_RECONNECTS,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+    ) -> Iterator[SessionStreamEvent]:
+        """
+        Streams updates of a session's last run.
+
+        Yields a `session.snapshot` event first, then one event per `run.updated`
+        delta, each carrying the locally updated `Session`. Finishes when the run
+        does, or immediately if no run is in progress (unless `wait=True`).
+        Dropped connections are retried up to `max_reconnects` times in a row.
+        Stop early by breaking out of the loop.
+        """
+        return iter_session_stream(
+            self._http,
+            id,
+            wait=wait,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            reconnect_delay=reconnect_delay,
+            parse=self._parse,
+            timestamps=self._timestamps,
+            decode=self._decoder(Session),
+        )
+
+    def astream_session(
+        self,
+        id: str,
+        *,
+        wait: bool = False,
+        reconnect: bool = True,
+        max_reconnects: int = DEFAULT_MAX_RECONNECTS,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+    ) -> AsyncIterator[SessionStreamEvent]:
+        """Async variant of `stream_session`. Cancelling the consuming task closes the stream."""
+        return aiter_session_stream(
+            self._http,
+            id,
+            wait=wait,
+            reconnect=reconnect,
+            max_reconnects=max_reconnects,
+            reconnect_delay=reconnect_delay,
+            parse=self._parse,
+            timestamps=self._timestamps,
+            decode=self._decoder(Session),
+        )
 
     @with_model(SessionsGetQueryParams)
     def get_sessions(self, options: SessionsGetQueryParams | None = None) -> SessionsPaginatedResponse:
@@ -178,8 +541,10 @@ class AgentView:
                     params[k] = v.value
                 else:
                     params[k] = str(v)
-        data = self._http.request("GET", "/api/sessions", params=params)
-        return SessionsPaginatedResponse.model_validate(data)
+        data = self._http.request(
+            "GET", "/api/sessions", params=params, decode=self._decoder(SessionsPaginatedResponse)
+        )
+        return self._parse(SessionsPaginatedResponse, data)
 
     @with_model(SessionsGetQueryParams)
     async def aget_sessions(self, options: SessionsGetQueryParams | None = None) -> SessionsPaginatedResponse:
@@ -193,20 +558,57 @@ class AgentView:
                     params[k] = v.value
                 else:
                     params[k] = str(v)
-        data = await self._http.arequest("GET", "/api/sessions", params=params)
-        return SessionsPaginatedResponse.model_validate(data)
+        data = await self._http.arequest(
+            "GET", "/api/sessions", params=params, decode=self._decoder(SessionsPaginatedResponse)
+        )
+        return self._parse(SessionsPaginatedResponse, data)
+
+    @with_model(SessionsGetQueryParams)
+    def iter_sessions(self, options: SessionsGetQueryParams | None = None) -> SessionIterator:
+        """
+        Iterates over all matching sessions, fetching pages as needed.
+
+        `page` sets the first page; pass the iterator's `page` to resume.
+        """
+        query = options or SessionsGetQueryParams()
+        return SessionIterator(
+            lambda page: self.get_sessions(options=query.model_copy(update={"page": page})),
+            _start_page(options),
+        )
+
+    @with_model(SessionsGetQueryParams)
+    def aiter_sessions(
+        self, options: SessionsGetQueryParams | None = None, *, prefetch: int = DEFAULT_PREFETCH
+    ) -> AsyncSessionIterator:
+        """Async `iter_sessions`, fetching up to `prefetch` pages ahead concurrently."""
+        query = options or SessionsGetQueryParams()
+        return AsyncSessionIterator(
+            lambda page: self.aget_sessions(options=query.model_copy(update={"page": page})),
+            _start_page(options),
+            prefetch,
+        )
 
     @with_model(SessionUpdate)
     def update_session(self, id: str, options: SessionUpdate) -> Session:
-        body = options.model_dump(by_alias=True, exclude_none=True)
-        data = self._http.request("PATCH", f"/api/sessions/{id}", json=body)
-        return Session.model_validate(data)
+        data = self._http.request("PATCH", f"/api/sessions/{id}", json=options, decode=self._decoder(Session))
+        self._cache_session(id, data)
+        return self._parse(Session, data)
 
     @with_model(SessionUpdate)
     async def aupdate_session(self, id: str, options: SessionUpdate) -> Session:
-        body = options.model_dump(by_alias=True, exclude_none=True)
-        data = await self._http.arequest("PATCH", f"/api/sessions/{id}", json=body)
-        return Session.model_validate(data)
+        data = await self._http.arequest(
+            "PATCH", f"/api/sessions/{id}", json=options, decode=self._decoder(Session)
+        )
+        self._cache_session(id, data)
+        return self._parse(Session, data)
+
+    def _cache_session(self, id: str, data: Any) -> None:
+        cache = self._http.cache
+        if cache is not None:
+            cache.invalidate_session(id)
+            tags = _session_tags(data)
+            if tags is not None:
+                self._http.cache_put(f"/api/sessions/{id}", data, cache.session_ttl, tags)
 
     # --- Star Methods ---
 
@@ -228,84 +630,234 @@ class AgentView:
     async def ais_session_starred(self, session_id: str) -> dict[str, bool]:
         return await self._http.arequest("GET", f"/api/sessions/{session_id}/star")
 
+    # --- Score Methods ---
+
+    def get_session_scores(self, session_id: str) -> list[Score]:
+        data = self._http.request("GET", f"/api/sessions/{session_id}/scores")
+        return [self._parse(Score, score) for score in data]
+
+    async def aget_session_scores(self, session_id: str) -> list[Score]:
+        data = await self._http.arequest("GET", f"/api/sessions/{session_id}/scores")
+        return [self._parse(Score, score) for score in data]
+
+    # --- Comment Methods ---
+
+    def get_session_comments(self, session_id: str) -> list[CommentMessage]:
+        data = self._http.request("GET", f"/api/sessions/{session_id}/comments")
+        return [self._parse(CommentMessage, comment) for comment in data]
+
+    async def aget_session_comments(self, session_id: str) -> list[CommentMessage]:
+        data = await self._http.arequest("GET", f"/api/sessions/{session_id}/comments")
+        return [self._parse(CommentMessage, comment) for comment in data]
+
     # --- Run Methods ---
 
     @with_model(RunCreate)
-    def create_run(self, options: RunCreate) -> Run:
-        body = options.model_dump(by_alias=True, exclude_none=True)
-        data = self._http.request("POST", "/api/runs", json=body)
-        return Run.model_validate(data)
+    def create_run(self, options: RunCreate, *, idempotency_key: str | None = None) -> Run:
+        data = self._http.request(
+            "POST",
+            "/api/runs",
+            json=options,
+            idempotency_key=_idempotency_key(idempotency_key),
+            decode=self._decoder(Run),
+        )
+        return self._track_run(self._parse(Run, data))
 
     @with_model(RunCreate)
-    async def acreate_run(self, options: RunCreate) -> Run:
-        body = options.model_dump(by_alias=True, exclude_none=True)
-        data = await self._http.arequest("POST", "/api/runs", json=body)
-        return Run.model_validate(data)
+    async def acreate_run(self, options: RunCreate, *, idempotency_key: str | None = None) -> Run:
+        data = await self._http.arequest(
+            "POST",
+            "/api/runs",
+            json=options,
+            idempotency_key=_idempotency_key(idempotency_key),
+            decode=self._decoder(Run),
+        )
+        return self._track_run(self._parse(Run, data))
 
     @with_model(RunUpdate)
     def update_run(self, id: str, options: RunUpdate | None = None) -> Run:
-        body = options.model_dump(by_alias=True, exclude_none=True) if options else {}
-        data = self._http.request("PATCH", f"/api/runs/{id}", json=body)
-        return Run.model_validate(data)
+        data = self._http.request("PATCH", f"/api/runs/{id}", json=options or {}, decode=self._decoder(Run))
+        return self._track_run(self._parse(Run, data))
 
     @with_model(RunUpdate)
     async def aupdate_run(self, id: str, options: RunUpdate | None = None) -> Run:
-        body = options.model_dump(by_alias=True, exclude_none=True) if options else {}
-        data = await self._http.arequest("PATCH", f"/api/runs/{id}", json=body)
-        return Run.model_validate(data)
+        data = await self._http.arequest(
+            "PATCH", f"/api/runs/{id}", json=options or {}, decode=self._decoder(Run)
+        )
+        return self._track_run(self._parse(Run, data))
+
+    def keep_alive_run(self, id: str) -> dict[str, str | None]:
+        """Extends the run's idle timeout. Returns `{"expiresAt": ...}`, null once the run is finished."""
+        return self._http.request("POST", f"/api/runs/{id}/keep-alive", idempotent=True)
+
+    async def akeep_alive_run(self, id: str) -> dict[str, str | None]:
+        return await self._http.arequest("POST", f"/api/runs/{id}/keep-alive", idempotent=True)
+
+    def start_keep_alive(self, run: Run | str) -> None:
+        """
+        Sends keep-alives for the run in the background until it finishes.
+
+        All runs share one timer thread. Keep-alives stop automatically once
+        `update_run` reports a finished status, or on `stop_keep_alive`.
+        """
+        self._heartbeat.add(run if isinstance(run, str) else run.id)
+
+    def stop_keep_alive(self, run: Run | str) -> None:
+        self._heartbeat.discard(run if isinstance(run, str) else run.id)
+
+    def _track_run(self, run: Run) -> Run:
+        if run.status in _FINISHED_STATUSES:
+            self._heartbeat.discard(run.id)
+        if self._http.cache is not None:
+            self._http.cache.invalidate_session(run.session_id)
+        return run
+
+    @with_model(RunCreate)
+    def create_run_writer(
+        self,
+        options: RunCreate,
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch_items: int = DEFAULT_MAX_BATCH_ITEMS,
+        keep_alive: bool = True,
+    ) -> RunWriter:
+        """
+        Creates a run and returns a `RunWriter` that batches subsequent updates to it.
+
+        With `keep_alive`, the run is kept alive in the background until the writer is finished or closed.
+        """
+        run = self.create_run(options=options)
+        return RunWriter(
+            self, run, flush_interval=flush_interval, max_batch_items=max_batch_items, keep_alive=keep_alive
+        )
+
+    @with_model(RunCreate)
+    async def acreate_run_writer(
+        self,
+        options: RunCreate,
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_batch_items: int = DEFAULT_MAX_BATCH_ITEMS,
+        keep_alive: bool = True,
+    ) -> AsyncRunWriter:
+        """Creates a run and returns an `AsyncRunWriter` that batches subsequent updates to it."""
+        run = await self.acreate_run(options=options)
+        return AsyncRunWriter(
+            self, run, flush_interval=flush_interval, max_batch_items=max_batch_items, keep_alive=keep_alive
+        )
 
     # --- Config Methods (Internal) ---
 
-    def _get_config(self) -> Config:
-        data = self._http.request("GET", "/api/config")
-        return Config.model_validate(data)
+    def _get_config(self) -> Environment | None:
+        """The config of the client's environment, or None if none was set yet."""
+        data = self._http.cached_request("/api/environment", self._cache_ttl("config_ttl"), _config_tags)
+        return self._parse(Environment, data) if data is not None else None
+
+    async def _aget_config(self) -> Environment | None:
+        data = await self._http.acached_request("/api/environment", self._cache_ttl("config_ttl"), _config_tags)
+        return self._parse(Environment, data) if data is not None else None
+
+    def _update_config(self, *, config: Any) -> Environment:
+        data = self._http.request("PATCH", "/api/environment", json={"config": config})
+        self._cache_config(data)
+        return self._parse(Environment, data)
 
-    async def _aget_config(self) -> Config:
-        data = await self._http.arequest("GET", "/api/config")
-        return Config.model_validate(data)
+    async def _aupdate_config(self, *, config: Any) -> Environment:
+        data = await self._http.arequest("PATCH", "/api/environment", json={"config": config})
+        self._cache_config(data)
+        return self._parse(Environment, data)
 
-    def _update_config(self, *, config: Any) -> Config:
-        data = self._http.request("PUT", "/api/config", json={"config": config})
-        return Config.model_validate(data)
+    def _cache_config(self, data: Any) -> None:
+        cache = self._http.cache
+        if cache is not None:
+            cache.invalidate_config()
+            self._http.cache_put("/api/environment", data, cache.config_ttl, _config_tags(data))
 
-    async def _aupdate_config(self, *, config: Any) -> Config:
-        data = await self._http.arequest("PUT", "/api/config", json={"config": config})
-        return Config.model_validate(data)
+    # --- Caching ---
+
+    def _cache_ttl(self, name: Literal["user_ttl", "session_ttl", "config_ttl"]) -> float:
+        cache = self._http.cache
+        return getattr(cache, name) if cache is not None else 0.0
 
     # --- User Scoping ---
 
     def as_(self, user_or_token: User | str) -> AgentView:
-        """Returns a new client instance scoped to the given user."""
+        """
+        Returns a client scoped to the given user, sharing this client's
+        connection pool, limiter, cache and instrumentation. The most recently
+        used scoped clients are kept (see `max_scoped_clients`), so repeated
+        calls for the same user return the same client.
+        """
         token = user_or_token if isinstance(user_or_token, str) else user_or_token.token
-        return AgentView(
-            api_base_url=self._api_base_url,
-            api_key=self._api_key,
-            user_token=token,
-            space=self._space,
-        )
+        return self._scopes.get(token, self._scoped)
+
+    def _scoped(self, token: str) -> AgentView:
+        scoped = copy.copy(self)
+        scoped._http = self._http.with_user_token(token)
+        scoped._user_token = token
+        return scoped
 
 
-class PublicAgentView:
-    """User-scoped client using user token authentication (no API key needed)."""
+class PublicAgentView(_ClosableClient):
+    """
+    User-scoped client using user token authentication (no API key needed).
 
-    def __init__(self, api_base_url: str, user_token: str):
-        self._http = HTTPClient(api_base_url, user_token=user_token)
+    Accepts the same connection, retry, limiter, `trusted_responses`,
+    `json_codec`, `timestamps`, `instrumentation`, `lazy_content`,
+    `coalesce_requests` and `compression` options as `AgentView`.
+    """
+
+    def __init__(
+        self,
+        api_base_url: str,
+        user_token: str,
+        *,
+        timeout: float | httpx.Timeout | None = DEFAULT_TIMEOUT,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        retry: RetryPolicy | None = DEFAULT_RETRY,
+        limiter: RequestLimiter | None = None,
+        trusted_responses: bool = False,
+        json_codec: CodecOption = "auto",
+        timestamps: TimestampMode = "datetime",
+        instrumentation: Instrumentation | None = None,
+        lazy_content: bool = False,
+        coalesce_requests: bool = False,
+        compression: RequestCompression | None = None,
+    ):
+        pool = _make_pool(
+            timeout,
+            limits,
+            http2,
+            transport,
+            retry,
+            limiter,
+            json_codec=json_codec,
+            instrumentation=instrumentation,
+            coalesce_requests=coalesce_requests,
+            compression=compression,
+        )
+        self._parse = _model_parser(trusted_responses, timestamps, instrumentation)
+        self._timestamps = timestamps
+        self._set_lazy_content(lazy_content)
+        self._http = HTTPClient(api_base_url, user_token=user_token, pool=pool)
 
     def get_me(self) -> User:
         data = self._http.request("GET", "/api/public/me")
-        return User.model_validate(data)
+        return self._parse(User, data)
 
     async def aget_me(self) -> User:
         data = await self._http.arequest("GET", "/api/public/me")
-        return User.model_validate(data)
+        return self._parse(User, data)
 
     def get_session(self, id: str) -> Session:
-        data = self._http.request("GET", f"/api/public/sessions/{id}")
-        return Session.model_validate(data)
+        data = self._http.request("GET", f"/api/public/sessions/{id}", decode=self._decoder(Session))
+        return self._parse(Session, data)
 
     async def aget_session(self, id: str) -> Session:
-        data = await self._http.arequest("GET", f"/api/public/sessions/{id}")
-        return Session.model_validate(data)
+        data = await self._http.arequest("GET", f"/api/public/sessions/{id}", decode=self._decoder(Session))
+        return self._parse(Session, data)
 
     @with_model(PublicSessionsGetQueryParams)
     def get_sessions(self, options: PublicSessionsGetQueryParams | None = None) -> SessionsPaginatedResponse:
@@ -314,8 +866,10 @@ class PublicAgentView:
             dumped = options.model_dump(by_alias=True, exclude_none=True)
             for k, v in dumped.items():
                 params[k] = str(v)
-        data = self._http.request("GET", "/api/public/sessions", params=params)
-        return SessionsPaginatedResponse.model_validate(data)
+        data = self._http.request(
+            "GET", "/api/public/sessions", params=params, decode=self._decoder(SessionsPaginatedResponse)
+        )
+        return self._parse(SessionsPaginatedResponse, data)
 
     @with_model(PublicSessionsGetQueryParams)
     async def aget_sessions(self, options: PublicSessionsGetQueryParams | None = None) -> SessionsPaginatedResponse:
@@ -324,5 +878,28 @@ class PublicAgentView:
             dumped = options.model_dump(by_alias=True, exclude_none=True)
             for k, v in dumped.items():
                 params[k] = str(v)
-        data = await self._http.arequest("GET", "/api/public/sessions", params=params)
-        return SessionsPaginatedResponse.model_validate(data)
+        data = await self._http.arequest(
+            "GET", "/api/public/sessions", params=params, decode=self._decoder(SessionsPaginatedResponse)
+        )
+        return self._parse(SessionsPaginatedResponse, data)
+
+    @with_model(PublicSessionsGetQueryParams)
+    def iter_sessions(self, options: PublicSessionsGetQueryParams | None = None) -> SessionIterator:
+        """Iterates over all of the user's sessions, fetching pages as needed."""
+        query = options or PublicSessionsGetQueryParams()
+        return SessionIterator(
+            lambda page: self.get_sessions(options=query.model_copy(update={"page": page})),
+            _start_page(options),
+        )
+
+    @with_model(PublicSessionsGetQueryParams)
+    def aiter_sessions(
+        self, options: PublicSessionsGetQueryParams | None = None, *, prefetch: int = DEFAULT_PREFETCH
+    ) -> AsyncSessionIterator:
+        """Async `iter_sessions`, fetching up to `prefetch` pages ahead concurrently."""
+        query = options or PublicSessionsGetQueryParams()
+        return AsyncSessionIterator(
+            lambda page: self.aget_sessions(options=query.model_copy(update={"page": page})),
+            _start_page(options),
+            prefetch,
+        )
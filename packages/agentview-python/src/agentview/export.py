@@ -0,0 +1,453 @@
+"""
+Bulk export of full sessions, with their runs and items, to JSONL or Parquet.
+
+From Python:
+
+    export_sessions(client, "sessions.jsonl", agent="my-agent", checkpoint="export.ckpt")
+
+From the command line:
+
+    python -m agentview.export sessions.jsonl --agent my-agent --checkpoint export.ckpt
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal, Union
+
+from ._pagination import DEFAULT_PREFETCH
+from .client import AgentView, PublicAgentView
+from .errors import AgentViewError
+from .models import Session
+
+ExportFormat = Literal["jsonl", "parquet"]
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_CHECKPOINT_EVERY = 1000
+DEFAULT_PAGE_SIZE = 100
+
+_CHECKPOINT_VERSION = 1
+
+ExportClient = Union[AgentView, PublicAgentView]
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """
+    `exported` includes sessions written before a resume; `skipped` counts
+    sessions deleted between listing and fetching.
+    """
+
+    exported: int
+    skipped: int
+    elapsed: float
+    resumed_from_page: int | None = None
+
+
+class _JsonlSink:
+    """
+    One session per line. Resuming truncates anything after the last checkpoint.
+
+    The session user's token is left out, so an export file doesn't hand out
+    credentials to every user in it.
+    """
+
+    def __init__(self, path: Path, state: dict[str, Any] | None):
+        if state is None:
+            self._file = open(path, "wb")
+        else:
+            self._file = open(path, "r+b")
+            self._file.truncate(state["offset"])
+            self._file.seek(state["offset"])
+
+    def write(self, session: Session) -> None:
+        self._file.write(session.model_dump_json(by_alias=True, exclude={"user": {"token"}}).encode())
+        self._file.write(b"\n")
+
+    def commit(self) -> dict[str, Any]:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"offset": self._file.tell()}
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetSink:
+    """
+    A directory of Parquet part files, one per checkpoint.
+
+    Parts are written whole and renamed into place, so an interrupted export
+    never leaves a truncated file behind. Runs, metadata and state are stored
+    as JSON strings.
+    """
+
+    def __init__(self, path: Path, state: dict[str, Any] | None):
+        try:
+            # pyarrow ships without type stubs
+            pa: Any = importlib.import_module("pyarrow")
+            pq: Any = importlib.import_module("pyarrow.parquet")
+        except ImportError as error:
+            raise ImportError("Parquet export requires pyarrow: pip install 'agentview[parquet]'") from error
+
+        self._pa = pa
+        self._pq = pq
+        self._schema: Any = pa.schema(
+            [
+                ("id", pa.string()),
+                ("agent", pa.string()),
+                ("handle", pa.string()),
+                ("created_at", pa.timestamp("us", tz="UTC")),
+                ("updated_at", pa.timestamp("us", tz="UTC")),
+                ("user_id", pa.string()),
+                ("space", pa.string()),
+                ("metadata", pa.string()),
+                ("state", pa.string()),
+                ("runs", pa.string()),
+            ]
+        )
+        self._path = path
+        self._part = state["part"] if state is not None else 0
+        self._rows: list[dict[str, Any]] = []
+        path.mkdir(parents=True, exist_ok=True)
+
+    def write(self, session: Session) -> None:
+        data = session.model_dump(mode="json", by_alias=True, include={"metadata", "state", "runs"})
+        self._rows.append(
+            {
+                "id": session.id,
+                "agent": session.agent,
+                "handle": session.handle,
+                "created_at": session.created_at,
+                "updated_at": session.updated_at,
+                "user_id": session.user_id,
+                "space": session.space.value,
+                "metadata": json.dumps(data["metadata"]),
+                "state": json.dumps(data["state"]),
+                "runs": json.dumps(data["runs"]),
+            }
+        )
+
+    def commit(self) -> dict[str, Any]:
+        if self._rows:
+            table = self._pa.Table.from_pylist(self._rows, schema=self._schema)
+            part = self._path / f"part-{self._part:05d}.parquet"
+            tmp = part.with_suffix(".parquet.tmp")
+            self._pq.write_table(table, tmp)
+            os.replace(tmp, part)
+            self._part += 1
+            self._rows = []
+        return {"part": self._part}
+
+    def close(self) -> None:
+        self._rows = []
+
+
+def _open_sink(format: ExportFormat, path: Path, state: dict[str, Any] | None) -> _JsonlSink | _ParquetSink:
+    if format == "jsonl":
+        return _JsonlSink(path, state)
+    if format == "parquet":
+        return _ParquetSink(path, state)
+    raise ValueError(f"Unknown export format: {format!r}")
+
+
+def _load_checkpoint(path: Path) -> dict[str, Any] | None:
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return None
+    if state.get("version") != _CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}")
+    return state
+
+
+def _save_checkpoint(path: Path, state: dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+class _Progress:
+    """
+    Tracks which listing pages are fully written.
+
+    The checkpoint stores the first page that may still have unwritten sessions,
+    plus the ids already written from that page on, so a resume re-lists from
+    there and skips what is done. Only pages in flight are kept in memory.
+    """
+
+    def __init__(self, page: int, done: list[str]):
+        self.listed_page = page
+        self.listing_done = False
+        self.pending: Counter[int] = Counter()
+        self.written: dict[int, list[str]] = {page: list(done)} if done else {}
+        self.skip = set(done)
+
+    def listed(self, page: int) -> None:
+        self.listed_page = page
+        self.pending[page] += 1
+
+    def write(self, page: int, id: str) -> None:
+        self.pending[page] -= 1
+        if not self.pending[page]:
+            del self.pending[page]
+        self.written.setdefault(page, []).append(id)
+
+    def low_page(self) -> int:
+        pages = list(self.pending)
+        if not self.listing_done:
+            pages.append(self.listed_page)
+        return min(pages) if pages else self.listed_page + 1
+
+    def checkpoint(self) -> tuple[int, list[str]]:
+        low = self.low_page()
+        for page in [page for page in self.written if page < low]:
+            del self.written[page]
+        return low, [id for ids in self.written.values() for id in ids]
+
+
+async def aexport_sessions(
+    client: ExportClient,
+    path: str | os.PathLike[str],
+    *,
+    format: ExportFormat | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    checkpoint: str | os.PathLike[str] | None = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    prefetch: int = DEFAULT_PREFETCH,
+    **query: Any,
+) -> ExportResult:
+    """
+    Exports every session matching `query` (the `get_sessions` filters, e.g.
+    `agent`, `user_id`, `starred`, `limit`) to `path`.
+
+    Session ids are streamed from the paginated listing while `concurrency`
+    workers fetch full sessions, and results are written as they arrive, so
+    memory stays flat however many sessions are exported. `format` defaults to
+    Parquet for `.parquet` paths (written as a directory of part files) and
+    JSONL otherwise.
+
+    With `checkpoint`, progress is saved every `checkpoint_every` sessions and
+    a later call with the same arguments resumes where it stopped. Sessions are
+    listed newest-updated first, so sessions updated mid-export may move
+    between pages; the export is not a point-in-time snapshot.
+    """
+    started = time.monotonic()
+    output = Path(path)
+    export_format: ExportFormat = format or ("parquet" if output.suffix == ".parquet" else "jsonl")
+    query.setdefault("limit", DEFAULT_PAGE_SIZE)
+    query_key = json.loads(json.dumps(query, default=str))
+
+    checkpoint_path = Path(checkpoint) if checkpoint is not None else None
+    state = _load_checkpoint(checkpoint_path) if checkpoint_path is not None else None
+    if state is not None:
+        if state["format"] != export_format or state["query"] != query_key:
+            raise ValueError(f"Checkpoint {checkpoint_path} belongs to a different export")
+        if state["complete"]:
+            return ExportResult(state["exported"], state["skipped"], time.monotonic() - started, state["page"])
+
+    start_page = state["page"] if state is not None else 1
+    progress = _Progress(start_page, state["done"] if state is not None else [])
+    exported = state["exported"] if state is not None else 0
+    skipped = state["skipped"] if state is not None else 0
+    sink = _open_sink(export_format, output, state["sink"] if state is not None else None)
+
+    ids: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(maxsize=concurrency * 2)
+    results: asyncio.Queue[tuple[int, str, Session | None] | None] = asyncio.Queue(maxsize=concurrency * 2)
+
+    def commit(complete: bool = False) -> None:
+        sink_state = sink.commit()
+        if checkpoint_path is None:
+            return
+        page, done = progress.checkpoint()
+        _save_checkpoint(
+            checkpoint_path,
+            {
+                "version": _CHECKPOINT_VERSION,
+                "format": export_format,
+                "query": query_key,
+                "page": page,
+                "done": done,
+                "exported": exported,
+                "skipped": skipped,
+                "sink": sink_state,
+                "complete": complete,
+            },
+        )
+
+    async def list_ids() -> None:
+        listing: dict[str, Any] = {**query, "page": start_page}
+        sessions = client.aiter_sessions(**listing, prefetch=prefetch)
+        try:
+            async for session in sessions:
+                if session.id in progress.skip:
+                    continue
+                progress.listed(sessions.page)
+                await ids.put((sessions.page, session.id))
+        finally:
+            await sessions.aclose()
+        progress.listing_done = True
+        for _ in range(concurrency):
+            await ids.put(None)
+
+    async def fetch() -> None:
+        while (job := await ids.get()) is not None:
+            page, id = job
+            try:
+                session: Session | None = await client.aget_session(id)
+            except AgentViewError as error:
+                if error.status_code != 404:
+                    raise
+                session = None
+            await results.put((page, id, session))
+        await results.put(None)
+
+    async def write() -> None:
+        nonlocal exported, skipped
+        finished = 0
+        uncommitted = 0
+        while finished < concurrency:
+            result = await results.get()
+            if result is None:
+                finished += 1
+                continue
+            page, id, session = result
+            if session is not None:
+                sink.write(session)
+                exported += 1
+                uncommitted += 1
+            else:
+                skipped += 1
+            progress.write(page, id)
+            if uncommitted >= checkpoint_every:
+                commit()
+                uncommitted = 0
+        commit(complete=True)
+
+    tasks = [
+        asyncio.ensure_future(list_ids()),
+        *(asyncio.ensure_future(fetch()) for _ in range(concurrency)),
+        asyncio.ensure_future(write()),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        sink.close()
+
+    return ExportResult(
+        exported, skipped, time.monotonic() - started, start_page if state is not None else None
+    )
+
+
+def export_sessions(
+    client: ExportClient,
+    path: str | os.PathLike[str],
+    *,
+    format: ExportFormat | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    checkpoint: str | os.PathLike[str] | None = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    prefetch: int = DEFAULT_PREFETCH,
+    **query: Any,
+) -> ExportResult:
+    """Synchronous `aexport_sessions`. Must not be called from a running event loop."""
+
+    async def run() -> ExportResult:
+        try:
+            return await aexport_sessions(
+                client,
+                path,
+                format=format,
+                concurrency=concurrency,
+                checkpoint=checkpoint,
+                checkpoint_every=checkpoint_every,
+                prefetch=prefetch,
+                **query,
+            )
+        finally:
+            await client.aclose_loop()
+
+    return asyncio.run(run())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m agentview.export",
+        description="Export full sessions (with runs and items) to JSONL or Parquet.",
+    )
+    parser.add_argument("output", help="output file (.jsonl) or directory (.parquet)")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], help="defaults to the output's extension")
+    parser.add_argument("--agent")
+    parser.add_argument("--user-id")
+    parser.add_argument("--space", choices=["playground", "production", "shared-playground"])
+    parser.add_argument("--starred", action="store_true")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--checkpoint", help="checkpoint file; rerun with the same arguments to resume")
+    parser.add_argument("--checkpoint-every", type=int, default=DEFAULT_CHECKPOINT_EVERY)
+    parser.add_argument("--api-base-url", default=os.environ.get("AGENTVIEW_API_BASE_URL"))
+    parser.add_argument("--api-key", default=os.environ.get("AGENTVIEW_API_KEY"))
+    parser.add_argument(
+        "--user-token",
+        default=os.environ.get("AGENTVIEW_USER_TOKEN"),
+        help="export one user's sessions without an API key",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.api_base_url:
+        parser.error("--api-base-url or AGENTVIEW_API_BASE_URL is required")
+
+    query: dict[str, Any] = {"limit": args.page_size}
+    client: ExportClient
+    if args.api_key:
+        client = AgentView(args.api_base_url, args.api_key, space=args.space or "playground")
+        for name in ("agent", "user_id", "space"):
+            if getattr(args, name) is not None:
+                query[name] = getattr(args, name)
+        if args.starred:
+            query["starred"] = True
+    elif args.user_token:
+        client = PublicAgentView(args.api_base_url, args.user_token)
+        if args.agent is not None:
+            query["agent"] = args.agent
+    else:
+        parser.error("--api-key (or AGENTVIEW_API_KEY) or --user-token is required")
+
+    async def run() -> ExportResult:
+        async with client:
+            return await aexport_sessions(
+                client,
+                args.output,
+                format=args.format,
+                concurrency=args.concurrency,
+                checkpoint=args.checkpoint,
+                checkpoint_every=args.checkpoint_every,
+                **query,
+            )
+
+    result = asyncio.run(run())
+    print(
+        f"Exported {result.exported} sessions ({result.skipped} skipped) in {result.elapsed:.1f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,18 @@
 # Generated from Zod schemas in packages/agentview/src/apiTypes.ts
 # To regenerate: pnpm run generate-models (then manual cleanup may be needed)
+# Field types that are not generated (DateTime, LazyAny, LazyMetadata) live in _models_ext.py
 
 from __future__ import annotations
 
-from datetime import datetime
 from enum import Enum
-from typing import Annotated, Any, Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from ._models_ext import DateTime, LazyAny, LazyMetadata
 
-def _parse_datetime(value: Any) -> datetime:
-    """Parse datetime from API which may use space instead of T."""
-    if isinstance(value, datetime):
-        return value
-    if isinstance(value, str):
-        # Handle format like '2025-12-11 08:25:10.144334+00'
-        # Convert to ISO format by replacing space with T and fixing timezone
-        normalized = value.replace(" ", "T")
-        if normalized.endswith("+00"):
-            normalized = normalized + ":00"
-        return datetime.fromisoformat(normalized)
-    raise ValueError(f"Cannot parse datetime from {value}")
 
-
-DateTime = Annotated[datetime, BeforeValidator(_parse_datetime)]
-
-
-class Env(str, Enum):
+class Space(str, Enum):
     PRODUCTION = "production"
     PLAYGROUND = "playground"
     SHARED_PLAYGROUND = "shared-playground"
@@ -56,7 +41,7 @@ class User(BaseModel):
     created_at: DateTime = Field(alias="createdAt")
     updated_at: DateTime = Field(alias="updatedAt")
     created_by: str | None = Field(default=None, alias="createdBy")
-    env: Env
+    space: Space
     token: str
 
 
@@ -64,7 +49,7 @@ class UserCreate(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     external_id: str | None = Field(default=None, alias="externalId")
-    env: Env | None = None
+    space: Space | None = None
 
 
 # --- Version ---
@@ -99,9 +84,11 @@ class Score(BaseModel):
 class ScoreCreate(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
-    session_item_id: str = Field(alias="sessionItemId")
     name: str
     value: Any
+    # Deprecated: the API takes the item from the URL and sets the comment
+    # itself; kept optional so existing callers still validate
+    session_item_id: str | None = Field(default=None, alias="sessionItemId")
     comment_id: str | None = Field(default=None, alias="commentId")
 
 
@@ -112,6 +99,7 @@ class CommentMessage(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     id: str
+    session_item_id: str | None = Field(default=None, alias="sessionItemId")
     user_id: str = Field(alias="userId")
     content: str | None = None
     created_at: DateTime = Field(alias="createdAt")
@@ -121,6 +109,12 @@ class CommentMessage(BaseModel):
     score: Score | None = None
 
 
+class CommentMessageCreate(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    content: str
+
+
 # --- SessionItem ---
 
 
@@ -130,7 +124,7 @@ class SessionItem(BaseModel):
     id: str
     created_at: DateTime = Field(alias="createdAt")
     updated_at: DateTime = Field(alias="updatedAt")
-    content: Any
+    content: LazyAny
     run_id: str = Field(alias="runId")
     session_id: str = Field(alias="sessionId")
 
@@ -152,7 +146,7 @@ class Run(BaseModel):
     status: str
     fail_reason: Any = Field(default=None, alias="failReason")
     version: Version
-    metadata: dict[str, Any] | None = None
+    metadata: LazyMetadata = None
     session_items: list[SessionItem] = Field(alias="sessionItems")
     session_id: str = Field(alias="sessionId")
     version_id: str | None = Field(default=None, alias="versionId")
@@ -189,7 +183,7 @@ class RunWithCollaboration(BaseModel):
     status: str
     fail_reason: Any = Field(default=None, alias="failReason")
     version: Version
-    metadata: dict[str, Any] | None = None
+    metadata: LazyMetadata = None
     session_items: list[SessionItemWithCollaboration] = Field(alias="sessionItems")
     session_id: str = Field(alias="sessionId")
     version_id: str | None = Field(default=None, alias="versionId")
@@ -206,11 +200,11 @@ class SessionBase(BaseModel):
     handle: str
     created_at: DateTime = Field(alias="createdAt")
     updated_at: DateTime = Field(alias="updatedAt")
-    metadata: dict[str, Any] | None = None
+    metadata: LazyMetadata = None
     user: User
     user_id: str = Field(alias="userId")
-    env: Env
-    state: Any | None = None
+    space: Space
+    state: LazyAny = None
 
 
 class Session(SessionBase):
@@ -227,7 +221,7 @@ class SessionCreate(BaseModel):
     agent: str
     metadata: dict[str, Any] | None = None
     user_id: str | None = Field(default=None, alias="userId")
-    env: Env | None = None
+    space: Space | None = None
 
 
 class SessionUpdate(BaseModel):
@@ -252,6 +246,22 @@ class ConfigCreate(BaseModel):
     config: Any
 
 
+# --- Environment ---
+
+
+class Environment(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str
+    user_id: str | None = Field(default=None, alias="userId")
+    config: Any
+    created_at: DateTime = Field(alias="createdAt")
+
+
+class EnvironmentCreate(BaseModel):
+    config: Any
+
+
 # --- Member ---
 
 
@@ -321,7 +331,7 @@ class SessionsGetQueryParams(BaseModel):
     page: int | str | None = None
     limit: int | str | None = None
     user_id: str | None = Field(default=None, alias="userId")
-    env: Env | None = None
+    space: Space | None = None
     starred: bool | Literal["true", "false"] | None = None
 
 
@@ -0,0 +1,1004 @@
+"""
+In-process stand-in for the AgentView API, for load tests, CI and offline
+development.
+
+`LocalAPI` is an httpx transport (sync and async) that answers the REST and
+SSE routes the SDK uses from in-memory state, with the API's response shapes,
+status codes and error messages. Latency and error rates can be injected, so
+SDK and agent throughput can be measured deterministically on one machine:
+
+    api = LocalAPI(latency=0.02, jitter=0.01, error_rate=0.01, seed=1)
+    client = api.client(retry=RetryPolicy(backoff_base=0.01))
+
+    session = client.create_session(agent="support")
+    run = client.create_run(session_id=session.id, items=[...], version="1.0.0")
+    ...
+    print(api.stats.requests, api.stats.routes)
+
+It covers users, sessions (with stars, scores and comments), runs with idle
+timeouts and keep-alives, session streaming, the environment config,
+idempotency keys and conditional GETs. Agent configs are stored but not enforced: any agent is
+accepted and items, metadata and scores are not validated against schemas.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import random
+import re
+import threading
+import time
+import uuid
+import zlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Iterator, Mapping, Sequence
+
+import httpx
+
+from ._instrumentation import route_template
+from ._json import get_codec
+from .client import AgentView, PublicAgentView
+
+LOCAL_API_URL = "http://agentview.local"
+DEFAULT_IDLE_TIMEOUT = 60.0
+DEFAULT_STREAM_POLL_INTERVAL = 0.01
+MEMBER_ID = "local-member"
+
+_FINISHED = frozenset({"completed", "cancelled", "failed"})
+_IDEMPOTENCY_ENTRIES = 10_000
+_VERSION = re.compile(r"^v?(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:-(.+))?$")
+# Run fields compared for `run.updated` stream events, as the API does
+_STREAMED_RUN_FIELDS = ("id", "status", "finishedAt", "failReason", "metadata", "updatedAt")
+
+
+def _decompressor(encoding: str) -> Callable[[bytes], bytes] | None:
+    if encoding in ("gzip", "x-gzip"):
+        return lambda content: zlib.decompress(content, wbits=31)
+    if encoding == "deflate":
+        return zlib.decompress
+    if encoding == "zstd":
+        try:
+            # Optional, and without type stubs
+            zstandard: Any = importlib.import_module("zstandard")
+        except ImportError:
+            return None
+        return lambda content: zstandard.ZstdDecompressor().decompress(content)
+    return None
+
+
+class _APIError(Exception):
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+@dataclass
+class LocalAPIStats:
+    requests: int = 0
+    # Requests answered with an injected error instead of being handled
+    injected_errors: int = 0
+    # Total injected delay, in seconds
+    injected_latency: float = 0.0
+    # Requests per "METHOD /route", e.g. "PATCH /api/runs/{run_id}"
+    routes: Counter[str] = field(default_factory=Counter[str])
+
+
+@dataclass
+class _Request:
+    method: str
+    path: str
+    query: httpx.QueryParams
+    headers: httpx.Headers
+    body: Any
+    user: dict[str, Any] | None
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        """The body as a JSON object; empty without a body."""
+        return self.body or {}
+
+
+def _timestamp(now: float) -> str:
+    # As Postgres renders timestamptz, like the API's stored timestamps
+    return datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f") + "+00"
+
+
+def _iso(now: float) -> str:
+    # As JavaScript's toISOString, for values the API returns without storing
+    return datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _parse_version(version: Any) -> tuple[int, int, int, str | None] | None:
+    match = _VERSION.match(version) if isinstance(version, str) else None
+    if match is None:
+        return None
+    major, minor, patch, suffix = match.groups()
+    return int(major), int(minor or 0), int(patch or 0), suffix
+
+
+def _page_number(value: str | None, default: int) -> int:
+    if not value:
+        return default
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        return 1
+
+
+class LocalAPI(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    In-memory AgentView API, used as the `transport` of a client.
+
+    Every request first waits `latency` plus a uniform random extra of up to
+    `jitter` seconds. With probability `error_rate` it is then answered with
+    one of `error_statuses` without being handled, like an overloaded server
+    or proxy. Random draws and generated IDs come from `seed`, so single
+    threaded runs repeat exactly.
+
+    Runs in progress fail with a "Timeout" reason once they go `idle_timeout`
+    seconds without an update or keep-alive. Time is read from `clock`
+    (`time.time` by default), which tests can replace to expire runs without
+    waiting. Streams check for changes every `stream_poll_interval` seconds.
+
+    Requests must carry an API key (any key, unless `api_key` is given) or, on
+    `/api/public` routes, a user token. As in the API, score and comment
+    writes need a signed-in member and answer API keys with a 401; tests
+    seed them with `add_scores()` and `add_comment()`, which act as the
+    member `MEMBER_ID`. One instance may serve any number of clients, from
+    any threads and event loops.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (503,),
+        seed: int | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        api_key: str | None = None,
+        clock: Callable[[], float] = time.time,
+        stream_poll_interval: float = DEFAULT_STREAM_POLL_INTERVAL,
+    ):
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        if error_rate and not error_statuses:
+            raise ValueError("error_statuses must not be empty")
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.idle_timeout = idle_timeout
+        self.api_key = api_key
+        self.clock = clock
+        self.stream_poll_interval = stream_poll_interval
+        self.stats = LocalAPIStats()
+
+        self._random = random.Random(seed)
+        self._ids = random.Random(seed)
+        self._codec = get_codec()
+        self._lock = threading.RLock()
+        # Notified on every change, to wake up synchronous streams
+        self.changed = threading.Condition(self._lock)
+
+        self._users: dict[str, dict[str, Any]] = {}
+        self._tokens: dict[str, str] = {}
+        self._external_ids: dict[str, str] = {}
+        self._sessions: dict[str, dict[str, Any]] = {}
+        self._handles: dict[str, str] = {}
+        self._handle_numbers: dict[str, int] = {}
+        self._session_runs: dict[str, list[str]] = {}
+        # Sort keys for session lists: (last update, creation order)
+        self._session_order: dict[str, tuple[float, int]] = {}
+        self._runs: dict[str, dict[str, Any]] = {}
+        self._run_revisions: Counter[str] = Counter()
+        self._expiry: dict[str, float] = {}
+        self._versions: dict[str, dict[str, Any]] = {}
+        self._items: dict[str, dict[str, Any]] = {}
+        # Scores by item and name; all are authored by MEMBER_ID
+        self._scores: dict[str, dict[str, dict[str, Any]]] = {}
+        self._comments: dict[str, dict[str, Any]] = {}
+        self._item_comments: dict[str, list[dict[str, Any]]] = {}
+        self._stars: set[str] = set()
+        self._environment: dict[str, Any] | None = None
+        self._idempotent: OrderedDict[tuple[str, ...], httpx.Response] = OrderedDict()
+
+        routes = [
+            ("POST", "/api/users", self._create_user),
+            ("GET", "/api/users/me", self._get_me),
+            ("GET", "/api/users/by-external-id/(?P<external_id>[^/]+)", self._get_user_by_external_id),
+            ("GET", "/api/users/(?P<id>[^/]+)", self._get_user),
+            ("PATCH", "/api/users/(?P<id>[^/]+)", self._update_user),
+            ("GET", "/api/sessions", self._list_sessions),
+            ("POST", "/api/sessions", self._create_session),
+            ("GET", "/api/sessions/(?P<id>[^/]+)", self._get_session),
+            ("PATCH", "/api/sessions/(?P<id>[^/]+)", self._update_session),
+            ("GET", "/api/sessions/(?P<id>[^/]+)/stream", self._stream_session),
+            ("GET", "/api/sessions/(?P<id>[^/]+)/star", self._is_starred),
+            ("PUT", "/api/sessions/(?P<id>[^/]+)/star", self._star),
+            ("DELETE", "/api/sessions/(?P<id>[^/]+)/star", self._unstar),
+            ("GET", "/api/sessions/(?P<id>[^/]+)/scores", self._list_scores),
+            ("GET", "/api/sessions/(?P<id>[^/]+)/comments", self._list_comments),
+            ("PATCH", "/api/sessions/(?P<id>[^/]+)/items/(?P<item_id>[^/]+)/scores", self._members_only),
+            ("POST", "/api/sessions/(?P<id>[^/]+)/items/(?P<item_id>[^/]+)/comments", self._members_only),
+            (
+                "PUT",
+                "/api/sessions/(?P<id>[^/]+)/items/(?P<item_id>[^/]+)/comments/(?P<comment_id>[^/]+)",
+                self._members_only,
+            ),
+            (
+                "DELETE",
+                "/api/sessions/(?P<id>[^/]+)/items/(?P<item_id>[^/]+)/comments/(?P<comment_id>[^/]+)",
+                self._members_only,
+            ),
+            ("POST", "/api/runs", self._create_run),
+            ("PATCH", "/api/runs/(?P<id>[^/]+)", self._update_run),
+            ("POST", "/api/runs/(?P<id>[^/]+)/keep-alive", self._keep_alive),
+            ("GET", "/api/environment", self._get_environment),
+            ("PATCH", "/api/environment", self._update_environment),
+            ("GET", "/api/public/me", self._get_me),
+            ("GET", "/api/public/sessions", self._list_sessions),
+            ("GET", "/api/public/sessions/(?P<id>[^/]+)", self._get_session),
+        ]
+        self._routes = [(method, re.compile(pattern + "$"), handler) for method, pattern, handler in routes]
+
+    # --- Clients ---
+
+    def client(self, **kwargs: Any) -> AgentView:
+        """An `AgentView` client connected to this API; keyword arguments are passed on."""
+        kwargs.setdefault("api_key", self.api_key or "local-api-key")
+        return AgentView(api_base_url=LOCAL_API_URL, transport=self, **kwargs)
+
+    def public_client(self, user_token: str, **kwargs: Any) -> PublicAgentView:
+        return PublicAgentView(api_base_url=LOCAL_API_URL, user_token=user_token, transport=self, **kwargs)
+
+    # --- Transport ---
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        delay, failure = self._inject(request)
+        if delay:
+            time.sleep(delay)
+        if failure is not None:
+            return failure
+        response = self._handle(request)
+        if isinstance(response, _SessionWatch):
+            return httpx.Response(200, headers=_SSE_HEADERS, stream=_SyncEventStream(response))
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        delay, failure = self._inject(request)
+        if delay:
+            await asyncio.sleep(delay)
+        if failure is not None:
+            return failure
+        response = self._handle(request)
+        if isinstance(response, _SessionWatch):
+            return httpx.Response(200, headers=_SSE_HEADERS, stream=_AsyncEventStream(response))
+        return response
+
+    def _inject(self, request: httpx.Request) -> tuple[float, httpx.Response | None]:
+        with self._lock:
+            stats = self.stats
+            stats.requests += 1
+            stats.routes[f"{request.method} {route_template(request.url.path)}"] += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            stats.injected_latency += delay
+            if self.error_rate and self._random.random() < self.error_rate:
+                stats.injected_errors += 1
+                status = self._random.choice(self.error_statuses)
+                return delay, self._json(status, {"message": "Injected error"})
+            return delay, None
+
+    def _handle(self, request: httpx.Request) -> httpx.Response | _SessionWatch:
+        path = request.url.path
+        idempotency = self._idempotency_key(request)
+        with self._lock:
+            if idempotency is not None and idempotency in self._idempotent:
+                stored = self._idempotent[idempotency]
+                return httpx.Response(
+                    stored.status_code,
+                    headers={**stored.headers, "Idempotent-Replayed": "true"},
+                    content=stored.content,
+                )
+            try:
+                handler, params = self._route(request.method, path)
+                context = _Request(
+                    request.method,
+                    path,
+                    request.url.params,
+                    request.headers,
+                    self._body(request),
+                    self._authenticate(request.headers, public=path.startswith("/api/public/")),
+                )
+                self._expire_runs()
+                result = handler(context, **params)
+            except _APIError as error:
+                result = self._json(error.status_code, {"message": error.message})
+            if isinstance(result, httpx.Response) and request.method != "GET":
+                self.changed.notify_all()
+                if idempotency is not None and result.status_code < 500:
+                    self._idempotent[idempotency] = result
+                    while len(self._idempotent) > _IDEMPOTENCY_ENTRIES:
+                        self._idempotent.popitem(last=False)
+            return result
+
+    def _idempotency_key(self, request: httpx.Request) -> tuple[str, ...] | None:
+        # Scoped to the caller's credentials and path, like the API's middleware
+        key = request.headers.get("Idempotency-Key")
+        if key is None or request.method != "POST":
+            return None
+        headers = request.headers
+        return (headers.get("Authorization", ""), headers.get("X-User-Token", ""), request.url.path, key)
+
+    def _body(self, request: httpx.Request) -> Any:
+        """The JSON body, decompressed like the API's request decompression middleware does."""
+        content = request.content
+        if not content:
+            return None
+        encoding = request.headers.get("Content-Encoding", "identity").lower()
+        if encoding == "identity":
+            return self._codec.loads(content)
+        decompress = _decompressor(encoding)
+        if decompress is None:
+            raise _APIError(415, f"Unsupported Content-Encoding: {encoding}")
+        try:
+            content = decompress(content)
+        except Exception as error:
+            raise _APIError(400, f"Invalid {encoding} request body") from error
+        return self._codec.loads(content)
+
+    def _route(self, method: str, path: str) -> tuple[Callable[..., Any], dict[str, str]]:
+        for route_method, pattern, handler in self._routes:
+            if route_method == method:
+                match = pattern.match(path)
+                if match is not None:
+                    return handler, match.groupdict()
+        raise _APIError(404, "Not Found")
+
+    def _authenticate(self, headers: httpx.Headers, public: bool) -> dict[str, Any] | None:
+        token = headers.get("X-User-Token")
+        if public:
+            if token is None:
+                raise _APIError(401, "Unauthorized")
+        else:
+            authorization = headers.get("Authorization", "")
+            if not authorization.startswith("Bearer ") or (
+                self.api_key is not None and authorization[len("Bearer ") :] != self.api_key
+            ):
+                raise _APIError(401, "Unauthorized")
+            if token is None:
+                return None
+        user_id = self._tokens.get(token)
+        if user_id is None:
+            raise _APIError(404, "User not found.")
+        return self._users[user_id]
+
+    def _json(self, status_code: int, data: Any) -> httpx.Response:
+        return httpx.Response(
+            status_code, content=self._codec.dumps(data), headers={"Content-Type": "application/json"}
+        )
+
+    def _conditional(self, request: _Request, data: Any) -> httpx.Response:
+        """A 200 with an ETag, or a 304 if the client's copy is current."""
+        content = self._codec.dumps(data)
+        etag = f'"{hashlib.sha1(content).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, content=content, headers={"Content-Type": "application/json", "ETag": etag})
+
+    def _id(self) -> str:
+        return str(uuid.UUID(int=self._ids.getrandbits(128), version=4))
+
+    # --- Users ---
+
+    def _new_user(self, space: str | None, external_id: str | None) -> dict[str, Any]:
+        space = space or "playground"
+        if space not in ("production", "playground", "shared-playground"):
+            raise _APIError(422, f"Invalid space: {space}")
+        if external_id and external_id in self._external_ids:
+            raise _APIError(422, "User with this external ID already exists")
+        now = _timestamp(self.clock())
+        user: dict[str, Any] = {
+            "id": self._id(),
+            "externalId": external_id,
+            "createdAt": now,
+            "updatedAt": now,
+            # Production users belong to nobody; others to the member who created them
+            "createdBy": None if space == "production" else MEMBER_ID,
+            "space": space,
+            "token": f"{self._ids.getrandbits(256):064x}",
+        }
+        self._users[user["id"]] = user
+        self._tokens[user["token"]] = user["id"]
+        if external_id:
+            self._external_ids[external_id] = user["id"]
+        return user
+
+    def _require_user(self, id: str) -> dict[str, Any]:
+        user = self._users.get(id)
+        if user is None:
+            raise _APIError(404, "User not found")
+        return user
+
+    def _create_user(self, request: _Request) -> httpx.Response:
+        body = request.fields
+        return self._json(201, self._new_user(body.get("space"), body.get("externalId")))
+
+    def _get_me(self, request: _Request) -> httpx.Response:
+        if request.user is None:
+            raise _APIError(422, "You must provide an end user token to access this endpoint.")
+        return self._json(200, request.user)
+
+    def _get_user(self, request: _Request, id: str) -> httpx.Response:
+        return self._conditional(request, self._require_user(id))
+
+    def _get_user_by_external_id(self, request: _Request, external_id: str) -> httpx.Response:
+        user = self._users.get(self._external_ids.get(external_id, ""))
+        space = request.query.get("space")
+        if user is None or (space is not None and user["space"] != space):
+            raise _APIError(404, "User not found")
+        return self._conditional(request, user)
+
+    def _update_user(self, request: _Request, id: str) -> httpx.Response:
+        user = self._require_user(id)
+        body = request.fields
+        if "externalId" in body and body["externalId"] != user["externalId"]:
+            external_id = body["externalId"]
+            if external_id and external_id in self._external_ids:
+                raise _APIError(422, "User with this external ID already exists")
+            self._external_ids.pop(user["externalId"] or "", None)
+            if external_id:
+                self._external_ids[external_id] = user["id"]
+            user["externalId"] = external_id
+        if body.get("space") is not None:
+            user["space"] = body["space"]
+        user["updatedAt"] = _timestamp(self.clock())
+        return self._json(200, user)
+
+    # --- Sessions ---
+
+    def _find_session(self, id: str, user: dict[str, Any] | None) -> dict[str, Any]:
+        # Sessions can be looked up by id or by handle, e.g. "12s"
+        session = self._sessions.get(id) or self._sessions.get(self._handles.get(id, ""))
+        if session is None:
+            raise _APIError(404, "Session not found")
+        if user is not None and session["userId"] != user["id"]:
+            raise _APIError(401, "Unauthorized")
+        return session
+
+    def _render_session(self, session: dict[str, Any], runs: bool = True) -> dict[str, Any]:
+        user = self._users[session["userId"]]
+        data = {**session, "user": user, "space": user["space"]}
+        if not runs:
+            # Session lists carry neither runs nor state
+            del data["state"]
+        else:
+            run_ids = self._session_runs[session["id"]]
+            # Failed and cancelled runs are archived once another run follows
+            data["runs"] = [
+                self._runs[run_id]
+                for index, run_id in enumerate(run_ids)
+                if index == len(run_ids) - 1 or self._runs[run_id]["status"] in ("in_progress", "completed")
+            ]
+        return data
+
+    def _last_run(self, session_id: str) -> dict[str, Any] | None:
+        run_ids = self._session_runs[session_id]
+        return self._runs[run_ids[-1]] if run_ids else None
+
+    def _touch_session(self, session: dict[str, Any], now: float) -> None:
+        session["updatedAt"] = _timestamp(now)
+        self._session_order[session["id"]] = (now, self._session_order[session["id"]][1])
+
+    def _list_sessions(self, request: _Request) -> httpx.Response:
+        query = request.query
+        limit = _page_number(query.get("limit"), 50)
+        page = _page_number(query.get("page"), 1)
+        if limit > 1000:
+            raise _APIError(422, "Page limit cannot exceed 1000")
+
+        space, user_id, agent = query.get("space"), query.get("userId"), query.get("agent")
+        public = request.path.startswith("/api/public/")
+        if public:
+            space = user_id = None
+        elif not space and not user_id:
+            raise _APIError(422, "You must set either `space` or `userId` to make this request.")
+        elif space and user_id:
+            raise _APIError(422, "You must set either `space` or `userId`, not both.")
+        elif user_id and request.user is not None:
+            raise _APIError(422, "You can't set both X-User-Token and userId query param")
+        starred = query.get("starred") == "true"
+        if starred and public:
+            raise _APIError(422, "starred filter is only available for staff users")
+
+        matching: list[dict[str, Any]] = []
+        for session in self._sessions.values():
+            user = self._users[session["userId"]]
+            if (
+                (agent and session["agent"] != agent)
+                or (space and user["space"] != space)
+                or (user_id and user["id"] != user_id)
+                or (request.user is not None and user["id"] != request.user["id"])
+                or (starred and session["id"] not in self._stars)
+            ):
+                continue
+            matching.append(session)
+        matching.sort(key=lambda session: self._session_order[session["id"]], reverse=True)
+
+        offset = (page - 1) * limit
+        total_pages = -(-len(matching) // limit)
+        sessions = [self._render_session(session, runs=False) for session in matching[offset : offset + limit]]
+        return self._json(
+            200,
+            {
+                "sessions": sessions,
+                "pagination": {
+                    "totalCount": len(matching),
+                    "totalPages": total_pages,
+                    "page": page,
+                    "limit": limit,
+                    "hasNextPage": page < total_pages,
+                    "hasPreviousPage": page > 1,
+                    "currentPageStart": offset + 1,
+                    "currentPageEnd": min(offset + limit, len(matching)),
+                },
+            },
+        )
+
+    def _create_session(self, request: _Request) -> httpx.Response:
+        body = request.fields
+        if not isinstance(body.get("agent"), str):
+            raise _APIError(422, "agent is required")
+        if body.get("userId"):
+            user = self._require_user(body["userId"])
+        elif request.user is not None:
+            user = request.user
+        else:
+            user = self._new_user(body.get("space"), None)
+
+        suffix = "s" if user["createdBy"] else ""
+        number = self._handle_numbers[suffix] = self._handle_numbers.get(suffix, 0) + 1
+        now = self.clock()
+        session: dict[str, Any] = {
+            "id": self._id(),
+            "handle": f"{number}{suffix}",
+            "createdAt": _timestamp(now),
+            "updatedAt": _timestamp(now),
+            "metadata": body.get("metadata") or {},
+            "summary": None,
+            "agent": body["agent"],
+            "userId": user["id"],
+            "state": None,
+            "versions": [],
+        }
+        self._sessions[session["id"]] = session
+        self._handles[session["handle"]] = session["id"]
+        self._session_runs[session["id"]] = []
+        self._session_order[session["id"]] = (now, len(self._sessions))
+        return self._json(201, self._render_session(session))
+
+    def _get_session(self, request: _Request, id: str) -> httpx.Response:
+        session = self._render_session(self._find_session(id, request.user))
+        if request.path.startswith("/api/public/"):
+            return self._json(200, session)
+        return self._conditional(request, session)
+
+    def _update_session(self, request: _Request, id: str) -> httpx.Response:
+        session = self._find_session(id, request.user)
+        body = request.fields
+        if not isinstance(body.get("metadata"), dict):
+            raise _APIError(422, "metadata is required")
+        session["metadata"] = {**(session["metadata"] or {}), **body["metadata"]}
+        self._touch_session(session, self.clock())
+        return self._json(200, self._render_session(session))
+
+    def _stream_session(self, request: _Request, id: str) -> httpx.Response | _SessionWatch:
+        session = self._find_session(id, request.user)
+        wait = request.query.get("wait") == "true"
+        last_run = self._last_run(session["id"])
+        if not wait and (last_run is None or last_run["status"] != "in_progress"):
+            return httpx.Response(204)
+        return _SessionWatch(self, session["id"], wait)
+
+    def _is_starred(self, request: _Request, id: str) -> httpx.Response:
+        return self._json(200, {"starred": self._find_session(id, request.user)["id"] in self._stars})
+
+    def _star(self, request: _Request, id: str) -> httpx.Response:
+        self._stars.add(self._find_session(id, request.user)["id"])
+        return self._json(200, {"starred": True})
+
+    def _unstar(self, request: _Request, id: str) -> httpx.Response:
+        self._stars.discard(self._find_session(id, request.user)["id"])
+        return self._json(200, {"starred": False})
+
+    # --- Scores and Comments ---
+
+    def _session_items(self, session: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        for run_id in self._session_runs[session["id"]]:
+            yield from self._runs[run_id]["sessionItems"]
+
+    def _require_item(self, session: dict[str, Any], item_id: str) -> dict[str, Any]:
+        item = self._items.get(item_id)
+        if item is None or item["sessionId"] != session["id"]:
+            raise _APIError(404, "Session item not found")
+        return item
+
+    def _list_scores(self, request: _Request, id: str) -> httpx.Response:
+        session = self._find_session(id, request.user)
+        return self._json(
+            200,
+            [score for item in self._session_items(session) for score in self._scores.get(item["id"], {}).values()],
+        )
+
+    def _list_comments(self, request: _Request, id: str) -> httpx.Response:
+        session = self._find_session(id, request.user)
+        comments: list[dict[str, Any]] = []
+        for item in self._session_items(session):
+            scores = {score["commentId"]: score for score in self._scores.get(item["id"], {}).values()}
+            comments += [
+                {**comment, "score": scores.get(comment["id"])} for comment in self._item_comments.get(item["id"], [])
+            ]
+        return self._json(200, comments)
+
+    def _new_comment(self, item: dict[str, Any], content: str | None) -> dict[str, Any]:
+        comment: dict[str, Any] = {
+            "id": self._id(),
+            "sessionItemId": item["id"],
+            "userId": MEMBER_ID,
+            "content": content,
+            "createdAt": _timestamp(self.clock()),
+            "updatedAt": None,
+            "deletedAt": None,
+            "deletedBy": None,
+        }
+        self._comments[comment["id"]] = comment
+        self._item_comments.setdefault(item["id"], []).append(comment)
+        return comment
+
+    def _delete(self, comment: dict[str, Any]) -> None:
+        comment["deletedAt"] = _timestamp(self.clock())
+        comment["deletedBy"] = MEMBER_ID
+
+    def add_scores(self, session_id: str, item_id: str, scores: Mapping[str, Any]) -> None:
+        """
+        Scores an item as `MEMBER_ID`, the way a member does in the Studio: each
+        score gets a comment, and a None value removes the score. Raises
+        KeyError for an unknown session or item.
+        """
+        with self._lock:
+            item = self._member_item(session_id, item_id)
+            item_scores = self._scores.setdefault(item_id, {})
+            for name, value in scores.items():
+                existing = item_scores.get(name)
+                if value is None:
+                    if existing is not None:
+                        self._delete(self._comments[existing["commentId"]])
+                        del item_scores[name]
+                elif existing is not None:
+                    existing["value"] = value
+                    existing["updatedAt"] = _timestamp(self.clock())
+                else:
+                    now = _timestamp(self.clock())
+                    item_scores[name] = {
+                        "id": self._id(),
+                        "sessionItemId": item_id,
+                        "name": name,
+                        "value": value,
+                        "commentId": self._new_comment(item, None)["id"],
+                        "createdBy": MEMBER_ID,
+                        "createdAt": now,
+                        "updatedAt": now,
+                        "deletedAt": None,
+                        "deletedBy": None,
+                    }
+
+    def add_comment(self, session_id: str, item_id: str, content: str) -> dict[str, Any]:
+        """Comments on an item as `MEMBER_ID`, the way a member does in the Studio."""
+        with self._lock:
+            return dict(self._new_comment(self._member_item(session_id, item_id), content))
+
+    def _member_item(self, session_id: str, item_id: str) -> dict[str, Any]:
+        try:
+            return self._require_item(self._find_session(session_id, None), item_id)
+        except _APIError as error:
+            raise KeyError(error.message) from None
+
+    def _members_only(self, request: _Request, **params: str) -> httpx.Response:
+        # Score and comment writes need a signed-in member; API keys get a 401
+        raise _APIError(401, "Unauthorized")
+
+    # --- Runs ---
+
+    def expire_runs(self) -> int:
+        """Fails runs whose idle timeout has passed, as the API's worker does. Returns how many."""
+        with self._lock:
+            expired = self._expire_runs()
+            if expired:
+                self.changed.notify_all()
+            return expired
+
+    def _expire_runs(self) -> int:
+        if not self._expiry:
+            return 0
+        now = self.clock()
+        expired = [run_id for run_id, expires_at in self._expiry.items() if expires_at < now]
+        for run_id in expired:
+            del self._expiry[run_id]
+            run = self._runs[run_id]
+            run.update(
+                status="failed",
+                finishedAt=_timestamp(now),
+                failReason={"message": "Timeout"},
+                updatedAt=_timestamp(now),
+            )
+            self._run_revisions[run_id] += 1
+        return len(expired)
+
+    def _require_run(self, id: str, user: dict[str, Any] | None) -> dict[str, Any]:
+        run = self._runs.get(id)
+        if run is None:
+            raise _APIError(404, "Run not found")
+        self._find_session(run["sessionId"], user)
+        return run
+
+    def _version(self, version: str) -> dict[str, Any]:
+        row = self._versions.get(version)
+        if row is None:
+            row = self._versions[version] = {
+                "id": self._id(),
+                "version": version,
+                "createdAt": _timestamp(self.clock()),
+            }
+        return row
+
+    def _add_items(self, run: dict[str, Any], items: list[Any], now: float) -> None:
+        timestamp = _timestamp(now)
+        for content in items:
+            item = {
+                "id": self._id(),
+                "createdAt": timestamp,
+                "updatedAt": timestamp,
+                "content": content,
+                "runId": run["id"],
+                "sessionId": run["sessionId"],
+            }
+            self._items[item["id"]] = item
+            run["sessionItems"].append(item)
+
+    def _check_status(self, status: Any, items: int, fail_reason: Any) -> None:
+        if status not in ("in_progress", *_FINISHED):
+            raise _APIError(422, f"Invalid status: {status}")
+        if status == "completed" and items < 2:
+            raise _APIError(422, "Run set as 'completed' must have at least 2 items, input and output.")
+        if fail_reason is not None and status != "failed":
+            raise _APIError(422, "failReason can only be set when status is 'failed'.")
+
+    def _create_run(self, request: _Request) -> httpx.Response:
+        body = request.fields
+        session = self._find_session(body.get("sessionId", ""), request.user)
+        last_run = self._last_run(session["id"])
+        if last_run is not None and last_run["status"] == "in_progress":
+            raise _APIError(422, "Can't create a run because session has already a run in progress.")
+
+        parsed = _parse_version(body.get("version"))
+        if parsed is None:
+            raise _APIError(422, "Invalid version number format. Should be like '1.2.3-xxx'")
+        if self._users[session["userId"]]["space"] == "production" and parsed[3]:
+            raise _APIError(422, "Production sessions can't have suffixed versions.")
+        if last_run is not None:
+            previous = _parse_version(last_run["version"]["version"])
+            assert previous is not None
+            if previous[0] != parsed[0]:
+                raise _APIError(422, "Cannot continue a session with a different major version.")
+            if parsed[:3] < previous[:3]:
+                raise _APIError(422, "Cannot continue a session with an older version.")
+
+        items: list[Any] = body.get("items") or []
+        if not items:
+            raise _APIError(422, "New run must have at least 1 item, input.")
+        status = body.get("status") or "in_progress"
+        fail_reason = body.get("failReason")
+        self._check_status(status, len(items), fail_reason)
+
+        now = self.clock()
+        version = self._version(f"{parsed[0]}.{parsed[1]}.{parsed[2]}" + (f"-{parsed[3]}" if parsed[3] else ""))
+        finished = status in _FINISHED
+        run: dict[str, Any] = {
+            "id": self._id(),
+            "createdAt": _timestamp(now),
+            "finishedAt": _timestamp(now) if finished else None,
+            "updatedAt": _timestamp(now),
+            "status": status,
+            "failReason": fail_reason,
+            "version": version,
+            "metadata": body.get("metadata") or {},
+            "sessionItems": [],
+            "sessionId": session["id"],
+            "versionId": version["id"],
+        }
+        self._runs[run["id"]] = run
+        self._session_runs[session["id"]].append(run["id"])
+        self._add_items(run, items, now)
+        if not finished:
+            self._expiry[run["id"]] = now + self.idle_timeout
+        if "state" in body:
+            session["state"] = body["state"]
+        if version["version"] not in session["versions"]:
+            session["versions"] = [*session["versions"], version["version"]]
+            self._touch_session(session, now)
+        return self._json(201, run)
+
+    def _update_run(self, request: _Request, id: str) -> httpx.Response:
+        run = self._require_run(id, request.user)
+        body = request.fields
+        finished = run["status"] in _FINISHED
+        items: list[Any] = body.get("items") or []
+        if items and finished:
+            raise _APIError(422, "Cannot add items to a finished run.")
+        if "state" in body and finished:
+            raise _APIError(422, "Cannot set state to a finished run.")
+        if finished and body.get("status") and body["status"] != run["status"]:
+            raise _APIError(422, "Cannot change the status of a finished run.")
+        fail_reason = body.get("failReason")
+        if fail_reason is not None and finished:
+            raise _APIError(422, "failReason cannot be set for a finished run.")
+        status = body.get("status") or run["status"]
+        if not finished:
+            self._check_status(status, len(run["sessionItems"]) + len(items), fail_reason)
+
+        now = self.clock()
+        self._add_items(run, items, now)
+        if body.get("metadata"):
+            run["metadata"] = {**(run["metadata"] or {}), **body["metadata"]}
+        run["status"] = status
+        if fail_reason is not None:
+            run["failReason"] = fail_reason
+        if status in _FINISHED:
+            run["finishedAt"] = run["finishedAt"] or _timestamp(now)
+            self._expiry.pop(run["id"], None)
+        else:
+            self._expiry[run["id"]] = now + self.idle_timeout
+        run["updatedAt"] = _timestamp(now)
+        self._run_revisions[run["id"]] += 1
+        if "state" in body:
+            self._sessions[run["sessionId"]]["state"] = body["state"]
+        return self._json(201, run)
+
+    def _keep_alive(self, request: _Request, id: str) -> httpx.Response:
+        run = self._require_run(id, request.user)
+        if run["status"] in _FINISHED:
+            return self._json(200, {"expiresAt": None})
+        expires_at = self._expiry[run["id"]] = self.clock() + self.idle_timeout
+        return self._json(200, {"expiresAt": _iso(expires_at)})
+
+    # --- Environment ---
+
+    def _get_environment(self, request: _Request) -> httpx.Response:
+        # null until a config is set, as the API answers
+        return self._conditional(request, self._environment)
+
+    def _update_environment(self, request: _Request) -> httpx.Response:
+        # API keys act on the production environment, which the API upserts
+        environment = self._environment or {"id": self._id(), "userId": None, "createdAt": _timestamp(self.clock())}
+        environment["config"] = request.fields.get("config")
+        self._environment = environment
+        return self._json(200, environment)
+
+    # --- Streaming ---
+
+    def session_snapshot(self, session_id: str) -> dict[str, Any]:
+        """The session with its runs, as `GET /api/sessions/{id}` returns it. Call holding `changed`."""
+        return self._render_session(self._sessions[session_id])
+
+    def last_run(self, session_id: str) -> tuple[dict[str, Any] | None, int]:
+        """
+        The session's last run, after failing idle runs, and its revision, which
+        every update bumps. Call holding `changed`.
+        """
+        self._expire_runs()
+        run = self._last_run(session_id)
+        return run, self._run_revisions[run["id"]] if run is not None else -1
+
+    def encode(self, data: Any) -> bytes:
+        return self._codec.dumps(data)
+
+
+_SSE_HEADERS = {"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+
+
+class _SessionWatch:
+    """
+    Follows a session's last run for a stream response, as the API does: a
+    `session.snapshot` first (once the run is in progress, with `wait`), then
+    a `run.updated` delta per change until the run finishes.
+    """
+
+    def __init__(self, api: LocalAPI, session_id: str, wait: bool):
+        self.api = api
+        self.session_id = session_id
+        self.waiting = wait
+        self.run_id: str | None = None
+        self.revision = -1
+        self.item_ids: set[str] = set()
+        self.fields: dict[str, Any] = {}
+
+    def poll(self) -> tuple[list[bytes], bool]:
+        """Events since the last poll, and whether the stream is over. Call holding `api.changed`."""
+        api = self.api
+        run, revision = api.last_run(self.session_id)
+        if self.waiting:
+            if run is None or run["status"] != "in_progress":
+                return [], False
+            self.waiting = False
+
+        if self.run_id is None:
+            snapshot = self._event("session.snapshot", api.session_snapshot(self.session_id))
+            if run is None or run["status"] != "in_progress":
+                return [snapshot], True
+            self._remember(run, revision)
+            return [snapshot], False
+
+        assert run is not None and run["id"] == self.run_id
+        if revision == self.revision:
+            return [], False
+        changed: dict[str, Any] = {}
+        new_items = [item for item in run["sessionItems"] if item["id"] not in self.item_ids]
+        if new_items:
+            changed["sessionItems"] = new_items
+        for name in _STREAMED_RUN_FIELDS:
+            if run[name] != self.fields[name]:
+                changed[name] = run[name]
+        self._remember(run, revision)
+        events = [self._event("run.updated", {"id": run["id"], **changed})] if changed else []
+        return events, run["status"] != "in_progress"
+
+    def _remember(self, run: dict[str, Any], revision: int) -> None:
+        self.run_id = run["id"]
+        self.revision = revision
+        self.item_ids = {item["id"] for item in run["sessionItems"]}
+        # Copies, since run metadata is replaced rather than mutated
+        self.fields = {name: run[name] for name in _STREAMED_RUN_FIELDS}
+
+    def _event(self, event: str, data: Any) -> bytes:
+        return b"event: " + event.encode() + b"\ndata: " + self.api.encode(data) + b"\n\n"
+
+
+class _SyncEventStream(httpx.SyncByteStream):
+    def __init__(self, watch: _SessionWatch):
+        self.watch = watch
+
+    def __iter__(self) -> Iterator[bytes]:
+        changed = self.watch.api.changed
+        while True:
+            with changed:
+                events, done = self.watch.poll()
+                if not events and not done:
+                    # Woken up by any change; the timeout catches runs expiring
+                    changed.wait(self.watch.api.stream_poll_interval)
+            yield from events
+            if done:
+                return
+
+
+class _AsyncEventStream(httpx.AsyncByteStream):
+    def __init__(self, watch: _SessionWatch):
+        self.watch = watch
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while True:
+            with self.watch.api.changed:
+                events, done = self.watch.poll()
+            for event in events:
+                yield event
+            if done:
+                return
+            if not events:
+                await asyncio.sleep(self.watch.api.stream_poll_interval)
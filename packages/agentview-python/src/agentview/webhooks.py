@@ -0,0 +1,358 @@
+"""
+Receiver for AgentView webhook deliveries.
+
+The API's worker POSTs `{"event": ..., "payload": ..., "job_id": ...}` to the
+configured `webhookUrl` and retries the job when delivery fails. A
+`WebhookReceiver` acknowledges each delivery as soon as it is parsed and
+queued, runs user handlers in the background with bounded concurrency, and
+drops re-deliveries of jobs it has already accepted.
+
+As an ASGI app (Starlette, FastAPI, or served directly by uvicorn):
+
+    receiver = WebhookReceiver(max_concurrency=32)
+
+    @receiver.on("session.on_first_run_created")
+    async def on_first_run(event: WebhookEvent) -> None:
+        ...
+
+    # uvicorn module:receiver
+
+From a synchronous framework such as Flask, pass the raw body to `handle()`:
+
+    @app.post("/webhook")
+    def webhook():
+        status, body = receiver.handle(request.get_data())
+        return body, status
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Union, cast
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger("agentview")
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_PENDING = 1000
+DEFAULT_DEDUPE_SIZE = 10_000
+# Longer than the worker's whole retry schedule (5s, 30s, 2min)
+DEFAULT_DEDUPE_TTL = 3600.0
+
+WebhookHandler = Callable[["WebhookEvent"], Union[Awaitable[Any], Any]]
+ErrorHandler = Callable[["WebhookEvent", BaseException], None]
+
+
+class WebhookEvent(BaseModel):
+    """One webhook delivery."""
+
+    event: str
+    payload: Any = None
+    job_id: str
+
+    @property
+    def session_id(self) -> str | None:
+        """The session the event is about, for session events."""
+        payload: Any = self.payload
+        return cast("dict[str, Any]", payload).get("session_id") if isinstance(payload, dict) else None
+
+
+@dataclass
+class WebhookStats:
+    received: int = 0
+    accepted: int = 0
+    # Re-deliveries of jobs already accepted
+    duplicates: int = 0
+    # Events without a handler, acknowledged and dropped
+    ignored: int = 0
+    # Malformed deliveries and deliveries refused because the queue was full
+    rejected: int = 0
+    processed: int = 0
+    failed: int = 0
+
+
+class _RecentJobs:
+    """Bounded set of recently accepted job IDs, each remembered for `ttl` seconds."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._expiry: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, job_id: str) -> bool:
+        """Records `job_id`, returning False if it was already recorded."""
+        now = time.monotonic()
+        with self._lock:
+            expires = self._expiry.get(job_id)
+            if expires is not None and expires > now:
+                return False
+            self._expiry[job_id] = now + self.ttl
+            self._expiry.move_to_end(job_id)
+            while len(self._expiry) > self.max_size:
+                self._expiry.popitem(last=False)
+            return True
+
+    def discard(self, job_id: str) -> None:
+        with self._lock:
+            self._expiry.pop(job_id, None)
+
+
+class WebhookReceiver:
+    """
+    Parses, deduplicates and dispatches webhook deliveries to handlers.
+
+    Register handlers with `on(event)`; `on("*")` receives events with no
+    handler of their own. Handlers may be sync or async. Async handlers run on
+    the event loop and sync handlers on a thread pool, at most
+    `max_concurrency` at a time.
+
+    Deliveries are answered before handlers run: 202 when queued, 200 for
+    duplicates and for events without a handler, 400 for malformed bodies, and
+    503 when `max_pending` events are already waiting, so the API worker
+    retries them later. Since accepted jobs are acknowledged, a failing handler
+    is not retried by the worker; failures go to `on_error` (or are logged).
+
+    Job IDs are remembered for `dedupe_ttl` seconds (up to `dedupe_size` of
+    them), so the worker's retries of a job accepted earlier are dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        dedupe_size: int = DEFAULT_DEDUPE_SIZE,
+        dedupe_ttl: float = DEFAULT_DEDUPE_TTL,
+        on_error: ErrorHandler | None = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.on_error = on_error
+        self.stats = WebhookStats()
+        self._handlers: dict[str, WebhookHandler] = {}
+        self._recent = _RecentJobs(dedupe_size, dedupe_ttl)
+        self._lock = threading.Lock()
+        # Async (ASGI) dispatch
+        self._queue: asyncio.Queue[tuple[WebhookEvent, WebhookHandler]] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Sync dispatch
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+
+    def on(self, event: str = "*") -> Callable[[WebhookHandler], WebhookHandler]:
+        """Decorator registering a handler for `event`."""
+
+        def decorator(handler: WebhookHandler) -> WebhookHandler:
+            self.add_handler(event, handler)
+            return handler
+
+        return decorator
+
+    def add_handler(self, event: str, handler: WebhookHandler) -> None:
+        self._handlers[event] = handler
+
+    # --- Parsing ---
+
+    def _accept(self, body: bytes) -> tuple[int, dict[str, str], WebhookEvent | None, WebhookHandler | None]:
+        """Parses a delivery and decides how to answer it, recording its job ID if accepted."""
+        with self._lock:
+            self.stats.received += 1
+        try:
+            event = WebhookEvent.model_validate(json.loads(body))
+        except (ValueError, ValidationError) as error:
+            with self._lock:
+                self.stats.rejected += 1
+            return 400, {"message": f"Invalid webhook body: {error}"}, None, None
+        handler = self._handlers.get(event.event) or self._handlers.get("*")
+        if handler is None:
+            with self._lock:
+                self.stats.ignored += 1
+            return 200, {"status": "ignored"}, None, None
+        if not self._recent.add(event.job_id):
+            with self._lock:
+                self.stats.duplicates += 1
+            return 200, {"status": "duplicate"}, None, None
+        return 202, {"status": "accepted"}, event, handler
+
+    def _refuse(self, event: WebhookEvent) -> tuple[int, dict[str, str]]:
+        # Forget the job so the worker's retry is accepted
+        self._recent.discard(event.job_id)
+        with self._lock:
+            self.stats.rejected += 1
+        return 503, {"message": "Too many pending webhook events"}
+
+    def _accepted(self) -> None:
+        with self._lock:
+            self.stats.accepted += 1
+
+    def _finished(self, event: WebhookEvent, error: BaseException | None) -> None:
+        with self._lock:
+            if error is None:
+                self.stats.processed += 1
+            else:
+                self.stats.failed += 1
+        if error is None:
+            return
+        if self.on_error is not None:
+            try:
+                self.on_error(event, error)
+                return
+            except Exception:
+                logger.exception("Webhook on_error callback failed")
+        logger.error("Webhook handler for %s (job %s) failed: %s", event.event, event.job_id, error)
+
+    # --- ASGI ---
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        if scope["method"] != "POST":
+            await _respond(send, 405, {"message": "Method not allowed"})
+            return
+        body = bytearray()
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        status, content = await self.asubmit(bytes(body))
+        await _respond(send, status, content)
+
+    async def asubmit(self, body: bytes) -> tuple[int, dict[str, str]]:
+        """Accepts a delivery for processing on the running event loop. Returns the status and body to answer with."""
+        status, content, event, handler = self._accept(body)
+        if event is None or handler is None:
+            return status, content
+        queue = self._ensure_workers()
+        try:
+            queue.put_nowait((event, handler))
+        except asyncio.QueueFull:
+            return self._refuse(event)
+        self._accepted()
+        return status, content
+
+    def _ensure_workers(self) -> asyncio.Queue[tuple[WebhookEvent, WebhookHandler]]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue(self.max_pending)
+            self._loop = loop
+            self._workers = [loop.create_task(self._work(self._queue)) for _ in range(self.max_concurrency)]
+        return self._queue
+
+    async def _work(self, queue: asyncio.Queue[tuple[WebhookEvent, WebhookHandler]]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            event, handler = await queue.get()
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    await handler(event)
+                else:
+                    result = await loop.run_in_executor(None, handler, event)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception as error:
+                self._finished(event, error)
+            else:
+                self._finished(event, None)
+            finally:
+                queue.task_done()
+
+    async def drain(self) -> None:
+        """Waits until every accepted event has been processed."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Processes the remaining events, then stops the workers."""
+        await self.drain()
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+        self._loop = None
+
+    async def _lifespan(self, receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.aclose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    # --- Sync ---
+
+    def handle(self, body: bytes) -> tuple[int, dict[str, str]]:
+        """
+        Accepts a delivery for processing on a thread pool, for synchronous
+        web frameworks. Returns the status and body to answer with.
+        """
+        status, content, event, handler = self._accept(body)
+        if event is None or handler is None:
+            return status, content
+        executor: ThreadPoolExecutor | None = None
+        with self._lock:
+            if self._pending < self.max_pending + self.max_concurrency:
+                self._pending += 1
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="agentview-webhook")
+                executor = self._executor
+        if executor is None:
+            return self._refuse(event)
+        self._accepted()
+        executor.submit(self._run_sync, event, handler)
+        return status, content
+
+    def _run_sync(self, event: WebhookEvent, handler: WebhookHandler) -> None:
+        try:
+            result = handler(event)
+            if inspect.isawaitable(result):
+                asyncio.run(_await(result))
+        except Exception as error:
+            self._finished(event, error)
+        else:
+            self._finished(event, None)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def close(self, wait: bool = True) -> None:
+        """Stops the thread pool used by `handle()`, by default after processing the remaining events."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
+async def _respond(send: Callable[..., Any], status: int, content: dict[str, str]) -> None:
+    body = json.dumps(content).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,82 @@
+"""JSON payload builders shaped like AgentView API responses."""
+
+from typing import Any
+
+TIMESTAMP = "2025-12-11 08:25:10.144334+00"
+
+
+def make_user(id: str = "u1", token: str = "user-token") -> dict[str, Any]:
+    return {
+        "id": id,
+        "externalId": None,
+        "createdAt": TIMESTAMP,
+        "updatedAt": TIMESTAMP,
+        "createdBy": None,
+        "space": "playground",
+        "token": token,
+    }
+
+
+def make_item(id: str, run_id: str = "r1", session_id: str = "s1", content: Any = None) -> dict[str, Any]:
+    return {
+        "id": id,
+        "createdAt": TIMESTAMP,
+        "updatedAt": TIMESTAMP,
+        "content": content if content is not None else {"role": "user", "content": f"item {id}"},
+        "runId": run_id,
+        "sessionId": session_id,
+    }
+
+
+def make_run(
+    id: str = "r1",
+    session_id: str = "s1",
+    status: str = "in_progress",
+    items: int = 1,
+) -> dict[str, Any]:
+    return {
+        "id": id,
+        "createdAt": TIMESTAMP,
+        "finishedAt": None,
+        "status": status,
+        "failReason": None,
+        "version": {"id": "v1", "version": "1.0.0", "createdAt": TIMESTAMP},
+        "metadata": None,
+        "sessionItems": [make_item(f"{id}-i{n}", id, session_id) for n in range(items)],
+        "sessionId": session_id,
+        "versionId": "v1",
+    }
+
+
+def make_session(id: str = "s1", runs: list[dict[str, Any]] | None = None) -> dict[str, Any]:
+    return {
+        "id": id,
+        "agent": "test-agent",
+        "handle": "1",
+        "createdAt": TIMESTAMP,
+        "updatedAt": TIMESTAMP,
+        "metadata": None,
+        "user": make_user(),
+        "userId": "u1",
+        "space": "playground",
+        "state": None,
+        "runs": runs if runs is not None else [make_run(session_id=id)],
+    }
+
+
+def make_sessions_page(ids: list[str], page: int = 1, limit: int = 50) -> dict[str, Any]:
+    total_pages = -(-len(ids) // limit)
+    offset = (page - 1) * limit
+    return {
+        "sessions": [make_session(id, runs=[]) for id in ids[offset : offset + limit]],
+        "pagination": {
+            "page": page,
+            "limit": limit,
+            "totalPages": total_pages,
+            "totalCount": len(ids),
+            "hasNextPage": page < total_pages,
+            "hasPreviousPage": page > 1,
+            "currentPageStart": offset + 1,
+            "currentPageEnd": min(offset + limit, len(ids)),
+        },
+    }
@@ -0,0 +1,33 @@
+"""Smoke test for the benchmark suite.
+
+The suite runs against an in-process httpx.MockTransport and needs no server.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SUITE = Path(__file__).resolve().parent.parent / "benchmarks" / "suite.py"
+
+
+class TestBenchmarkSuite:
+    def test_quick_run_writes_comparable_results(self, tmp_path: Path):
+        output = tmp_path / "results.json"
+        command = [sys.executable, str(SUITE), "--quick", "--only", "deserialize", "memory", "--output", str(output)]
+
+        subprocess.run(command, check=True, capture_output=True)
+        report = json.loads(output.read_text())
+
+        assert report["schema"] == 1
+        names = {entry["name"] for entry in report["results"]}
+        assert {"deserialize.model_validate", "memory.cached_session"} <= names
+        assert all(entry["value"] > 0 for entry in report["results"])
+
+        compared = subprocess.run(
+            [*command[:-1], str(tmp_path / "again.json"), "--compare", str(output)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        assert "Compared with" in compared.stdout
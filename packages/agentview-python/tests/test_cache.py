@@ -0,0 +1,199 @@
+"""Response cache tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import json
+import time
+from collections import Counter
+
+import httpx
+
+from agentview import AgentView, ResponseCache
+
+from .payloads import TIMESTAMP, make_run, make_session, make_user
+
+
+class CachedAPI:
+    def __init__(self) -> None:
+        self.gets: Counter[str] = Counter()
+        self.etags = True
+        self.session_status = "completed"
+        self.user = make_user()
+        self.environment: dict[str, object] | None = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "PATCH" and path.startswith("/api/users/"):
+            self.user = {**self.user, **json.loads(request.content)}
+            return httpx.Response(200, json=self.user)
+        if request.method == "PATCH" and path == "/api/environment":
+            config = json.loads(request.content)["config"]
+            self.environment = {"id": "e1", "userId": None, "config": config, "createdAt": TIMESTAMP}
+            return httpx.Response(200, json=self.environment)
+        if request.method == "POST" and path == "/api/runs":
+            return httpx.Response(201, json=make_run("r2", session_id="s1"))
+        self.gets[path] += 1
+        if path == "/api/environment":
+            body = self.environment
+        elif path.startswith("/api/sessions/"):
+            body = make_session("s1", runs=[make_run(session_id="s1", status=self.session_status)])
+            body["metadata"] = {"tags": ["a"]}
+        else:
+            body = self.user
+        etag = f'W/"{hash(json.dumps(body, sort_keys=True))}"'
+        if self.etags and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        headers = {"Content-Type": "application/json", **({"ETag": etag} if self.etags else {})}
+        return httpx.Response(200, content=json.dumps(body), headers=headers)
+
+    def client(self, cache: ResponseCache | None = None) -> AgentView:
+        return AgentView(
+            api_base_url="http://test",
+            api_key="key",
+            transport=httpx.MockTransport(self),
+            cache=cache if cache is not None else ResponseCache(),
+        )
+
+
+class TestResponseCache:
+    def test_caches_users_by_any_lookup(self):
+        api = CachedAPI()
+        client = api.client()
+
+        for _ in range(3):
+            client.get_user(external_id="ext-1")
+            client.get_user(id="u1")
+
+        assert api.gets["/api/users/by-external-id/ext-1"] == 1
+        assert api.gets["/api/users/u1"] == 1
+        assert client.cache is not None
+        assert client.cache.stats.hits == 4
+        assert client.cache.stats.hit_rate == 4 / 6
+
+    def test_scoped_clients_do_not_share_entries(self):
+        api = CachedAPI()
+        client = api.client()
+
+        client.as_("token-a").get_user()
+        client.as_("token-b").get_user()
+        client.as_("token-a").get_user()
+
+        assert api.gets["/api/users/me"] == 2
+
+    def test_update_user_refreshes_every_cached_lookup(self):
+        api = CachedAPI()
+        client = api.client()
+        client.get_user(external_id="ext-1")
+
+        client.update_user("u1", external_id="ext-2")
+
+        assert client.get_user(id="u1").external_id == "ext-2"
+        client.get_user(external_id="ext-1")
+        assert api.gets["/api/users/u1"] == 0
+        assert api.gets["/api/users/by-external-id/ext-1"] == 2
+
+    def test_only_finished_sessions_are_cached(self):
+        api = CachedAPI()
+        api.session_status = "in_progress"
+        client = api.client()
+
+        client.get_session("s1")
+        client.get_session("s1")
+        assert api.gets["/api/sessions/s1"] == 2
+
+        api.session_status = "completed"
+        client.get_session("s1")
+        client.get_session("s1")
+        assert api.gets["/api/sessions/s1"] == 3
+
+    def test_new_run_invalidates_session(self):
+        api = CachedAPI()
+        client = api.client()
+        client.get_session("s1")
+
+        client.create_run(session_id="s1", version="1.0.0", items=[])
+        client.get_session("s1")
+
+        assert api.gets["/api/sessions/s1"] == 2
+
+    def test_revalidates_expired_entries_with_etag(self):
+        api = CachedAPI()
+        client = api.client(ResponseCache(user_ttl=0.01))
+
+        first = client.get_user(id="u1")
+        time.sleep(0.02)
+        second = client.get_user(id="u1")
+
+        assert second == first
+        assert api.gets["/api/users/u1"] == 2
+        assert client.cache is not None and client.cache.stats.revalidations == 1
+
+    def test_caches_the_environment_config(self):
+        api = CachedAPI()
+        client = api.client(ResponseCache(config_ttl=0.01))
+
+        assert client._get_config() is None
+        client._update_config(config={"agents": [{"name": "a"}]})
+        environment = client._get_config()
+        time.sleep(0.02)
+        revalidated = client._get_config()
+
+        assert environment is not None and environment.config == {"agents": [{"name": "a"}]}
+        assert revalidated == environment
+        # The update's response is cached; only the initial and the expired reads hit the API
+        assert api.gets["/api/environment"] == 2
+        assert client.cache is not None and client.cache.stats.hits == 1
+
+    def test_hits_return_independent_copies(self):
+        api = CachedAPI()
+        client = api.client(ResponseCache(session_ttl=0.01))
+
+        first = client.get_session("s1")
+        assert first.metadata is not None
+        first.metadata["tags"].append("b")
+        second = client.get_session("s1")
+        time.sleep(0.02)
+        revalidated = client.get_session("s1")
+
+        assert second.metadata == {"tags": ["a"]}
+        assert revalidated.metadata == {"tags": ["a"]}
+        assert api.gets["/api/sessions/s1"] == 2
+
+    def test_lru_eviction(self):
+        api = CachedAPI()
+        api.etags = False
+        client = api.client(ResponseCache(max_size=2))
+
+        client.get_user(id="a")
+        client.get_user(id="b")
+        client.get_user(id="a")
+        client.get_user(id="c")  # evicts b, the least recently used
+        client.get_user(id="a")
+        client.get_user(id="b")
+
+        assert api.gets["/api/users/a"] == 1
+        assert api.gets["/api/users/b"] == 2
+        assert client.cache is not None and client.cache.stats.evictions == 2
+
+    def test_disabled_by_default(self):
+        api = CachedAPI()
+        client = AgentView(api_base_url="http://test", api_key="key", transport=httpx.MockTransport(api))
+
+        client.get_user(id="u1")
+        client.get_user(id="u1")
+
+        assert client.cache is None
+        assert api.gets["/api/users/u1"] == 2
+
+    async def test_async_reads_share_the_cache(self):
+        api = CachedAPI()
+        client = api.client()
+
+        await client.aget_user(id="u1")
+        client.get_user(id="u1")
+        await client.aget_session("s1")
+        client.get_session("s1")
+
+        assert api.gets["/api/users/u1"] == 1
+        assert api.gets["/api/sessions/s1"] == 1
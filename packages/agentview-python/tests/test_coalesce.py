@@ -0,0 +1,212 @@
+"""Request coalescing tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from agentview import AgentView, AgentViewError, ResponseCache
+
+from .payloads import make_run, make_session, make_user
+
+
+class GatedAPI:
+    """Holds every request until `release()`, so concurrent calls overlap."""
+
+    def __init__(self, status: int = 200) -> None:
+        self.status = status
+        self.requests: list[httpx.Request] = []
+        self.gate = threading.Event()
+        self.async_gate: asyncio.Event | None = None
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "PATCH":
+            return httpx.Response(200, json={**make_user(), **json.loads(request.content)})
+        if path.startswith("/api/sessions/"):
+            return httpx.Response(self.status, json=make_session("s1", runs=[make_run(status="completed")]))
+        return httpx.Response(self.status, json=make_user())
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "GET":
+            self.gate.wait(5)
+        return self._respond(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "GET":
+            if self.async_gate is None:
+                self.async_gate = asyncio.Event()
+            await self.async_gate.wait()
+        return self._respond(request)
+
+    def release(self) -> None:
+        self.gate.set()
+        if self.async_gate is not None:
+            self.async_gate.set()
+
+    def client(self, sync: bool = False, **kwargs: Any) -> AgentView:
+        handler = self.handler if sync else self.async_handler
+        kwargs.setdefault("retry", None)
+        kwargs.setdefault("coalesce_requests", True)
+        return AgentView(api_base_url="http://test", api_key="key", transport=httpx.MockTransport(handler), **kwargs)
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAsyncCoalescing:
+    async def test_identical_gets_share_one_request(self):
+        api = GatedAPI()
+        client = api.client()
+
+        tasks = [asyncio.create_task(client.aget_user(id="u1")) for _ in range(10)]
+        await settle()
+        api.release()
+        users = await asyncio.gather(*tasks)
+
+        assert len(api.requests) == 1
+        assert all(user == users[0] for user in users)
+        assert client.coalesce_stats is not None
+        assert (client.coalesce_stats.requests, client.coalesce_stats.coalesced) == (1, 9)
+
+    async def test_different_credentials_and_params_are_not_shared(self):
+        api = GatedAPI()
+        client = api.client()
+
+        tasks = [
+            asyncio.create_task(client.aget_user(id="u1")),
+            asyncio.create_task(client.as_("a").aget_user(id="u1")),
+            asyncio.create_task(client.as_("b").aget_user(id="u1")),
+            asyncio.create_task(client.as_("b").aget_user(id="u1")),
+            asyncio.create_task(client.aget_user(id="u2")),
+        ]
+        await settle()
+        api.release()
+        await asyncio.gather(*tasks)
+
+        assert len(api.requests) == 4
+        assert client.as_("a").coalesce_stats is client.coalesce_stats
+
+    async def test_errors_are_shared(self):
+        api = GatedAPI(status=500)
+        client = api.client()
+
+        tasks = [asyncio.create_task(client.aget_user(id="u1")) for _ in range(3)]
+        await settle()
+        api.release()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert len(api.requests) == 1
+        assert all(isinstance(result, AgentViewError) and result.status_code == 500 for result in results)
+
+    async def test_cancelling_one_caller_leaves_the_others(self):
+        api = GatedAPI()
+        client = api.client()
+
+        first = asyncio.create_task(client.aget_user(id="u1"))
+        second = asyncio.create_task(client.aget_user(id="u1"))
+        await settle()
+        first.cancel()
+        api.release()
+
+        assert (await second).id == "u1"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert len(api.requests) == 1
+
+    async def test_reads_after_a_write_do_not_join_earlier_reads(self):
+        api = GatedAPI()
+        client = api.client()
+
+        before = asyncio.create_task(client.aget_user(id="u1"))
+        await settle()
+        await client.aupdate_user("u1")
+        after = asyncio.create_task(client.aget_user(id="u1"))
+        await settle()
+        api.release()
+        await asyncio.gather(before, after)
+
+        assert [request.method for request in api.requests] == ["GET", "PATCH", "GET"]
+
+    async def test_cache_misses_share_one_request(self):
+        api = GatedAPI()
+        client = api.client(cache=ResponseCache())
+
+        tasks = [asyncio.create_task(client.aget_session("s1")) for _ in range(5)]
+        await settle()
+        api.release()
+        await asyncio.gather(*tasks)
+        await client.aget_session("s1")
+
+        assert len(api.requests) == 1
+        assert client.cache is not None and client.cache.stats.hits == 1
+
+    async def test_callers_get_independent_copies(self):
+        api = GatedAPI()
+        client = api.client()
+
+        tasks = [asyncio.create_task(client._http.arequest("GET", "/api/sessions/s1")) for _ in range(3)]
+        await settle()
+        api.release()
+        first, *others = await asyncio.gather(*tasks)
+        first["runs"][0]["status"] = "changed"
+
+        assert len(api.requests) == 1
+        assert all(other == make_session("s1", runs=[make_run(status="completed")]) for other in others)
+
+    async def test_disabled_by_default(self):
+        api = GatedAPI()
+        client = AgentView(
+            api_base_url="http://test", api_key="key", transport=httpx.MockTransport(api.async_handler), retry=None
+        )
+
+        tasks = [asyncio.create_task(client.aget_user(id="u1")) for _ in range(3)]
+        await settle()
+        api.release()
+        await asyncio.gather(*tasks)
+
+        assert len(api.requests) == 3
+        assert client.coalesce_stats is None
+
+
+class TestThreadCoalescing:
+    def test_threads_share_one_request(self):
+        api = GatedAPI()
+        client = api.client(sync=True)
+        users: list[Any] = []
+
+        threads = [threading.Thread(target=lambda: users.append(client.get_user(id="u1"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        stats = client.coalesce_stats
+        assert stats is not None
+        deadline = time.monotonic() + 5
+        while stats.coalesced < 7 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        api.release()
+        for thread in threads:
+            thread.join()
+
+        assert len(api.requests) == 1
+        assert len(users) == 8 and all(user.id == "u1" for user in users)
+
+    def test_sequential_gets_are_not_shared(self):
+        api = GatedAPI()
+        api.release()
+        client = api.client(sync=True)
+
+        client.get_user(id="u1")
+        client.get_user(id="u1")
+
+        assert len(api.requests) == 2
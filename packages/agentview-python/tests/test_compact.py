@@ -0,0 +1,115 @@
+"""Compact model tests for AgentView Python SDK.
+
+These tests run offline against in-memory payloads and need no server.
+"""
+
+import gc
+import json
+import pickle
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+
+from agentview import CompactSession, CompactStore, Session, SessionBase
+from agentview._construct import construct_model
+
+from .payloads import make_run, make_session
+
+
+def session_payload(id: str = "s1", runs: int = 2, items: int = 3) -> dict[str, Any]:
+    payload = make_session(
+        id, runs=[make_run(f"{id}-r{n}", session_id=id, status="completed", items=items) for n in range(runs)]
+    )
+    payload["metadata"] = {"customer": "acme"}
+    payload["state"] = {"step": 3}
+    return payload
+
+
+def allocated(build: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = build()
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - before
+        del value
+        return used
+    finally:
+        tracemalloc.stop()
+
+
+class TestCompactModels:
+    def test_round_trip(self):
+        session = Session.model_validate(session_payload())
+        compact = CompactSession.from_model(session)
+
+        assert compact.runs is not None
+        assert compact.runs[1].session_items[2].content == session.runs[1].session_items[2].content
+        assert compact.metadata == {"customer": "acme"}
+        assert compact.to_model() == session
+        assert compact.to_model().model_dump_json() == session.model_dump_json()
+
+    def test_session_base_round_trip(self):
+        data = session_payload()
+        del data["runs"]
+        session = SessionBase.model_validate(data)
+        compact = CompactSession.from_model(session)
+
+        assert compact.runs is None
+        assert type(compact.to_model()) is SessionBase
+        assert compact.to_model() == session
+
+    def test_shares_users_versions_and_strings(self):
+        store = CompactStore()
+        # Separately decoded, as when fetched one by one
+        sessions = store.sessions(Session.model_validate(session_payload(f"s{n}")) for n in range(3))
+
+        assert store.users == 1 and store.versions == 1
+        assert sessions[0].user is sessions[2].user
+        assert sessions[0].runs[0].version is sessions[1].runs[1].version  # type: ignore[index]
+        run = sessions[0].runs[0]  # type: ignore[index]
+        assert all(item.session_id is sessions[0].id for item in run.session_items)
+        assert all(item.run_id is run.id for item in run.session_items)
+        assert sessions[0].agent is sessions[1].agent
+
+    def test_read_only_without_dict(self):
+        compact = CompactSession.from_model(Session.model_validate(session_payload()))
+
+        assert not hasattr(compact, "__dict__")
+        with pytest.raises(AttributeError):
+            compact.agent = "other"  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            del compact.runs[0].status  # type: ignore[index]
+
+    def test_equality_and_pickle(self):
+        session = Session.model_validate(session_payload())
+        first = CompactSession.from_model(session)
+        second = CompactSession.from_model(session)
+
+        assert first == second and first is not second
+        assert pickle.loads(pickle.dumps(first)) == first
+
+    def test_keeps_lazy_content_raw(self):
+        msgspec = pytest.importorskip("msgspec")
+        from agentview._lazy import lazy_decoder
+
+        session = construct_model(Session, lazy_decoder(Session)(json.dumps(session_payload()).encode()))
+        compact = CompactSession.from_model(session)
+        item = compact.runs[0].session_items[0]  # type: ignore[index]
+
+        assert isinstance(item._content, msgspec.Raw)
+        assert item.content == {"role": "user", "content": "item s1-r0-i0"}
+        assert not isinstance(item._content, msgspec.Raw)
+        assert compact.to_model().model_dump() == Session.model_validate(session_payload()).model_dump()
+
+    def test_uses_less_memory(self):
+        raw = [json.dumps(session_payload(f"s{n}", runs=2, items=20)) for n in range(50)]
+
+        models = allocated(lambda: [Session.model_validate(json.loads(data)) for data in raw])
+        compact = allocated(
+            lambda: CompactStore().sessions(Session.model_validate(json.loads(data)) for data in raw)
+        )
+
+        assert compact < models / 2
@@ -0,0 +1,72 @@
+"""Trusted response construction tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from agentview import AgentView, PublicAgentView
+from agentview._construct import construct_model
+from agentview.models import Run, Session, Space, User
+
+from .payloads import make_run, make_session, make_user
+
+
+def large_session(runs: int = 10, items: int = 100) -> dict:
+    return make_session("s1", runs=[make_run(f"r{n}", session_id="s1", items=items) for n in range(runs)])
+
+
+class TestConstructModel:
+    def test_matches_validation(self):
+        data = large_session()
+
+        constructed = construct_model(Session, data)
+
+        assert constructed == Session.model_validate(data)
+        assert constructed.space is Space.PLAYGROUND
+        assert constructed.runs[3].session_items[7].created_at.tzinfo is not None
+
+    def test_defaults_and_fields_set_match_validation(self):
+        data = make_run()
+        del data["finishedAt"], data["versionId"]
+
+        constructed = construct_model(Run, data)
+        validated = Run.model_validate(data)
+
+        assert constructed.finished_at is None
+        assert constructed.model_fields_set == validated.model_fields_set
+        assert constructed.model_dump(exclude_unset=True) == validated.model_dump(exclude_unset=True)
+
+    def test_ignores_unknown_fields(self):
+        data = {**make_user(), "lastSeenAt": None}
+
+        assert construct_model(User, data) == User.model_validate(data)
+
+    def test_malformed_data_falls_back_to_validation(self):
+        data = make_user()
+        del data["token"]
+
+        with pytest.raises(ValidationError):
+            construct_model(User, data)
+
+    def test_space_separated_timestamps(self):
+        data = {**make_user(), "createdAt": "2025-12-11 08:25:10.144334+00"}
+
+        assert construct_model(User, data).created_at == User.model_validate(data).created_at
+
+
+class TestTrustedResponses:
+    def test_clients_return_same_objects(self):
+        data = large_session(runs=2, items=5)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=data))
+
+        trusted = AgentView(api_base_url="http://test", api_key="key", transport=transport, trusted_responses=True)
+        public = PublicAgentView(
+            api_base_url="http://test", user_token="token", transport=transport, trusted_responses=True
+        )
+        default = AgentView(api_base_url="http://test", api_key="key", transport=transport)
+
+        assert trusted.get_session("s1") == default.get_session("s1") == public.get_session("s1")
+        assert trusted.as_("token").get_session("s1") == default.get_session("s1")
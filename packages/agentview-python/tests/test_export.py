@@ -0,0 +1,117 @@
+"""Session export tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from agentview import AgentView, AgentViewError
+from agentview.export import export_sessions
+
+from .payloads import make_run, make_session, make_sessions_page
+
+
+class ExportAPI:
+    def __init__(self, total: int):
+        self.ids = [f"s{n}" for n in range(total)]
+        self.deleted: set[str] = set()
+        self.failing: set[str] = set()
+        self.fetched: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/api/sessions":
+            page = int(request.url.params["page"])
+            limit = int(request.url.params["limit"])
+            return httpx.Response(200, json=make_sessions_page(self.ids, page, limit))
+        id = path.rsplit("/", 1)[-1]
+        self.fetched.append(id)
+        if id in self.deleted:
+            return httpx.Response(404, json={"message": "Session not found"})
+        if id in self.failing:
+            return httpx.Response(500, json={"message": "Internal error"})
+        return httpx.Response(200, json=make_session(id, runs=[make_run(f"r-{id}", session_id=id, items=2)]))
+
+    def client(self) -> AgentView:
+        return AgentView(api_base_url="http://test", api_key="key", transport=httpx.MockTransport(self), retry=None)
+
+
+def read_ids(path: Path) -> list[str]:
+    return [json.loads(line)["id"] for line in path.read_text().splitlines()]
+
+
+class TestExport:
+    def test_exports_full_sessions_to_jsonl(self, tmp_path: Path):
+        api = ExportAPI(total=45)
+        output = tmp_path / "sessions.jsonl"
+
+        result = export_sessions(api.client(), output, limit=10, concurrency=4)
+
+        assert result.exported == 45
+        assert sorted(read_ids(output)) == sorted(api.ids)
+        first = json.loads(output.read_text().splitlines()[0])
+        assert len(first["runs"][0]["sessionItems"]) == 2
+        assert first["user"]["id"] == "u1"
+        assert "token" not in first["user"]
+
+    def test_skips_deleted_sessions(self, tmp_path: Path):
+        api = ExportAPI(total=10)
+        api.deleted = {"s3", "s7"}
+        output = tmp_path / "sessions.jsonl"
+
+        result = export_sessions(api.client(), output, limit=4)
+
+        assert (result.exported, result.skipped) == (8, 2)
+        assert sorted(read_ids(output)) == sorted(set(api.ids) - api.deleted)
+
+    def test_resumes_from_checkpoint(self, tmp_path: Path):
+        api = ExportAPI(total=60)
+        api.failing = {"s37"}
+        output = tmp_path / "sessions.jsonl"
+        checkpoint = tmp_path / "export.ckpt"
+
+        options = dict(limit=10, concurrency=3, checkpoint=checkpoint, checkpoint_every=5)
+
+        with pytest.raises(AgentViewError):
+            export_sessions(api.client(), output, **options)
+        state = json.loads(checkpoint.read_text())
+        assert 0 < state["exported"] < 60 and not state["complete"]
+
+        api.failing.clear()
+        api.fetched.clear()
+        result = export_sessions(api.client(), output, **options)
+
+        ids = read_ids(output)
+        assert sorted(ids) == sorted(api.ids)
+        assert result.exported == 60
+        assert result.resumed_from_page is not None and result.resumed_from_page > 1
+        assert len(api.fetched) < 60
+
+        # A finished export is not repeated
+        api.fetched.clear()
+        export_sessions(api.client(), output, **options)
+        assert api.fetched == []
+
+    def test_checkpoint_of_different_export_is_rejected(self, tmp_path: Path):
+        api = ExportAPI(total=5)
+        checkpoint = tmp_path / "export.ckpt"
+        export_sessions(api.client(), tmp_path / "a.jsonl", agent="a", checkpoint=checkpoint)
+
+        with pytest.raises(ValueError):
+            export_sessions(api.client(), tmp_path / "a.jsonl", agent="b", checkpoint=checkpoint)
+
+    def test_exports_parquet_parts(self, tmp_path: Path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        api = ExportAPI(total=25)
+        output = tmp_path / "sessions.parquet"
+
+        export_sessions(api.client(), output, limit=10, checkpoint_every=10)
+
+        table = pq.read_table(output)
+        assert len(list(output.glob("part-*.parquet"))) == 3
+        assert sorted(table.column("id").to_pylist()) == sorted(api.ids)
+        assert json.loads(table.column("runs")[0].as_py())[0]["sessionItems"]
@@ -0,0 +1,105 @@
+"""Run keep-alive tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+
+import httpx
+
+from agentview import AgentView
+
+from .payloads import make_run
+
+
+class KeepAliveAPI:
+    def __init__(self) -> None:
+        self.keep_alives: Counter[str] = Counter()
+        self.finished: set[str] = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        parts = request.url.path.split("/")
+        if parts[-1] == "keep-alive":
+            run_id = parts[-2]
+            self.keep_alives[run_id] += 1
+            if run_id == "missing":
+                return httpx.Response(404, json={"message": "Run not found"})
+            expires_at = None if run_id in self.finished else "2025-12-11T08:26:00Z"
+            return httpx.Response(200, json={"expiresAt": expires_at})
+        status = json.loads(request.content).get("status", "in_progress")
+        return httpx.Response(201, json=make_run(parts[-1], status=status))
+
+    def client(self, interval: float = 0.02) -> AgentView:
+        return AgentView(
+            api_base_url="http://test",
+            api_key="key",
+            transport=httpx.MockTransport(self),
+            keep_alive_interval=interval,
+        )
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert condition()
+
+
+class TestKeepAlive:
+    def test_keep_alive_run(self):
+        api = KeepAliveAPI()
+
+        assert api.client().keep_alive_run("r1") == {"expiresAt": "2025-12-11T08:26:00Z"}
+
+    def test_many_runs_share_one_timer(self):
+        api = KeepAliveAPI()
+        client = api.client()
+        threads_before = threading.active_count()
+
+        for n in range(20):
+            client.start_keep_alive(f"r{n}")
+        wait_for(lambda: all(api.keep_alives[f"r{n}"] >= 2 for n in range(20)))
+
+        # one timer thread plus a small bounded worker pool
+        assert threading.active_count() - threads_before <= 5
+        client.close()
+        assert len(client._heartbeat) == 0
+
+    def test_stops_when_update_run_finishes(self):
+        api = KeepAliveAPI()
+        client = api.client()
+
+        client.start_keep_alive("r1")
+        wait_for(lambda: api.keep_alives["r1"] >= 1)
+        client.update_run("r1", status="completed")
+
+        assert "r1" not in client._heartbeat
+        client.close()
+
+    def test_stops_when_api_reports_finished_or_missing(self):
+        api = KeepAliveAPI()
+        api.finished.add("r1")
+        client = api.client()
+
+        client.start_keep_alive("r1")
+        client.start_keep_alive("missing")
+        wait_for(lambda: "r1" not in client._heartbeat and "missing" not in client._heartbeat)
+
+        assert api.keep_alives["r1"] == 1
+        assert api.keep_alives["missing"] == 1
+        client.close()
+
+    def test_run_writer_keeps_run_alive(self):
+        api = KeepAliveAPI()
+        client = api.client()
+
+        writer = client.create_run_writer(session_id="s1", version="1.0.0", items=[], flush_interval=60)
+        assert writer.id in client._heartbeat
+        wait_for(lambda: api.keep_alives[writer.id] >= 1)
+        writer.finish()
+
+        assert writer.id not in client._heartbeat
+        client.close()
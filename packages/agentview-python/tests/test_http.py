@@ -0,0 +1,483 @@
+"""HTTP layer tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from agentview import (
+    AgentView,
+    AgentViewError,
+    PublicAgentView,
+    RequestCompression,
+    RequestLimiter,
+    RetryEvent,
+    RetryPolicy,
+)
+from agentview._json import get_codec
+
+from .payloads import make_run, make_user
+
+USER = make_user()
+
+
+def make_transport(requests: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=USER)
+
+    return httpx.MockTransport(handler)
+
+
+class TestConnectionPool:
+    def test_reuses_client_across_calls(self):
+        requests: list[httpx.Request] = []
+        client = AgentView(api_base_url="http://test", api_key="key", transport=make_transport(requests))
+
+        client.get_user(id="u1")
+        pooled = client._http._pool.client
+        client.get_user(id="u1")
+
+        assert client._http._pool.client is pooled
+        assert len(requests) == 2
+        client.close()
+
+    def test_as_shares_pool_and_scopes_headers(self):
+        requests: list[httpx.Request] = []
+        client = AgentView(api_base_url="http://test", api_key="key", transport=make_transport(requests))
+
+        scoped = client.as_("user-token")
+        scoped.get_user()
+
+        assert scoped._http._pool is client._http._pool
+        assert requests[0].headers["X-User-Token"] == "user-token"
+        assert requests[0].headers["Authorization"] == "Bearer key"
+        assert client._http.user_token is None
+
+    def test_as_reuses_recent_scoped_clients(self):
+        requests: list[httpx.Request] = []
+        client = AgentView(
+            api_base_url="http://test", api_key="key", transport=make_transport(requests), max_scoped_clients=2
+        )
+
+        a = client.as_("a")
+        assert client.as_("a") is a
+        assert client.as_(client.as_("b").get_user()) is client.as_("user-token")
+        assert a.as_("b") is client.as_("b")
+        assert client.as_("a") is not a
+        assert len(client._scopes) == 2
+
+    def test_as_without_registry(self):
+        client = AgentView(api_base_url="http://test", api_key="key", max_scoped_clients=0)
+
+        assert client.as_("a") is not client.as_("a")
+        assert len(client._scopes) == 0
+
+    def test_scoped_close_keeps_parent_pool_open(self):
+        requests: list[httpx.Request] = []
+        client = AgentView(api_base_url="http://test", api_key="key", transport=make_transport(requests))
+        pooled = client._http._pool.client
+
+        client.as_("user-token").close()
+
+        assert not pooled.is_closed
+        client.close()
+        assert pooled.is_closed
+
+    def test_context_manager_closes(self):
+        requests: list[httpx.Request] = []
+        with PublicAgentView(
+            api_base_url="http://test", user_token="user-token", transport=make_transport(requests)
+        ) as client:
+            client.get_me()
+            pooled = client._http._pool.client
+
+        assert pooled.is_closed
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self):
+        requests: list[httpx.Request] = []
+        async with AgentView(
+            api_base_url="http://test", api_key="key", transport=make_transport(requests)
+        ) as client:
+            await client.aget_user(id="u1")
+            pooled = client._http._pool.async_client
+            await client.as_("user-token").aget_user()
+
+            assert client._http._pool.async_client is pooled
+
+        assert pooled.is_closed
+        assert len(requests) == 2
+
+    def test_async_client_per_loop(self):
+        requests: list[httpx.Request] = []
+        client = AgentView(api_base_url="http://test", api_key="key", transport=make_transport(requests))
+        pooled: list[httpx.AsyncClient] = []
+
+        async def fetch(close: bool) -> None:
+            await client.aget_user(id="u1")
+            pooled.append(client._http._pool.async_client)
+            if close:
+                await client.as_("token").aclose_loop()
+
+        asyncio.run(fetch(close=True))
+        idle = asyncio.new_event_loop()
+        idle.run_until_complete(fetch(close=False))
+
+        assert pooled[0].is_closed and not pooled[1].is_closed
+        client.close()
+        assert pooled[1].is_closed
+        idle.close()
+
+
+FAST_RETRY = RetryPolicy(backoff_base=0, jitter=False)
+
+
+def flaky_client(responses: list[httpx.Response | Exception], requests: list[httpx.Request], **kwargs):
+    """A client whose transport returns (or raises) `responses` in order."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    kwargs.setdefault("retry", FAST_RETRY)
+    return AgentView(api_base_url="http://test", api_key="key", transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestRetry:
+    def test_retries_idempotent_get(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client([httpx.Response(503), httpx.Response(502), httpx.Response(200, json=USER)], requests)
+
+        assert client.get_user(id="u1").id == "u1"
+        assert len(requests) == 3
+        assert client.retry_stats.retries == 2
+
+    def test_gives_up_after_max_retries(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client([httpx.Response(503)] * 4, requests)
+
+        with pytest.raises(AgentViewError) as exc_info:
+            client.get_user(id="u1")
+
+        assert exc_info.value.status_code == 503
+        assert len(requests) == 4
+        assert client.retry_stats.exhausted == 1
+
+    def test_does_not_retry_patch_after_server_error(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client([httpx.Response(503), httpx.Response(201, json=make_run())], requests)
+
+        with pytest.raises(AgentViewError):
+            client.update_run("r1", status="completed")
+        assert len(requests) == 1
+
+    def test_does_not_retry_patch_after_read_error(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client([httpx.ReadTimeout("timed out"), httpx.Response(201, json=make_run())], requests)
+
+        with pytest.raises(httpx.ReadTimeout):
+            client.update_run("r1", status="completed")
+
+    def test_retries_any_method_when_not_sent(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client([httpx.ConnectError("refused"), httpx.Response(201, json=make_run())], requests)
+
+        client.update_run("r1", status="completed")
+        assert len(requests) == 2
+
+    def test_honours_retry_after_on_429(self):
+        requests: list[httpx.Request] = []
+        events: list[RetryEvent] = []
+        client = flaky_client(
+            [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(201, json=make_run())],
+            requests,
+            retry=RetryPolicy(backoff_base=10, on_retry=events.append),
+        )
+
+        client.update_run("r1", status="completed")
+
+        assert len(requests) == 2
+        assert events[0].status_code == 429
+        assert events[0].delay == 0
+        assert events[0].path == "/api/runs/r1"
+
+    def test_create_run_retries_with_same_idempotency_key(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client([httpx.ReadError("reset"), httpx.Response(201, json=make_run())], requests)
+
+        client.create_run(session_id="s1", version="1.0.0", items=[{"content": "hi"}])
+
+        keys = [request.headers["Idempotency-Key"] for request in requests]
+        assert len(keys) == 2 and keys[0] == keys[1]
+
+    def test_explicit_idempotency_key(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client([httpx.Response(201, json=make_run())], requests)
+
+        client.create_run(session_id="s1", version="1.0.0", items=[], idempotency_key="run-1")
+
+        assert requests[0].headers["Idempotency-Key"] == "run-1"
+
+    def test_retry_disabled(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client([httpx.Response(503), httpx.Response(200, json=USER)], requests, retry=None)
+
+        with pytest.raises(AgentViewError):
+            client.get_user(id="u1")
+
+    @pytest.mark.asyncio
+    async def test_async_retry(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client([httpx.ConnectError("refused"), httpx.Response(200, json=USER)], requests)
+
+        assert (await client.aget_user(id="u1")).id == "u1"
+        assert client.as_("token").retry_stats.retries == 1
+
+
+class InFlight:
+    """Transport handlers that record the peak number of concurrent requests."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self) -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.current -= 1
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        time.sleep(self.delay)
+        self._exit()
+        return httpx.Response(200, json=USER)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        await asyncio.sleep(self.delay)
+        self._exit()
+        return httpx.Response(200, json=USER)
+
+
+class TestRequestLimiter:
+    @pytest.mark.asyncio
+    async def test_caps_async_fan_out(self):
+        in_flight = InFlight()
+        client = AgentView(
+            api_base_url="http://test",
+            api_key="key",
+            transport=httpx.MockTransport(in_flight.async_handler),
+            limiter=RequestLimiter(max_concurrency=3),
+        )
+
+        await asyncio.gather(*(client.aget_user(id=f"u{n}") for n in range(12)))
+
+        assert in_flight.peak == 3
+        assert client.limiter is not None and client.limiter.in_flight == 0
+
+    def test_caps_threads_across_scoped_clients(self):
+        in_flight = InFlight()
+        client = AgentView(
+            api_base_url="http://test",
+            api_key="key",
+            transport=httpx.MockTransport(in_flight.handler),
+            limiter=RequestLimiter(max_concurrency=2),
+        )
+        scoped = [client.as_(f"token-{n}") for n in range(6)]
+
+        threads = [threading.Thread(target=c.get_user, kwargs={"id": "u1"}) for c in scoped]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert in_flight.peak == 2
+        assert scoped[0].limiter is client.limiter
+
+    def test_rate_limits_after_burst(self):
+        requests: list[httpx.Request] = []
+        client = AgentView(
+            api_base_url="http://test",
+            api_key="key",
+            transport=make_transport(requests),
+            limiter=RequestLimiter(rate=50, burst=2),
+        )
+
+        started = time.monotonic()
+        for _ in range(5):
+            client.get_user(id="u1")
+
+        # 2 requests from the burst, then 3 more at 50/s
+        assert time.monotonic() - started >= 0.05
+        assert len(requests) == 5
+
+    def test_adaptive_backs_off_on_429_and_recovers(self):
+        requests: list[httpx.Request] = []
+        client = flaky_client(
+            [httpx.Response(429, headers={"Retry-After": "0"})] + [httpx.Response(200, json=USER)] * 60,
+            requests,
+            limiter=RequestLimiter(rate=1000, max_concurrency=8, adaptive=True),
+        )
+        limiter = client.limiter
+        assert limiter is not None
+
+        # halved by the 429, then one successful retry adds 1/limit and 1% of the max rate
+        client.get_user(id="u1")
+        assert limiter.concurrency == 4.25
+        assert limiter.rate == 510
+
+        for _ in range(59):
+            client.get_user(id="u1")
+        assert limiter.concurrency == 8
+        assert limiter.rate == 1000
+
+    def test_adaptive_backs_off_on_slow_responses(self):
+        limiter = RequestLimiter(max_concurrency=10, adaptive=True, latency_threshold=0.5)
+
+        limiter.record(200, 1.0)
+        limiter.record(200, 1.0)  # within the cooldown: no second cut
+
+        assert limiter.concurrency == 5
+
+
+def available_codecs() -> list[str]:
+    names = ["json"]
+    for name in ("orjson", "msgspec"):
+        try:
+            get_codec(name)  # type: ignore[arg-type]
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+class TestJSONCodec:
+    @pytest.mark.parametrize("codec", available_codecs())
+    def test_encodes_models_and_decodes_responses(self, codec: str):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=make_run(items=3))
+
+        client = AgentView(
+            api_base_url="http://test", api_key="key", transport=httpx.MockTransport(handler), json_codec=codec
+        )
+        run = client.create_run(session_id="s1", items=[{"content": "héllo"}], version="1", status="in_progress")
+
+        assert client._http.codec.name == codec
+        assert json.loads(requests[0].content) == {
+            "sessionId": "s1",
+            "items": [{"content": "héllo"}],
+            "version": "1",
+            "status": "in_progress",
+        }
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert len(run.session_items) == 3
+
+    @pytest.mark.parametrize("codec", available_codecs())
+    def test_encodes_dict_bodies_with_nested_models(self, codec: str):
+        from agentview import ConfigCreate
+
+        encoded = get_codec(codec).dumps({"config": ConfigCreate(config={"a": 1}), "n": [1, None]})  # type: ignore[arg-type]
+
+        assert json.loads(encoded) == {"config": {"config": {"a": 1}}, "n": [1, None]}
+
+    def test_decodes_error_bodies(self):
+        client = flaky_client([httpx.Response(404, json={"message": "Not found", "code": "x"})], [], retry=None)
+
+        with pytest.raises(AgentViewError) as error:
+            client.get_user(id="u1")
+
+        assert error.value.message == "Not found"
+        assert error.value.details == {"code": "x"}
+
+    def test_custom_codec(self):
+        class CountingCodec:
+            name = "counting"
+
+            def __init__(self):
+                self.loads_calls = 0
+
+            def dumps(self, obj):
+                return json.dumps(obj).encode()
+
+            def loads(self, data):
+                self.loads_calls += 1
+                return json.loads(data)
+
+        codec = CountingCodec()
+        client = AgentView(
+            api_base_url="http://test", api_key="key", transport=make_transport([]), json_codec=codec
+        )
+        client.get_user(id="u1")
+        client.as_("token").get_user()
+
+        assert codec.loads_calls == 2
+
+    def test_auto_prefers_installed_library(self):
+        available = available_codecs()
+        expected = next((name for name in ("orjson", "msgspec") if name in available), "json")
+
+        assert get_codec("auto").name == expected
+
+
+class TestCompression:
+    def client(self, requests: list[httpx.Request], compression: RequestCompression) -> AgentView:
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            body = gzip.compress(json.dumps(make_run()).encode())
+            return httpx.Response(200, content=body, headers={"Content-Encoding": "gzip"})
+
+        return AgentView(
+            api_base_url="http://test",
+            api_key="key",
+            transport=httpx.MockTransport(handler),
+            compression=compression,
+        )
+
+    def test_compresses_large_bodies(self):
+        requests: list[httpx.Request] = []
+        client = self.client(requests, RequestCompression(threshold=1024))
+        items = [{"role": "assistant", "content": "word " * 1000}]
+
+        run = client.create_run(session_id="s1", items=items, version="1")
+        client.update_run("r1", status="completed")
+
+        assert requests[0].headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(requests[0].content))["items"] == items
+        assert len(requests[0].content) < 1024
+        assert "Content-Encoding" not in requests[1].headers
+        assert "gzip" in requests[1].headers["Accept-Encoding"]
+        assert run.id == "r1"
+
+    def test_zstd(self):
+        zstandard = pytest.importorskip("zstandard")
+        requests: list[httpx.Request] = []
+        client = self.client(requests, RequestCompression("zstd", threshold=0))
+
+        client.update_run("r1", status="completed")
+
+        assert requests[0].headers["Content-Encoding"] == "zstd"
+        assert json.loads(zstandard.ZstdDecompressor().decompress(requests[0].content)) == {"status": "completed"}
+
+    def test_rejects_unknown_encodings(self):
+        with pytest.raises(ValueError, match="brotli"):
+            RequestCompression("brotli")  # type: ignore[arg-type]
@@ -0,0 +1,55 @@
+"""Import-time tests for AgentView Python SDK.
+
+Importing the package must stay cheap: public names load on first use.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import agentview
+
+# Generous enough for slow CI machines; eager imports cost ~150ms
+IMPORT_BUDGET_US = 50_000
+
+
+def importtime(code: str) -> dict[str, int]:
+    """Runs `code` under `python -X importtime`, returning cumulative microseconds per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyImport:
+    def test_import_does_not_load_dependencies(self):
+        times = importtime("import agentview")
+
+        assert "agentview" in times
+        assert not {"httpx", "pydantic", "agentview.models", "agentview.client"} & times.keys()
+
+    def test_import_time_budget(self):
+        times = importtime("import agentview")
+
+        assert times["agentview"] < IMPORT_BUDGET_US
+
+    def test_names_load_on_first_use(self):
+        times = importtime("import agentview; agentview.AgentView")
+
+        assert "httpx" in times and "agentview.models" in times
+
+    def test_all_names_resolve(self):
+        for name in agentview.__all__:
+            assert getattr(agentview, name) is not None
+        assert set(agentview.__all__) <= set(dir(agentview))
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError):
+            agentview.DoesNotExist  # noqa: B018
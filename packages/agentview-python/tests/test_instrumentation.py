@@ -0,0 +1,159 @@
+"""Instrumentation tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import httpx
+import pytest
+
+from agentview import AgentView, AgentViewError, Instrumentation, RequestInfo, RetryPolicy
+from agentview._instrumentation import Histogram, route_template
+
+from .payloads import make_run, make_session, make_user
+
+
+def api(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path.startswith("/api/users/"):
+        return httpx.Response(200, json=make_user())
+    if path == "/api/runs" or path.startswith("/api/runs/"):
+        return httpx.Response(200, json=make_run(items=3))
+    if path == "/api/sessions/missing":
+        return httpx.Response(404, json={"message": "Session not found"})
+    return httpx.Response(200, json=make_session())
+
+
+def make_client(instrumentation: Instrumentation | None, handler=api, **kwargs) -> AgentView:
+    return AgentView(
+        api_base_url="http://test",
+        api_key="key",
+        transport=httpx.MockTransport(handler),
+        instrumentation=instrumentation,
+        **kwargs,
+    )
+
+
+class TestRouteTemplate:
+    @pytest.mark.parametrize(
+        "path, route",
+        [
+            ("/api/runs/r1", "/api/runs/{run_id}"),
+            ("/api/runs/r1/keep-alive", "/api/runs/{run_id}/keep-alive"),
+            ("/api/runs", "/api/runs"),
+            ("/api/users/me", "/api/users/me"),
+            ("/api/users/by-external-id/ext?space=playground", "/api/users/by-external-id/{external_id}"),
+            ("/api/sessions/s1/star", "/api/sessions/{session_id}/star"),
+            ("/api/public/sessions/s1", "/api/public/sessions/{session_id}"),
+            ("/api/sessions/s1/items/i1/scores", "/api/sessions/{session_id}/items/{item_id}/scores"),
+            (
+                "/api/sessions/s1/items/i1/comments/c1",
+                "/api/sessions/{session_id}/items/{item_id}/comments/{comment_id}",
+            ),
+        ],
+    )
+    def test_routes(self, path: str, route: str):
+        assert route_template(path) == route
+
+
+class TestInstrumentation:
+    def test_hooks_see_request_and_phases(self):
+        seen: list[tuple[str, RequestInfo]] = []
+        instrumentation = Instrumentation(
+            pre_request=lambda info: seen.append(("pre", info)),
+            post_request=lambda info: seen.append(("post", info)),
+        )
+        client = make_client(instrumentation)
+
+        client.create_run(session_id="s1", items=[{"content": "hi"}], version="1")
+
+        assert [stage for stage, _ in seen] == ["pre", "post"]
+        info = seen[1][1]
+        assert (info.method, info.route, info.status_code, info.attempts) == ("POST", "/api/runs", 200, 1)
+        assert info.request_bytes > 0 and info.response_bytes > 0
+        assert 0 < info.serialize and 0 < info.network and 0 < info.decode
+        assert info.duration >= info.serialize + info.network + info.decode
+
+    def test_metrics_per_route(self):
+        instrumentation = Instrumentation()
+        client = make_client(instrumentation)
+
+        client.update_run("r1", status="completed")
+        client.update_run("r2", status="completed")
+        client.get_session("s1")
+        with pytest.raises(AgentViewError):
+            client.get_session("missing")
+
+        snapshot = instrumentation.snapshot()
+        runs = snapshot["/api/runs/{run_id}"]
+        sessions = snapshot["/api/sessions/{session_id}"]
+        assert runs["requests"] == 2 and runs["errors"] == 0
+        assert runs["phases"]["validate"]["count"] == 2
+        assert sessions["requests"] == 2 and sessions["errors"] == 1
+        assert sessions["status_codes"] == {"200": 1, "404": 1}
+        assert sessions["phases"]["validate"]["count"] == 1
+
+    def test_counts_retries(self):
+        responses = [httpx.Response(503), httpx.Response(200, json=make_user())]
+        instrumentation = Instrumentation()
+        client = make_client(
+            instrumentation, lambda request: responses.pop(0), retry=RetryPolicy(backoff_base=0, jitter=False)
+        )
+
+        client.get_user(id="u1")
+
+        metrics = instrumentation.route_metrics("/api/users/{user_id}")
+        assert metrics is not None and metrics.retries == 1
+
+    async def test_async_and_scoped_clients_share_instrumentation(self):
+        instrumentation = Instrumentation()
+        client = make_client(instrumentation)
+
+        await client.aget_user(id="u1")
+        await client.as_("token").aget_session("s1")
+
+        assert client.instrumentation is instrumentation
+        snapshot = instrumentation.snapshot()
+        assert snapshot["/api/users/{user_id}"]["phases"]["validate"]["count"] == 1
+        assert snapshot["/api/sessions/{session_id}"]["requests"] == 1
+
+    def test_disabled_by_default(self):
+        client = make_client(None)
+
+        client.get_user(id="u1")
+
+        assert client.instrumentation is None
+        assert client._parse.__name__ == "validate_model"
+
+    def test_opentelemetry_spans(self):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        client = make_client(Instrumentation(tracer=provider.get_tracer("test")))
+
+        client.get_session("s1")
+        with pytest.raises(AgentViewError):
+            client.get_session("missing")
+
+        spans = exporter.get_finished_spans()
+        names = [span.name for span in spans]
+        assert names.count("GET /api/sessions/{session_id}") == 2
+        assert "validate Session" in names
+        failed = [span for span in spans if span.attributes.get("http.response.status_code") == 404]
+        assert len(failed) == 1 and not failed[0].status.is_ok
+
+
+class TestHistogram:
+    def test_quantiles(self):
+        histogram = Histogram((0.01, 0.1, 1.0))
+        for value in (0.005, 0.005, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        assert histogram.quantile(0.4) == 0.01
+        assert histogram.quantile(0.6) == 0.1
+        assert histogram.quantile(1.0) == float("inf")
+        assert histogram.to_dict()["buckets"] == {"0.01": 2, "0.1": 1, "1.0": 1, "inf": 1}
@@ -0,0 +1,137 @@
+"""Lazy content decoding tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import copy
+import pickle
+from typing import Any
+
+import httpx
+import pytest
+
+from agentview import AgentView, PublicAgentView, ResponseCache, Session
+
+from .payloads import make_run, make_session, make_sessions_page
+
+msgspec = pytest.importorskip("msgspec")
+
+
+def session_payload() -> dict[str, Any]:
+    run = make_run("r1", status="completed", items=3)
+    run["metadata"] = {"model": "gpt", "tokens": 1200}
+    run["sessionItems"][1]["content"] = {"role": "tool", "output": "x" * 10_000, "lines": list(range(50))}
+    session = make_session("s1", runs=[run])
+    session["metadata"] = {"customer": "acme"}
+    session["state"] = {"step": 3}
+    return session
+
+
+def make_client(**kwargs: Any) -> AgentView:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/sessions":
+            return httpx.Response(200, json=make_sessions_page(["s1", "s2"]))
+        if request.url.path == "/api/runs":
+            return httpx.Response(200, json=make_run("r2", items=2))
+        return httpx.Response(200, json=session_payload())
+
+    return AgentView(
+        api_base_url="http://test", api_key="key", transport=httpx.MockTransport(handler), retry=None, **kwargs
+    )
+
+
+def raw_fields(session: Session) -> list[str]:
+    names = [name for name in ("metadata", "state") if isinstance(session.__dict__[name], msgspec.Raw)]
+    for run in session.runs:
+        if isinstance(run.__dict__["metadata"], msgspec.Raw):
+            names.append(f"{run.id}.metadata")
+        names += [item.id for item in run.session_items if isinstance(item.__dict__["content"], msgspec.Raw)]
+    return names
+
+
+class TestLazyContent:
+    @pytest.mark.parametrize("trusted_responses", [False, True])
+    def test_keeps_large_fields_raw_until_accessed(self, trusted_responses: bool):
+        session = make_client(lazy_content=True, trusted_responses=trusted_responses).get_session("s1")
+
+        assert raw_fields(session) == ["metadata", "state", "r1.metadata", "r1-i0", "r1-i1", "r1-i2"]
+        assert session.runs[0].status == "completed"
+        item = session.runs[0].session_items[1]
+        assert item.content["output"] == "x" * 10_000
+        # Decoded once, then stored in place of the raw value
+        assert item.__dict__["content"] is item.content
+        assert session.metadata == {"customer": "acme"}
+        assert session.runs[0].metadata == {"model": "gpt", "tokens": 1200}
+        assert raw_fields(session) == ["state", "r1-i0", "r1-i2"]
+
+    def test_matches_eager_decoding(self):
+        lazy = make_client(lazy_content=True).get_session("s1")
+        eager = make_client().get_session("s1")
+
+        assert raw_fields(eager) == []
+        assert lazy.model_dump_json(by_alias=True) == eager.model_dump_json(by_alias=True)
+        assert lazy.model_dump(by_alias=True) == eager.model_dump(by_alias=True)
+
+    def test_raw_values_survive_copy_and_pickle(self):
+        session = make_client(lazy_content=True).get_session("s1")
+
+        for clone in (copy.deepcopy(session), pickle.loads(pickle.dumps(session))):
+            assert clone.runs[0].session_items[1].content["lines"] == list(range(50))
+            assert clone.state == {"step": 3}
+
+    def test_assignment_replaces_raw_value(self):
+        session = make_client(lazy_content=True).get_session("s1")
+        session.state = {"step": 4}
+
+        assert session.state == {"step": 4}
+        assert session.model_dump()["state"] == {"step": 4}
+
+    def test_session_pages_and_runs(self):
+        client = make_client(lazy_content=True)
+
+        page = client.get_sessions()
+        assert isinstance(page.sessions[0].__dict__["metadata"], msgspec.Raw)
+        assert page.sessions[0].metadata is None
+
+        run = client.create_run(session_id="s1", items=[], version="1")
+        assert isinstance(run.session_items[0].__dict__["content"], msgspec.Raw)
+        assert run.session_items[0].content == {"role": "user", "content": "item r2-i0"}
+
+    async def test_async(self):
+        session = await make_client(lazy_content=True).aget_session("s1")
+
+        assert "r1-i1" in raw_fields(session)
+        assert session.runs[0].session_items[1].content["role"] == "tool"
+
+    def test_cached_sessions_stay_lazy(self):
+        client = make_client(lazy_content=True, cache=ResponseCache())
+
+        first = client.get_session("s1")
+        first.runs[0].session_items[0].content
+        second = client.get_session("s1")
+
+        assert "r1-i0" in raw_fields(second)
+        assert second.runs[0].session_items[0].content == first.runs[0].session_items[0].content
+
+    def test_non_lazy_fields_are_still_validated(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            payload = session_payload()
+            payload["space"] = "nowhere"
+            return httpx.Response(200, json=payload)
+
+        client = AgentView(
+            api_base_url="http://test", api_key="key", transport=httpx.MockTransport(handler), lazy_content=True
+        )
+        with pytest.raises(ValueError):
+            client.get_session("s1")
+
+    def test_public_client(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=session_payload())
+
+        client = PublicAgentView(
+            api_base_url="http://test", user_token="t", transport=httpx.MockTransport(handler), lazy_content=True
+        )
+        session = client.get_session("s1")
+
+        assert "r1-i1" in raw_fields(session)
@@ -0,0 +1,127 @@
+"""Session pagination tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from agentview import AgentView, AgentViewError, PublicAgentView
+
+from .payloads import make_sessions_page
+
+
+class SessionsAPI:
+    def __init__(self, total: int, delay: float = 0.0):
+        self.ids = [f"s{n}" for n in range(total)]
+        self.delay = delay
+        self.pages: list[int] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.fail_page: int | None = None
+
+    def page(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        limit = int(request.url.params.get("limit", "50"))
+        self.pages.append(page)
+        if page == self.fail_page:
+            return httpx.Response(400, json={"message": "Bad page"})
+        return httpx.Response(200, json=make_sessions_page(self.ids, page, limit))
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        return self.page(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return self.page(request)
+
+    def client(self, handler=None) -> AgentView:
+        return AgentView(
+            api_base_url="http://test", api_key="key", transport=httpx.MockTransport(handler or self)
+        )
+
+
+class TestIterSessions:
+    def test_yields_all_pages_lazily(self):
+        api = SessionsAPI(total=25)
+        sessions = api.client().iter_sessions(limit=10)
+
+        assert next(sessions).id == "s0"
+        assert api.pages == [1]
+        assert [s.id for s in sessions] == api.ids[1:]
+        assert api.pages == [1, 2, 3]
+
+    def test_resumes_from_page(self):
+        api = SessionsAPI(total=25)
+        sessions = api.client().iter_sessions(limit=10)
+        for _ in range(12):
+            next(sessions)
+        assert sessions.page == 2
+
+        resumed = api.client().iter_sessions(limit=10, page=sessions.page)
+        assert [s.id for s in resumed] == api.ids[10:]
+
+    def test_skips_sessions_shifted_into_next_page(self):
+        api = SessionsAPI(total=6)
+        sessions = api.client().iter_sessions(limit=3)
+
+        assert [next(sessions).id for _ in range(3)] == ["s0", "s1", "s2"]
+        # s3 was updated and moved to the front, pushing s2 onto page 2
+        api.ids.insert(0, api.ids.pop(3))
+
+        assert [s.id for s in sessions] == ["s4", "s5"]
+
+    def test_empty(self):
+        api = SessionsAPI(total=0)
+
+        assert list(api.client().iter_sessions()) == []
+
+    def test_public_client(self):
+        api = SessionsAPI(total=5)
+        client = PublicAgentView(api_base_url="http://test", user_token="token", transport=httpx.MockTransport(api))
+
+        assert [s.id for s in client.iter_sessions(limit=2)] == api.ids
+
+
+class TestAsyncIterSessions:
+    async def test_prefetches_pages_concurrently(self):
+        api = SessionsAPI(total=100, delay=0.01)
+        client = api.client(api.async_handler)
+
+        ids = [s.id async for s in client.aiter_sessions(limit=10, prefetch=3)]
+
+        assert ids == api.ids
+        assert sorted(api.pages) == list(range(1, 11))
+        assert api.peak == 3
+
+    async def test_early_exit_cancels_prefetch(self):
+        api = SessionsAPI(total=100, delay=0.01)
+        sessions = api.client(api.async_handler).aiter_sessions(limit=10, prefetch=2)
+
+        async for session in sessions:
+            if session.id == "s15":
+                break
+        await sessions.aclose()
+
+        assert sessions.page == 2
+        assert max(api.pages) <= 4
+
+    async def test_error_propagates(self):
+        api = SessionsAPI(total=50)
+        api.fail_page = 3
+
+        with pytest.raises(AgentViewError):
+            async for _ in api.client(api.async_handler).aiter_sessions(limit=10):
+                pass
+
+    async def test_resumes_from_page(self):
+        api = SessionsAPI(total=30)
+
+        ids = [s.id async for s in api.client(api.async_handler).aiter_sessions(limit=10, page=3)]
+
+        assert ids == api.ids[20:]
@@ -0,0 +1,251 @@
+"""RunWriter tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from agentview import AgentView, AgentViewError, Status
+
+from .payloads import make_run
+
+
+class RunsAPI:
+    """Records PATCH bodies sent to /api/runs/{id}, failing them with `status` while `fail` is set."""
+
+    def __init__(self, fail: bool = False, status: int = 422):
+        self.patches: list[dict[str, Any]] = []
+        self.fail = fail
+        self.status = status
+        self.failures = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(201, json=make_run())
+        if self.fail:
+            self.failures += 1
+            return httpx.Response(self.status, json={"message": "Request failed"})
+        body = json.loads(request.content)
+        self.patches.append(body)
+        return httpx.Response(201, json=make_run(status=body.get("status", "in_progress")))
+
+    def client(self) -> AgentView:
+        return AgentView(api_base_url="http://test", api_key="key", transport=httpx.MockTransport(self))
+
+
+def create_writer(api: RunsAPI, **kwargs: Any):
+    return api.client().create_run_writer(
+        session_id="s1", version="1.0.0", items=[{"role": "user", "content": "hi"}], **kwargs
+    )
+
+
+class TestRunWriter:
+    def test_coalesces_until_finish(self):
+        api = RunsAPI()
+        writer = create_writer(api, flush_interval=60)
+
+        writer.append({"content": "a"}, {"content": "b"})
+        writer.append({"content": "c"})
+        writer.update_metadata({"x": 1})
+        writer.update_metadata({"y": 2})
+        writer.set_state({"step": 1})
+        writer.set_state({"step": 2})
+        run = writer.finish()
+
+        assert api.patches == [
+            {
+                "items": [{"content": "a"}, {"content": "b"}, {"content": "c"}],
+                "metadata": {"x": 1, "y": 2},
+                "state": {"step": 2},
+                "status": "completed",
+            }
+        ]
+        assert run.status == "completed"
+
+    def test_flushes_on_size(self):
+        api = RunsAPI()
+        writer = create_writer(api, flush_interval=60, max_batch_items=2)
+
+        writer.append({"content": "a"}, {"content": "b"})
+        deadline = time.monotonic() + 5
+        while not api.patches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        writer.close()
+
+        assert api.patches == [{"items": [{"content": "a"}, {"content": "b"}]}]
+
+    def test_flushes_on_interval(self):
+        api = RunsAPI()
+        writer = create_writer(api, flush_interval=0.05)
+
+        writer.append({"content": "a"})
+        time.sleep(0.3)
+
+        assert api.patches == [{"items": [{"content": "a"}]}]
+        writer.close()
+
+    def test_close_flushes_without_status(self):
+        api = RunsAPI()
+        writer = create_writer(api, flush_interval=60)
+
+        writer.append({"content": "a"})
+        writer.close()
+
+        assert api.patches == [{"items": [{"content": "a"}]}]
+        with pytest.raises(RuntimeError):
+            writer.append({"content": "b"})
+
+    def test_context_manager_fails_run_on_error(self):
+        api = RunsAPI()
+
+        with pytest.raises(ValueError):
+            with create_writer(api, flush_interval=60) as writer:
+                writer.append({"content": "a"})
+                raise ValueError("boom")
+
+        assert api.patches == [
+            {"items": [{"content": "a"}], "status": "failed", "failReason": {"message": "boom"}}
+        ]
+
+    def test_background_error_is_raised_on_next_call(self):
+        api = RunsAPI(fail=True)
+        writer = create_writer(api, flush_interval=0.01)
+
+        writer.append({"content": "a"})
+        time.sleep(0.2)
+
+        with pytest.raises(AgentViewError):
+            writer.append({"content": "b"})
+        with pytest.raises(AgentViewError):
+            writer.close()
+
+    def test_background_flush_stops_after_a_client_error(self):
+        api = RunsAPI(fail=True, status=404)
+        writer = create_writer(api, flush_interval=0.01)
+
+        writer.append({"content": "a"})
+        time.sleep(0.2)
+
+        assert api.failures == 1
+        with pytest.raises(AgentViewError) as error:
+            writer.append({"content": "b"})
+        assert error.value.status_code == 404
+
+    def test_background_flush_retries_transient_errors(self):
+        api = RunsAPI(fail=True, status=503)
+        writer = create_writer(api, flush_interval=0.01)
+
+        writer.append({"content": "a"})
+        deadline = time.monotonic() + 5
+        while api.failures < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        api.fail = False
+        while not api.patches and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert api.patches == [{"items": [{"content": "a"}]}]
+        writer.close()
+
+    def test_failed_flush_keeps_changes(self):
+        api = RunsAPI(fail=True)
+        writer = create_writer(api, flush_interval=60)
+
+        writer.append({"content": "a"})
+        writer.update_metadata({"x": 1, "y": 1})
+        writer.set_state("s1")
+        with pytest.raises(AgentViewError):
+            writer.flush()
+
+        api.fail = False
+        writer.append({"content": "b"})
+        writer.update_metadata({"y": 2})
+        writer.flush()
+
+        assert api.patches == [
+            {"items": [{"content": "a"}, {"content": "b"}], "metadata": {"x": 1, "y": 2}, "state": "s1"}
+        ]
+        writer.close()
+
+    def test_failed_finish_can_be_retried(self):
+        api = RunsAPI(fail=True)
+        writer = create_writer(api, flush_interval=60)
+
+        writer.append({"content": "a"})
+        with pytest.raises(AgentViewError):
+            writer.finish()
+
+        api.fail = False
+        run = writer.finish()
+
+        assert api.patches == [{"items": [{"content": "a"}], "status": "completed"}]
+        assert run.status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_async_writer(self):
+        api = RunsAPI()
+        writer = await api.client().acreate_run_writer(
+            session_id="s1", version="1.0.0", items=[], flush_interval=60, max_batch_items=3
+        )
+
+        writer.append({"content": "a"}, {"content": "b"})
+        writer.set_state("s")
+        writer.append({"content": "c"})
+        await writer.flush()
+        writer.append({"content": "d"})
+        run = await writer.finish(Status.FAILED, fail_reason="stopped")
+
+        assert api.patches == [
+            {"items": [{"content": "a"}, {"content": "b"}, {"content": "c"}], "state": "s"},
+            {"items": [{"content": "d"}], "status": "failed", "failReason": "stopped"},
+        ]
+        assert run.status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_async_failed_flush_keeps_changes(self):
+        api = RunsAPI(fail=True)
+        writer = await api.client().acreate_run_writer(session_id="s1", version="1.0.0", items=[], flush_interval=60)
+
+        writer.append({"content": "a"})
+        with pytest.raises(AgentViewError):
+            await writer.flush()
+
+        api.fail = False
+        writer.set_state("s")
+        await writer.finish()
+
+        assert api.patches == [{"items": [{"content": "a"}], "state": "s", "status": "completed"}]
+
+    @pytest.mark.asyncio
+    async def test_async_background_flush_stops_after_a_client_error(self):
+        api = RunsAPI(fail=True, status=404)
+        writer = await api.client().acreate_run_writer(session_id="s1", version="1.0.0", items=[], flush_interval=0.01)
+
+        writer.append({"content": "a"})
+        await asyncio.sleep(0.2)
+
+        assert api.failures == 1
+        with pytest.raises(AgentViewError) as error:
+            writer.append({"content": "b"})
+        assert error.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_async_background_flush_retries_transient_errors(self):
+        api = RunsAPI(fail=True, status=503)
+        writer = await api.client().acreate_run_writer(session_id="s1", version="1.0.0", items=[], flush_interval=0.01)
+
+        writer.append({"content": "a"})
+        deadline = time.monotonic() + 5
+        while api.failures < 3 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        api.fail = False
+        while not api.patches and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+        assert api.patches == [{"items": [{"content": "a"}]}]
+        await writer.close()
@@ -0,0 +1,86 @@
+"""Score and comment read tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import httpx
+
+from agentview import AgentView, ScoreCreate
+
+SCORE = {
+    "id": "sc1",
+    "sessionItemId": "i1",
+    "name": "accuracy",
+    "value": 0.9,
+    "commentId": None,
+    "createdBy": "u1",
+    "createdAt": "2025-12-11 08:25:10.144334+00",
+    "updatedAt": "2025-12-11 08:25:10.144334+00",
+    "deletedAt": None,
+    "deletedBy": None,
+}
+
+COMMENT = {
+    "id": "c1",
+    "sessionItemId": "i1",
+    "userId": "u1",
+    "content": "Looks wrong",
+    "createdAt": "2025-12-11 08:25:10.144334+00",
+    "updatedAt": None,
+    "deletedAt": None,
+    "deletedBy": None,
+    "score": SCORE,
+}
+
+
+class ScoresAPI:
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/scores"):
+            return httpx.Response(200, json=[SCORE])
+        return httpx.Response(200, json=[COMMENT])
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        return self(request)
+
+    def client(self) -> AgentView:
+        return AgentView(api_base_url="http://test", api_key="key", transport=httpx.MockTransport(self), retry=None)
+
+    def async_client(self) -> AgentView:
+        return AgentView(
+            api_base_url="http://test", api_key="key", transport=httpx.MockTransport(self.handle_async), retry=None
+        )
+
+
+class TestScores:
+    def test_get_session_scores(self):
+        scores = ScoresAPI().client().get_session_scores("s1")
+
+        assert [(score.session_item_id, score.name, score.value) for score in scores] == [("i1", "accuracy", 0.9)]
+
+    async def test_async_get_session_scores(self):
+        scores = await ScoresAPI().async_client().aget_session_scores("s1")
+
+        assert scores[0].id == "sc1"
+
+    def test_legacy_score_create_fields_are_accepted(self):
+        score = ScoreCreate(session_item_id="i1", name="label", value="good", comment_id=None)
+
+        assert score.model_dump(by_alias=True) == {
+            "name": "label",
+            "value": "good",
+            "sessionItemId": "i1",
+            "commentId": None,
+        }
+
+
+class TestComments:
+    def test_get_session_comments(self):
+        comments = ScoresAPI().client().get_session_comments("s1")
+
+        assert [comment.content for comment in comments] == ["Looks wrong"]
+
+    async def test_async_get_session_comments(self):
+        comments = await ScoresAPI().async_client().aget_session_comments("s1")
+
+        assert comments[0].session_item_id == "i1"
+        assert comments[0].score is not None and comments[0].score.name == "accuracy"
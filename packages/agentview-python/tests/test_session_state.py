@@ -0,0 +1,79 @@
+"""SessionState tests for AgentView Python SDK."""
+
+from agentview import Session, SessionState
+
+from .payloads import make_item, make_run, make_session
+
+
+def make_state() -> SessionState:
+    return SessionState.from_json(
+        make_session(runs=[make_run("r0", status="completed", items=2), make_run("r1", items=1)])
+    )
+
+
+class TestSessionState:
+    def test_indexes_runs_and_items(self):
+        state = make_state()
+
+        assert [run.id for run in state.runs] == ["r0", "r1"]
+        assert state.last_run is not None and state.last_run.id == "r1"
+        assert state.get_item("r0-i1") is not None
+        assert state.get_run("missing") is None
+
+    def test_run_updated_appends_and_patches(self):
+        state = make_state()
+        before = state.session
+
+        state.apply(
+            "run.updated",
+            {
+                "id": "r1",
+                "status": "completed",
+                "finishedAt": "2025-12-11 08:26:00+01:00",
+                "updatedAt": "2025-12-11 08:26:00+00",
+                "sessionItems": [make_item("r1-i1", "r1")],
+            },
+        )
+
+        after = state.session
+        assert after is not before
+        assert after.runs[1].status == "completed"
+        assert after.runs[1].finished_at is not None
+        assert [item.id for item in after.runs[1].session_items] == ["r1-i0", "r1-i1"]
+        # Earlier views are left untouched, unchanged runs are shared.
+        assert before.runs[1].status == "in_progress"
+        assert len(before.runs[1].session_items) == 1
+        assert after.runs[0] is before.runs[0]
+
+    def test_duplicate_items_are_ignored(self):
+        state = make_state()
+        delta = {"id": "r1", "sessionItems": [make_item("r1-i1", "r1")]}
+
+        state.apply_run_updated(delta)
+        state.apply_run_updated(delta)
+
+        assert len(state.session.runs[1].session_items) == 2
+
+    def test_unknown_run_is_added(self):
+        state = make_state()
+
+        state.apply_run_updated(make_run("r2", items=3))
+
+        assert [run.id for run in state.session.runs] == ["r0", "r1", "r2"]
+        assert state.get_item("r2-i2") is not None
+
+    def test_matches_full_validation(self):
+        state = make_state()
+        state.apply_run_updated({"id": "r1", "status": "failed", "failReason": {"message": "boom"}})
+
+        expected = make_session(runs=[make_run("r0", status="completed", items=2), make_run("r1", status="failed")])
+        expected["runs"][1]["failReason"] = {"message": "boom"}
+        assert state.session == Session.model_validate(expected)
+
+    def test_snapshot_resets(self):
+        state = make_state()
+
+        state.apply("session.snapshot", make_session(runs=[]))
+
+        assert state.session.runs == []
+        assert state.get_item("r0-i0") is None
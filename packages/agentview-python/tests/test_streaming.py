@@ -0,0 +1,154 @@
+"""Session streaming tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+import json
+from typing import Any, Iterator
+
+import httpx
+import pytest
+
+from agentview import AgentView
+from agentview._streaming import SSEDecoder
+
+from .payloads import make_item, make_run, make_session
+
+
+def sse(event: str, data: Any) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+RUN_UPDATED = {
+    "id": "r1",
+    "status": "completed",
+    "finishedAt": "2025-12-11 08:26:00+00",
+    "sessionItems": [make_item("r1-i1")],
+}
+
+
+def make_client(handler: Any, **kwargs: Any) -> AgentView:
+    return AgentView(
+        api_base_url="http://test",
+        api_key="key",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+class TestSSEDecoder:
+    def test_decodes_events(self):
+        decoder = SSEDecoder()
+        lines = [": comment", "event: run.updated", "data: {\"a\":", "data: 1}", "id: 7", "retry: 500", ""]
+        events = [e for e in map(decoder.decode, lines) if e is not None]
+
+        assert len(events) == 1
+        assert events[0].event == "run.updated"
+        assert events[0].data == '{"a":\n1}'
+        assert events[0].id == "7"
+        assert events[0].retry == 500
+
+    def test_ignores_blank_lines_between_events(self):
+        decoder = SSEDecoder()
+        assert decoder.decode("") is None
+
+
+class TestStreamSession:
+    def test_applies_run_updated(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/sessions/s1/stream"
+            body = sse("session.snapshot", make_session()) + sse("run.updated", RUN_UPDATED)
+            return httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+
+        stream = make_client(handler).stream_session("s1")
+        snapshot = next(stream)
+        assert snapshot.type == "session.snapshot"
+        assert snapshot.session.runs[0].status == "in_progress"
+
+        updated = next(stream)
+        assert updated.type == "run.updated"
+        run = updated.session.runs[0]
+        assert run.status == "completed"
+        assert run.finished_at is not None
+        assert [item.id for item in run.session_items] == ["r1-i0", "r1-i1"]
+        assert list(stream) == []
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_uses_client_parsing_settings(self, trusted: bool):
+        class CountingCodec:
+            name = "counting"
+            calls = 0
+
+            def dumps(self, obj: Any) -> bytes:
+                return json.dumps(obj).encode()
+
+            def loads(self, data: bytes) -> Any:
+                self.calls += 1
+                return json.loads(data)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = sse("session.snapshot", make_session()) + sse("run.updated", RUN_UPDATED)
+            return httpx.Response(200, content=body, headers={"content-type": "text/event-stream"})
+
+        codec = CountingCodec()
+        client = make_client(handler, json_codec=codec, timestamps="epoch", trusted_responses=trusted)
+        events = list(client.stream_session("s1"))
+
+        run = events[-1].session.runs[0]
+        assert codec.calls == 2
+        assert isinstance(events[0].session.created_at, float)
+        assert isinstance(run.finished_at, float) and isinstance(run.session_items[1].created_at, float)
+
+    def test_not_in_progress(self):
+        client = make_client(lambda request: httpx.Response(204))
+
+        assert list(client.stream_session("s1")) == []
+
+    def test_wait_param(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(204)
+
+        list(make_client(handler).stream_session("s1", wait=True))
+
+        assert seen[0].url.params["wait"] == "true"
+
+    def test_reconnects_after_dropped_connection(self):
+        calls: list[str] = []
+
+        def dropped() -> Iterator[bytes]:
+            yield sse("session.snapshot", make_session())
+            raise httpx.ReadError("connection reset")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(200, content=dropped())
+            if request.url.path.endswith("/stream"):
+                return httpx.Response(204)
+            return httpx.Response(200, json=make_session(runs=[make_run(status="completed", items=2)]))
+
+        events = list(make_client(handler).stream_session("s1", reconnect_delay=0))
+
+        assert calls == ["/api/sessions/s1/stream", "/api/sessions/s1/stream", "/api/sessions/s1"]
+        assert events[-1].session.runs[0].status == "completed"
+
+    def test_gives_up_after_max_reconnects(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        with pytest.raises(httpx.ConnectError):
+            list(make_client(handler).stream_session("s1", max_reconnects=2, reconnect_delay=0))
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = sse("session.snapshot", make_session()) + sse("run.updated", RUN_UPDATED)
+            return httpx.Response(200, content=body)
+
+        events = [event async for event in make_client(handler).astream_session("s1")]
+
+        assert events[-1].session.runs[0].status == "completed"
+        assert len(events[-1].session.runs[0].session_items) == 2
@@ -0,0 +1,336 @@
+"""LocalAPI tests for AgentView Python SDK.
+
+These tests run against the in-process LocalAPI transport and need no server.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from agentview import (
+    AgentView,
+    AgentViewError,
+    RequestCompression,
+    ResponseCache,
+    RetryPolicy,
+    SessionCreate,
+    SessionsGetQueryParams,
+)
+from agentview.testing import LOCAL_API_URL, LocalAPI
+
+INPUT = {"role": "user", "content": "hi"}
+OUTPUT = {"role": "assistant", "content": "hello"}
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_client(api: LocalAPI, **kwargs: Any) -> AgentView:
+    kwargs.setdefault("retry", None)
+    return api.client(**kwargs)
+
+
+class TestSessionsAndRuns:
+    def test_run_lifecycle(self):
+        client = make_client(LocalAPI())
+        session = client.create_session(agent="support")
+        run = client.create_run(session_id=session.id, items=[INPUT], version="v1.2", metadata={"a": 1})
+
+        assert session.handle == "1s" and session.runs == []
+        assert run.version.version == "1.2.0" and run.status == "in_progress"
+        client.update_run(run.id, items=[OUTPUT], metadata={"b": 2}, state={"step": 1})
+        finished = client.update_run(run.id, status="completed")
+
+        assert finished.finished_at is not None
+        assert [item.content for item in finished.session_items] == [INPUT, OUTPUT]
+        fetched = client.get_session(session.handle)
+        assert fetched.id == session.id
+        assert fetched.runs[0].metadata == {"a": 1, "b": 2}
+        assert fetched.state == {"step": 1}
+
+    @pytest.mark.parametrize(
+        "version, message",
+        [
+            ("2.0.0", "different major version"),
+            ("1.0.0", "older version"),
+            ("one", "Invalid version number format"),
+        ],
+    )
+    def test_version_rules(self, version: str, message: str):
+        client = make_client(LocalAPI())
+        session = client.create_session(agent="a")
+        client.create_run(session_id=session.id, items=[INPUT, OUTPUT], version="1.1.0", status="completed")
+
+        with pytest.raises(AgentViewError, match=message) as error:
+            client.create_run(session_id=session.id, items=[INPUT], version=version)
+        assert error.value.status_code == 422
+
+    def test_run_rules(self):
+        client = make_client(LocalAPI())
+        session = client.create_session(agent="a")
+        run = client.create_run(session_id=session.id, items=[INPUT], version="1")
+
+        with pytest.raises(AgentViewError, match="already a run in progress"):
+            client.create_run(session_id=session.id, items=[INPUT], version="1")
+        with pytest.raises(AgentViewError, match="at least 2 items"):
+            client.update_run(run.id, status="completed")
+        client.update_run(run.id, status="failed", fail_reason={"message": "boom"})
+        with pytest.raises(AgentViewError, match="finished run"):
+            client.update_run(run.id, items=[OUTPUT])
+
+    def test_archives_failed_runs(self):
+        client = make_client(LocalAPI())
+        session = client.create_session(agent="a")
+        first = client.create_run(session_id=session.id, items=[INPUT], version="1", status="failed")
+        second = client.create_run(session_id=session.id, items=[INPUT, OUTPUT], version="1", status="completed")
+
+        assert [run.id for run in client.get_session(session.id).runs] == [second.id]
+        assert first.id not in client.get_session(session.id).model_dump_json()
+
+    def test_lists_pages_newest_first(self):
+        client = make_client(LocalAPI())
+        ids = [client.create_session(agent="a" if n % 2 else "b").id for n in range(5)]
+
+        page = client.get_sessions(SessionsGetQueryParams(limit=2))
+        assert [s.id for s in page.sessions] == ids[::-1][:2]
+        assert page.pagination.total_pages == 3 and page.pagination.has_next_page
+        assert [s.id for s in client.iter_sessions(SessionsGetQueryParams(agent="a"))] == [ids[3], ids[1]]
+
+    def test_public_client_sees_own_sessions_only(self):
+        api = LocalAPI()
+        client = make_client(api)
+        user = client.create_user()
+        own = client.create_session(agent="a", user_id=user.id)
+        other = client.create_session(agent="a")
+        public = api.public_client(user.token, retry=None)
+
+        assert public.get_me().id == user.id
+        assert [s.id for s in public.get_sessions().sessions] == [own.id]
+        with pytest.raises(AgentViewError) as error:
+            public.get_session(other.id)
+        assert error.value.status_code == 401
+
+    def test_requires_the_configured_api_key(self):
+        api = LocalAPI(api_key="secret")
+
+        with pytest.raises(AgentViewError) as error:
+            make_client(api, api_key="wrong").create_user()
+        assert error.value.status_code == 401
+        assert make_client(api).create_user().space == "playground"
+
+
+class TestExpiry:
+    def test_idle_runs_fail_unless_kept_alive(self):
+        clock = Clock()
+        api = LocalAPI(idle_timeout=60, clock=clock)
+        client = make_client(api)
+        session = client.create_session(agent="a")
+        run = client.create_run(session_id=session.id, items=[INPUT], version="1")
+
+        clock.now += 45
+        assert client.keep_alive_run(run.id)["expiresAt"] is not None
+        clock.now += 45
+        assert api.expire_runs() == 0
+        clock.now += 30
+
+        expired = client.get_session(session.id).runs[0]
+        assert expired.status == "failed" and expired.fail_reason == {"message": "Timeout"}
+        assert client.keep_alive_run(run.id) == {"expiresAt": None}
+
+
+class TestStreaming:
+    def test_stream(self):
+        client = make_client(LocalAPI())
+        session = client.create_session(agent="a")
+        run = client.create_run(session_id=session.id, items=[INPUT], version="1")
+        events: list[Any] = []
+        thread = threading.Thread(target=lambda: events.extend(client.stream_session(session.id)))
+        thread.start()
+
+        while not events:
+            time.sleep(0.001)
+        client.update_run(run.id, items=[OUTPUT])
+        client.update_run(run.id, status="completed")
+        thread.join(5)
+
+        assert events[0].type == "session.snapshot"
+        assert {event.type for event in events[1:]} == {"run.updated"}
+        assert events[-1].session.runs[0].status == "completed"
+        assert [item.content for item in events[-1].session.runs[0].session_items] == [INPUT, OUTPUT]
+
+    def test_no_stream_without_run_in_progress(self):
+        client = make_client(LocalAPI())
+        session = client.create_session(agent="a")
+
+        assert list(client.stream_session(session.id)) == []
+
+    async def test_async_stream_waits_for_run(self):
+        client = make_client(LocalAPI())
+        session = await client.acreate_session(agent="a")
+
+        async def consume() -> list[str]:
+            return [event.type async for event in client.astream_session(session.id, wait=True)]
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.02)
+        run = await client.acreate_run(session_id=session.id, items=[INPUT], version="1")
+        await asyncio.sleep(0.02)
+        await client.aupdate_run(run.id, items=[OUTPUT], status="completed")
+
+        assert await asyncio.wait_for(task, 5) == ["session.snapshot", "run.updated"]
+
+    def test_stream_ends_when_run_expires(self):
+        clock = Clock()
+        api = LocalAPI(idle_timeout=1, clock=clock, stream_poll_interval=0.001)
+        client = make_client(api)
+        session = client.create_session(agent="a")
+        client.create_run(session_id=session.id, items=[INPUT], version="1")
+
+        events = client.stream_session(session.id)
+        assert next(events).type == "session.snapshot"
+        clock.now += 2
+        assert next(events).data["failReason"] == {"message": "Timeout"}
+        assert list(events) == []
+
+
+class TestScoresAndComments:
+    def test_scores(self):
+        api = LocalAPI()
+        client = make_client(api)
+        session = client.create_session(agent="a")
+        item = client.create_run(session_id=session.id, items=[INPUT], version="1").session_items[0]
+
+        api.add_scores(session.id, item.id, {"accuracy": 0.5, "tone": "ok"})
+        api.add_scores(session.id, item.id, {"accuracy": 0.9, "tone": None})
+
+        assert [(s.name, s.value) for s in client.get_session_scores(session.id)] == [("accuracy", 0.9)]
+        comments = client.get_session_comments(session.id)
+        assert [c.score is not None for c in comments] == [True, False]
+        assert comments[1].deleted_at is not None
+
+    def test_comments(self):
+        api = LocalAPI()
+        client = make_client(api)
+        session = client.create_session(agent="a")
+        item = client.create_run(session_id=session.id, items=[INPUT], version="1").session_items[0]
+
+        comment = api.add_comment(session.id, item.id, "first")
+
+        assert [c.id for c in client.get_session_comments(session.id)] == [comment["id"]]
+        with pytest.raises(KeyError, match="Session item not found"):
+            api.add_comment(session.id, "missing", "x")
+
+    @pytest.mark.parametrize(
+        "method, path, body",
+        [
+            ("PATCH", "/items/{item}/scores", [{"name": "accuracy", "value": 1}]),
+            ("POST", "/items/{item}/comments", {"content": "hi"}),
+            ("PUT", "/items/{item}/comments/c1", {"content": "hi"}),
+            ("DELETE", "/items/{item}/comments/c1", None),
+        ],
+    )
+    def test_writes_need_a_member(self, method: str, path: str, body: Any):
+        client = make_client(LocalAPI())
+        session = client.create_session(agent="a")
+        item = client.create_run(session_id=session.id, items=[INPUT], version="1").session_items[0]
+
+        with pytest.raises(AgentViewError) as error:
+            client._http.request(method, f"/api/sessions/{session.id}" + path.format(item=item.id), json=body)
+        assert error.value.status_code == 401
+
+
+class TestHTTPBehaviour:
+    def test_idempotency_key_replays(self):
+        api = LocalAPI()
+        client = make_client(api)
+
+        first = client.create_session(SessionCreate(agent="a"), idempotency_key="k1")
+        second = client.create_session(SessionCreate(agent="a"), idempotency_key="k1")
+
+        assert first.id == second.id
+        assert client.get_sessions().pagination.total_count == 1
+
+    def test_conditional_get(self):
+        api = LocalAPI()
+        cache = ResponseCache(session_ttl=0.001)
+        client = make_client(api, cache=cache)
+        session = client.create_session(agent="a")
+        client.create_run(session_id=session.id, items=[INPUT, OUTPUT], version="1", status="completed")
+
+        first = client.get_session(session.id)
+        time.sleep(0.002)
+        assert client.get_session(session.id) == first
+        assert api.stats.routes["GET /api/sessions/{session_id}"] == 2
+        assert cache.stats.revalidations == 1
+
+    def test_environment_config(self):
+        api = LocalAPI()
+        client = make_client(api)
+        assert client._get_config() is None
+
+        client._update_config(config={"metrics": ["accuracy"]})
+        environment = client._get_config()
+        assert environment is not None
+        assert environment.config == {"metrics": ["accuracy"]}
+        assert api.stats.routes["PATCH /api/environment"] == 1
+        assert api.stats.routes["GET /api/environment"] == 2
+
+    def test_accepts_compressed_bodies(self):
+        client = make_client(LocalAPI(), compression=RequestCompression(threshold=0))
+        session = client.create_session(agent="a")
+
+        run = client.create_run(session_id=session.id, items=[INPUT, OUTPUT], version="1", status="completed")
+
+        assert [item.content for item in run.session_items] == [INPUT, OUTPUT]
+
+    def test_rejects_unknown_content_encodings(self):
+        api = LocalAPI()
+        response = httpx.Client(transport=api).post(
+            f"{LOCAL_API_URL}/api/users", content=b"{}", headers={"Content-Encoding": "br"}
+        )
+
+        assert response.status_code == 415
+
+    def test_injected_errors_are_deterministic(self):
+        def failures(seed: int) -> list[int]:
+            client = make_client(LocalAPI(error_rate=0.3, error_statuses=(502, 503), seed=seed))
+            statuses = []
+            for _ in range(20):
+                try:
+                    client.create_user()
+                except AgentViewError as error:
+                    statuses.append(error.status_code)
+            return statuses
+
+        assert failures(7) == failures(7)
+        assert set(failures(7)) <= {502, 503} and 0 < len(failures(7)) < 20
+
+    def test_retries_recover_from_injected_errors(self):
+        api = LocalAPI(error_rate=0.5, seed=3)
+        client = make_client(api, retry=RetryPolicy(max_retries=10, backoff_base=0, jitter=False))
+
+        sessions = [client.create_session(agent="a") for _ in range(10)]
+
+        assert api.stats.injected_errors > 0
+        assert client.get_sessions().pagination.total_count == len({s.id for s in sessions}) == 10
+
+    async def test_injected_latency(self):
+        api = LocalAPI(latency=0.01, jitter=0.01, seed=1)
+        client = make_client(api)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client.acreate_user() for _ in range(20)))
+
+        assert api.stats.requests == 20
+        assert 0.2 <= api.stats.injected_latency <= 0.4
+        # Delays overlap across concurrent requests
+        assert time.perf_counter() - started < api.stats.injected_latency
@@ -0,0 +1,119 @@
+"""Timestamp parsing tests for AgentView Python SDK.
+
+These tests run against an in-process httpx.MockTransport and need no server.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from agentview import AgentView, PublicAgentView
+from agentview import _timestamps
+from agentview._timestamps import parse_timestamp, timestamp_to_epoch
+from agentview.models import Session
+
+from .payloads import make_run, make_session
+
+UTC = timezone.utc
+IST = timezone(timedelta(hours=5, minutes=30))
+
+CASES = [
+    ("2025-12-11 08:25:10.144334+00", datetime(2025, 12, 11, 8, 25, 10, 144334, tzinfo=UTC)),
+    ("2025-12-11 08:25:10+00", datetime(2025, 12, 11, 8, 25, 10, tzinfo=UTC)),
+    ("2025-12-11 08:25:10.1+00", datetime(2025, 12, 11, 8, 25, 10, 100000, tzinfo=UTC)),
+    ("2025-12-11 08:25:10.14+05:30", datetime(2025, 12, 11, 8, 25, 10, 140000, tzinfo=IST)),
+    ("2025-12-11 08:25:10.1443+0530", datetime(2025, 12, 11, 8, 25, 10, 144300, tzinfo=IST)),
+    ("2025-12-11 08:25:10-08", datetime(2025, 12, 11, 8, 25, 10, tzinfo=timezone(timedelta(hours=-8)))),
+    (
+        "2025-12-11 08:25:10+05:30:15",
+        datetime(2025, 12, 11, 8, 25, 10, tzinfo=timezone(timedelta(hours=5, minutes=30, seconds=15))),
+    ),
+    ("2025-12-11T08:25:10.144Z", datetime(2025, 12, 11, 8, 25, 10, 144000, tzinfo=UTC)),
+    ("2025-12-11 08:25:10.1234567+00", datetime(2025, 12, 11, 8, 25, 10, 123456, tzinfo=UTC)),
+    ("2025-12-11 08:25:10", datetime(2025, 12, 11, 8, 25, 10)),
+]
+
+
+class TestParseTimestamp:
+    @pytest.mark.parametrize("value, expected", CASES)
+    def test_offset_forms(self, value: str, expected: datetime):
+        assert parse_timestamp(value) == expected
+        assert parse_timestamp(value).utcoffset() == expected.utcoffset()
+
+    @pytest.mark.parametrize("value, expected", CASES)
+    def test_fallback_parser(self, value: str, expected: datetime):
+        assert _timestamps._parse_slow(value) == expected
+
+    @pytest.mark.parametrize("value", ["", "yesterday", "2025-13-11 08:25:10+00"])
+    def test_invalid(self, value: str):
+        with pytest.raises(ValueError):
+            parse_timestamp(value)
+
+    def test_repeated_values_are_memoized(self):
+        value = "2024-01-02 03:04:05.678+00"
+
+        assert parse_timestamp(value) is parse_timestamp(value)
+
+    def test_cache_is_bounded(self):
+        parse_timestamp.cache_clear()
+
+        for second in range(30):
+            parse_timestamp(f"2024-01-02 03:04:{second:02d}+00")
+
+        info = parse_timestamp.cache_info()
+        assert info.maxsize == _timestamps.TIMESTAMP_CACHE_SIZE
+        assert info.currsize == 30
+
+    def test_epoch(self):
+        assert timestamp_to_epoch("1970-01-01 01:00:00+01") == 0.0
+        assert timestamp_to_epoch("1970-01-01 00:00:01.5") == 1.5
+
+
+def session_transport() -> httpx.MockTransport:
+    data = make_session("s1", runs=[make_run("r1", session_id="s1", items=3)])
+    data["createdAt"] = "2025-12-11 08:25:10.5+00"
+    return httpx.MockTransport(lambda request: httpx.Response(200, json=data))
+
+
+class TestTimestampModes:
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_raw_strings(self, trusted: bool):
+        client = AgentView(
+            api_base_url="http://test",
+            api_key="key",
+            transport=session_transport(),
+            trusted_responses=trusted,
+            timestamps="str",
+        )
+
+        session = client.get_session("s1")
+
+        assert session.created_at == "2025-12-11 08:25:10.5+00"
+        assert isinstance(session.runs[0].session_items[0].created_at, str)
+        assert session.model_dump_json()
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_epoch_seconds(self, trusted: bool):
+        client = PublicAgentView(
+            api_base_url="http://test",
+            user_token="token",
+            transport=session_transport(),
+            trusted_responses=trusted,
+            timestamps="epoch",
+        )
+
+        session = client.get_session("s1")
+
+        assert session.created_at == datetime(2025, 12, 11, 8, 25, 10, 500000, tzinfo=UTC).timestamp()
+        assert isinstance(session.runs[0].created_at, float)
+
+    def test_default_is_unaffected(self):
+        session = AgentView(api_base_url="http://test", api_key="key", transport=session_transport()).get_session("s1")
+
+        assert session.created_at == datetime(2025, 12, 11, 8, 25, 10, 500000, tzinfo=UTC)
+        assert Session.model_validate(session.model_dump()) == session
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            AgentView(api_base_url="http://test", api_key="key", timestamps="iso")  # type: ignore[arg-type]
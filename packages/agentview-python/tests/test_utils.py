@@ -0,0 +1,73 @@
+"""with_model decorator tests for AgentView Python SDK."""
+
+import inspect
+import json
+
+import pydantic
+import pytest
+
+from agentview._json import StdlibCodec, encode_body
+from agentview._utils import with_model
+from agentview.models import RunUpdate, Status, UserCreate
+
+CODEC = StdlibCodec()
+
+
+class Methods:
+    @with_model(RunUpdate)
+    def update_run(self, id: str, options: RunUpdate | None = None, *, flag: bool = False):
+        return id, options, flag
+
+    @with_model(UserCreate)
+    def create_user(self, options: UserCreate | None = None):
+        return options
+
+
+class TestWithModel:
+    def test_kwargs_build_model(self):
+        id, options, flag = Methods().update_run("r1", status="completed", items=[{"a": 1}], flag=True)
+
+        assert id == "r1" and flag
+        assert options == RunUpdate(status=Status.COMPLETED, items=[{"a": 1}])
+
+    def test_none_fields_are_dropped(self):
+        _, options, _ = Methods().update_run("r1", status="completed", metadata=None)
+
+        assert options.model_fields_set == {"status"}
+
+    def test_no_fields_passes_none(self):
+        assert Methods().update_run("r1") == ("r1", None, False)
+        assert Methods().create_user() is None
+
+    def test_model_passed_directly(self):
+        update = RunUpdate(status=Status.FAILED)
+
+        assert Methods().update_run("r1", options=update)[1] is update
+        assert Methods().update_run("r1", update)[1] is update
+
+    def test_validation_errors(self):
+        with pytest.raises(pydantic.ValidationError):
+            Methods().update_run("r1", items="not a list")
+
+    def test_signature_lists_fields(self):
+        params = inspect.signature(Methods.update_run).parameters
+
+        assert "options" not in params
+        assert params["status"].kind is inspect.Parameter.KEYWORD_ONLY
+
+
+def dumped_body(id: str, options: RunUpdate | None = None) -> bytes:
+    """The previous path: build a model, dump it to a dict, then encode the dict."""
+    body = options.model_dump(by_alias=True, exclude_none=True) if options else {}
+    return json.dumps(body).encode()
+
+
+class TestKwargsToBody:
+    # benchmarks/suite.py compares the speed of the two paths (serialize.with_model.*)
+    def test_matches_the_dumped_model(self):
+        decorated = with_model(RunUpdate)(lambda id, options=None: encode_body(CODEC, options))
+
+        kwargs = dict(status="completed", items=[{"role": "user", "content": "hi"}], metadata={"k": "v"}, state=None)
+        expected = dumped_body("r1", RunUpdate(**{k: v for k, v in kwargs.items() if v is not None}))
+
+        assert json.loads(decorated("r1", **kwargs)) == json.loads(expected)
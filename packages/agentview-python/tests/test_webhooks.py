@@ -0,0 +1,181 @@
+"""Webhook receiver tests for AgentView Python SDK.
+
+These tests drive the receiver in-process through httpx.ASGITransport and need no server.
+"""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from agentview import WebhookEvent, WebhookReceiver
+
+
+def delivery(job_id: str, event: str = "session.on_first_run_created", session_id: str = "s1") -> dict:
+    return {"event": event, "payload": {"session_id": session_id}, "job_id": job_id}
+
+
+def asgi_client(receiver: WebhookReceiver) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=receiver), base_url="http://test")
+
+
+class TestAsgiReceiver:
+    async def test_acknowledges_before_processing(self):
+        receiver = WebhookReceiver()
+        release = asyncio.Event()
+        handled: list[str | None] = []
+
+        @receiver.on("session.on_first_run_created")
+        async def handler(event: WebhookEvent) -> None:
+            await release.wait()
+            handled.append(event.session_id)
+
+        async with asgi_client(receiver) as client:
+            response = await client.post("/", json=delivery("j1"))
+
+        assert response.status_code == 202
+        assert response.json() == {"status": "accepted"}
+        assert handled == []
+
+        release.set()
+        await receiver.drain()
+        assert handled == ["s1"]
+        assert receiver.stats.processed == 1
+        await receiver.aclose()
+
+    async def test_deduplicates_retries_by_job_id(self):
+        receiver = WebhookReceiver()
+        calls: list[str] = []
+        receiver.add_handler("*", lambda event: calls.append(event.job_id))
+
+        async with asgi_client(receiver) as client:
+            first = await client.post("/", json=delivery("j1"))
+            second = await client.post("/", json=delivery("j1"))
+            await client.post("/", json=delivery("j2"))
+        await receiver.drain()
+
+        assert (first.status_code, second.status_code) == (202, 200)
+        assert second.json() == {"status": "duplicate"}
+        assert sorted(calls) == ["j1", "j2"]
+        assert receiver.stats.duplicates == 1
+        await receiver.aclose()
+
+    async def test_bounded_concurrency(self):
+        receiver = WebhookReceiver(max_concurrency=3)
+        running = 0
+        peak = 0
+
+        @receiver.on()
+        async def handler(event: WebhookEvent) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async with asgi_client(receiver) as client:
+            await asyncio.gather(*(client.post("/", json=delivery(f"j{n}")) for n in range(20)))
+        await receiver.drain()
+
+        assert peak == 3
+        assert receiver.stats.processed == 20
+        await receiver.aclose()
+
+    async def test_full_queue_refuses_until_drained(self):
+        receiver = WebhookReceiver(max_concurrency=1, max_pending=1)
+        release = asyncio.Event()
+
+        @receiver.on()
+        async def handler(event: WebhookEvent) -> None:
+            await release.wait()
+
+        async with asgi_client(receiver) as client:
+            assert (await client.post("/", json=delivery("j0"))).status_code == 202
+            await asyncio.sleep(0.01)  # The only worker picks up j0 and blocks
+            assert (await client.post("/", json=delivery("j1"))).status_code == 202
+            refused = await client.post("/", json=delivery("j2"))
+            release.set()
+            await receiver.drain()
+            # The refused job was forgotten, so the worker's retry is accepted
+            retried = await client.post("/", json=delivery("j2"))
+
+        assert refused.status_code == 503
+        assert retried.status_code == 202
+        await receiver.aclose()
+
+    async def test_rejects_malformed_and_ignores_unhandled(self):
+        receiver = WebhookReceiver()
+        receiver.add_handler("known", lambda event: None)
+
+        async with asgi_client(receiver) as client:
+            malformed = await client.post("/", content=b"not json")
+            missing_job = await client.post("/", json={"event": "known"})
+            unknown = await client.post("/", json=delivery("j1", event="other"))
+            wrong_method = await client.get("/")
+
+        assert malformed.status_code == missing_job.status_code == 400
+        assert unknown.status_code == 200 and unknown.json() == {"status": "ignored"}
+        assert wrong_method.status_code == 405
+        await receiver.aclose()
+
+    async def test_handler_errors_are_reported(self):
+        errors: list[tuple[str, str]] = []
+        receiver = WebhookReceiver(on_error=lambda event, error: errors.append((event.job_id, str(error))))
+
+        @receiver.on()
+        def handler(event: WebhookEvent) -> None:
+            raise RuntimeError("boom")
+
+        async with asgi_client(receiver) as client:
+            response = await client.post("/", json=delivery("j1"))
+        await receiver.drain()
+
+        assert response.status_code == 202
+        assert errors == [("j1", "boom")]
+        assert receiver.stats.failed == 1
+        await receiver.aclose()
+
+
+class TestSyncReceiver:
+    def test_processes_on_thread_pool(self):
+        receiver = WebhookReceiver(max_concurrency=2)
+        threads: set[str] = set()
+        done = threading.Event()
+        calls: list[str] = []
+
+        @receiver.on()
+        def handler(event: WebhookEvent) -> None:
+            threads.add(threading.current_thread().name)
+            calls.append(event.job_id)
+            if len(calls) == 5:
+                done.set()
+
+        results = [receiver.handle(json.dumps(delivery(f"j{n}")).encode()) for n in range(5)]
+        duplicate = receiver.handle(json.dumps(delivery("j0")).encode())
+        receiver.close()
+
+        assert [status for status, _ in results] == [202] * 5
+        assert duplicate == (200, {"status": "duplicate"})
+        assert done.is_set() and sorted(calls) == [f"j{n}" for n in range(5)]
+        assert all(name.startswith("agentview-webhook") for name in threads)
+
+    def test_runs_async_handlers(self):
+        receiver = WebhookReceiver()
+        calls: list[str] = []
+
+        @receiver.on()
+        async def handler(event: WebhookEvent) -> None:
+            await asyncio.sleep(0)
+            calls.append(event.job_id)
+
+        receiver.handle(json.dumps(delivery("j1")).encode())
+        receiver.close()
+
+        assert calls == ["j1"]
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        WebhookReceiver(max_concurrency=0)